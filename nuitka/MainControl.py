@@ -24,27 +24,37 @@ a distribution folder.
 
 """
 
+import atexit
 import os
 import shutil
 import subprocess
 import sys
 from logging import info, warning
 
-from nuitka.importing import Importing, Recursion
+from nuitka.importing import Importing, ModuleSearchCache, Recursion
 from nuitka.Options import getPythonFlags
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import isUninstalledPython, python_version
 from nuitka.tree import SyntaxErrors
 from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
+from nuitka.utils.AppDirs import getCacheSubDir
+from nuitka.utils.Timing import withTimedPhase, writeTimingsReport
 
 from . import ModuleRegistry, Options, Tracing, TreeXML
-from .build import SconsInterface
+from .build import SconsInterface, UnityBuild
 from .codegen import CodeGeneration, ConstantCodes
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
+from .freezer.DistFolder import (
+    copyDistFile,
+    copyDistFiles,
+    loadDistFileRecords,
+    removeStaleDistFiles,
+    storeDistFileRecords
+)
 from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
 from .optimizations import Optimization
-from .tree import Building
+from .tree import Building, ModuleTreeCache
 
 
 def createNodeTree(filename):
@@ -73,10 +83,16 @@ def createNodeTree(filename):
     if not Options.shallOnlyExecCppCall():
         cleanSourceDirectory(source_dir)
 
-    # Prepare the ".dist" directory, throwing away what was there before.
+    # Prepare the ".dist" directory, throwing away what was there before,
+    # unless it's to be updated.
     if Options.isStandaloneMode():
         standalone_dir = getStandaloneDirectoryPath(main_module)
-        shutil.rmtree(standalone_dir, ignore_errors = True)
+
+        if not Options.isIncrementalDist():
+            shutil.rmtree(standalone_dir, ignore_errors = True)
+        else:
+            loadDistFileRecords(standalone_dir)
+
         Utils.makePath(standalone_dir)
 
     Utils.deleteFile(
@@ -100,6 +116,12 @@ def createNodeTree(filename):
     # Then optimize the tree and potentially recursed modules.
     Optimization.optimize()
 
+    if Options.shallCacheModuleTrees():
+        ModuleTreeCache.storeModuleTrees(ModuleRegistry.getDoneModules())
+
+    if Options.shallCacheModuleSearches():
+        ModuleSearchCache.storeSearchResults()
+
     if Options.isExperimental():
         for module in ModuleRegistry.getRootModules():
             if module.isMainModule():
@@ -176,16 +198,49 @@ def getResultFullpath(main_module):
 
 
 def cleanSourceDirectory(source_dir):
+    # Generated source files and their object files are kept, so unchanged
+    # ones need not be compiled again, see "removeStaleSourceFiles" for the
+    # ones no longer used.
     if Utils.isDir(source_dir):
         for path, _filename in Utils.listDir(source_dir):
-            if Utils.getExtension(path) in (".c", ".h", ".o", ".os", ".obj",
-                                            ".bin", ".res", ".rc", ".S", ".cpp",
-                                            ".manifest"):
+            if Utils.getExtension(path) in (".res", ".rc", ".manifest"):
                 Utils.deleteFile(path, True)
     else:
         Utils.makePath(source_dir)
 
 
+def removeStaleSourceFiles(source_dir):
+    """ Remove generated files of previous compilations not written again.
+
+        These are e.g. from modules no longer included, and must not be
+        compiled and linked, as Scons picks up all generated files.
+    """
+    for path, filename in Utils.listDir(source_dir):
+        if not filename.startswith(("module.", "__")):
+            continue
+
+        extension = Utils.getExtension(path)
+
+        # The C++ mode renames files, consider their original name.
+        if extension == ".cpp":
+            written_path = path[:-2]
+        elif extension in (".c", ".h", ".inc", ".bin"):
+            written_path = path
+        else:
+            continue
+
+        if written_path in written_files:
+            continue
+
+        Utils.deleteFile(path, True)
+
+        for object_extension in (".o", ".os", ".obj"):
+            Utils.deleteFile(
+                path       = path[:-len(extension)] + object_extension,
+                must_exist = False
+            )
+
+
 def pickSourceFilenames(source_dir, modules):
     collision_filenames = set()
     seen_filenames = set()
@@ -248,6 +303,94 @@ def pickSourceFilenames(source_dir, modules):
 standalone_entry_points = []
 
 
+def writeModulePartCodes(source_dir, cpp_filename, header_name, part_codes):
+    """ Write the header and parts of a module split into parts.
+
+    """
+    header_code, part_codes = part_codes
+
+    writeSourceCode(
+        filename    = Utils.joinpath(source_dir, header_name),
+        source_code = header_code
+    )
+
+    # The "-" cannot occur in module names, so these never collide.
+    for count, part_code in enumerate(part_codes):
+        writeSourceCode(
+            filename    = "%s-part%d.c" % (cpp_filename[:-2], count+2),
+            source_code = part_code
+        )
+
+    if Options.isShowProgress():
+        info(
+            "Split module code of '%s' into %d files." % (
+                Utils.basename(cpp_filename),
+                len(part_codes) + 1
+            )
+        )
+
+
+def writeUnitSourceCodes(source_dir, module_filenames, unit_source_codes):
+    """ Write the code of small modules, to be compiled together in units.
+
+        See "UnityBuild" for details. Modules that end up alone in a unit, are
+        written as usual.
+    """
+    module_sizes = [
+        (module, len(unit_source_codes[module]))
+        for module in
+        sorted(unit_source_codes, key = lambda x : module_filenames[x])
+    ]
+
+    units = UnityBuild.groupUnitModules(
+        module_sizes = module_sizes,
+        size_limit   = Options.getUnityBuildSizeLimit(),
+        job_limit    = Options.getJobLimit()
+    )
+
+    for count, unit_modules in enumerate(units):
+        if len(unit_modules) == 1:
+            module = unit_modules[0]
+
+            writeSourceCode(
+                filename    = module_filenames[module],
+                source_code = unit_source_codes[module]
+            )
+
+            continue
+
+        unit_includes = []
+
+        for module in unit_modules:
+            include_filename = module_filenames[module][:-2] + ".inc"
+            source_code = unit_source_codes[module]
+
+            writeSourceCode(
+                filename    = include_filename,
+                source_code = source_code
+            )
+
+            unit_includes.append(
+                (
+                    Utils.basename(include_filename),
+                    UnityBuild.getStaticNames(source_code)
+                )
+            )
+
+        writeSourceCode(
+            filename    = Utils.joinpath(source_dir, "__unit_%d.c" % (count+1)),
+            source_code = UnityBuild.getUnitCode(unit_includes)
+        )
+
+    if Options.isShowProgress() and units:
+        info(
+            "Unity build: %d small modules in %d units." % (
+                len(module_sizes),
+                len(units)
+            )
+        )
+
+
 def makeSourceDirectory(main_module):
     """ Get the full list of modules imported, create code for all of them.
 
@@ -313,38 +456,65 @@ def makeSourceDirectory(main_module):
     # First pass, generate code and use constants doing so, but prepare the
     # final code generation only, because constants code will be added at the
     # end only.
-    prepared_modules = {}
+    prepared_modules = CodeGeneration.prepareModulesCode(
+        global_context = global_context,
+        modules        = [
+            module
+            for module in ModuleRegistry.getDoneModules()
+            if module.isCompiledPythonModule()
+        ]
+    )
 
-    for module in ModuleRegistry.getDoneModules():
-        if module.isCompiledPythonModule():
-            cpp_filename = module_filenames[module]
+    # Main code constants need to be allocated already too.
+    if not Options.shallMakeModule():
+        prepared_modules[main_module][1].getConstantCode(0)
 
-            prepared_modules[cpp_filename] = CodeGeneration.prepareModuleCode(
-                global_context = global_context,
-                module         = module,
-                module_name    = module.getFullName(),
-            )
+    # Code of small modules, to be compiled together in units.
+    unit_source_codes = {}
 
-            # Main code constants need to be allocated already too.
-            if module is main_module and not Options.shallMakeModule():
-                prepared_modules[cpp_filename][1].getConstantCode(0)
+    if Options.isUnityBuild():
+        unit_size_limit = Options.getUnityBuildSizeLimit()
+    else:
+        unit_size_limit = 0
 
     # Second pass, generate the actual module code into the files.
     for module in ModuleRegistry.getDoneModules():
         if module.isCompiledPythonModule():
             cpp_filename = module_filenames[module]
 
-            template_values, module_context = prepared_modules[cpp_filename]
+            template_values, module_context = prepared_modules[module]
 
-            source_code = CodeGeneration.generateModuleCode(
-                module_context  = module_context,
-                template_values = template_values
-            )
+            # For modules split into parts, these share a header.
+            header_name = Utils.basename(cpp_filename)[:-2] + ".h"
 
-            writeSourceCode(
-                filename    = cpp_filename,
-                source_code = source_code
-            )
+            with withTimedPhase("module code generation", module.getFullName()):
+                source_code = CodeGeneration.generateModuleCode(
+                    module_context  = module_context,
+                    template_values = template_values,
+                    header_name     = header_name
+                )
+
+                part_codes = CodeGeneration.generateModulePartCodes(
+                    module_context  = module_context,
+                    template_values = template_values,
+                    header_name     = header_name
+                )
+
+                if part_codes is not None:
+                    writeModulePartCodes(
+                        source_dir   = source_dir,
+                        cpp_filename = cpp_filename,
+                        header_name  = header_name,
+                        part_codes   = part_codes
+                    )
+
+                if len(source_code) < unit_size_limit and part_codes is None:
+                    unit_source_codes[module] = source_code
+                else:
+                    writeSourceCode(
+                        filename    = cpp_filename,
+                        source_code = source_code
+                    )
 
             if Options.isShowInclusion():
                 info("Included compiled module '%s'." % module.getFullName())
@@ -359,14 +529,10 @@ def makeSourceDirectory(main_module):
             else:
                 target_filename += ".so"
 
-            target_dir = Utils.dirname(target_filename)
-
-            if not Utils.isDir(target_dir):
-                Utils.makePath(target_dir)
-
-            shutil.copy(
-                module.getFilename(),
-                target_filename
+            copyDistFile(
+                source_path = module.getFilename(),
+                target_path = target_filename,
+                is_binary   = True
             )
 
             standalone_entry_points.append(
@@ -377,13 +543,24 @@ def makeSourceDirectory(main_module):
         else:
             assert False, module
 
+    writeUnitSourceCodes(
+        source_dir        = source_dir,
+        module_filenames  = module_filenames,
+        unit_source_codes = unit_source_codes
+    )
+
     writeSourceCode(
         filename    = Utils.joinpath(
             source_dir,
             "__constants.c"
         ),
         source_code = ConstantCodes.getConstantsDefinitionCode(
-            context = global_context
+            context         = global_context,
+            module_contexts = [
+                module_context
+                for _template_values, module_context in
+                prepared_modules.values()
+            ]
         )
     )
 
@@ -451,6 +628,12 @@ def runScons(main_module, quiet):
     if not Options.isRemoveBuildDir() and Utils.getOS() == "Windows":
         options["cache_mode"] = "true"
 
+    if Options.shallCacheObjects():
+        options["object_cache_dir"] = getCacheSubDir("objects")
+
+    if Options.shallCacheRuntime():
+        options["runtime_cache_dir"] = getCacheSubDir("runtime")
+
     if Options.isLto():
         options["lto_mode"] = "true"
 
@@ -460,6 +643,12 @@ def runScons(main_module, quiet):
     if Options.isStandaloneMode():
         options["standalone_mode"] = "true"
 
+    if Options.isExternalConstants():
+        options["external_constants"] = "true"
+
+    if Options.isCompressConstants():
+        options["compressed_constants"] = "true"
+
     if not Options.isStandaloneMode() and \
        not Options.shallMakeModule() and \
        isUninstalledPython():
@@ -519,28 +708,38 @@ def runScons(main_module, quiet):
     return SconsInterface.runScons(options, quiet), options
 
 
-def writeSourceCode(filename, source_code):
+# Files written by this compilation.
+written_files = set()
+
+def _writeFileIfChanged(filename, data):
     # Prevent accidental overwriting. When this happens the collision detection
     # or something else has failed.
-    assert not Utils.isFile(filename), filename
+    assert filename not in written_files, filename
+    written_files.add(filename)
+
+    # Leave files from previous compilations alone, if they have the same
+    # contents, so their time stamps are kept, and they need not be compiled
+    # again.
+    if Utils.isFile(filename) and os.path.getsize(filename) == len(data):
+        with open(filename, "rb") as input_file:
+            if input_file.read() == data:
+                return
+
+    with open(filename, "wb") as output_file:
+        output_file.write(data)
+
 
+def writeSourceCode(filename, source_code):
     if python_version >= 300:
-        with open(filename, "wb") as output_file:
-            output_file.write(source_code.encode("latin1"))
-    else:
-        with open(filename, 'w') as output_file:
-            output_file.write(source_code)
+        source_code = source_code.encode("latin1")
 
+    _writeFileIfChanged(filename, source_code)
 
-def writeBinaryData(filename, binary_data):
-    # Prevent accidental overwriting. When this happens the collision detection
-    # or something else has failed.
-    assert not Utils.isFile(filename), filename
 
+def writeBinaryData(filename, binary_data):
     assert type(binary_data) is bytes
 
-    with open(filename, "wb") as output_file:
-        output_file.write(binary_data)
+    _writeFileIfChanged(filename, binary_data)
 
 
 def callExecPython(args, clean_path, add_path):
@@ -605,9 +804,10 @@ def compileTree(main_module):
 
     if not Options.shallOnlyExecCppCall():
         # Now build the target language code for the whole tree.
-        makeSourceDirectory(
-            main_module = main_module
-        )
+        with withTimedPhase("code generation", children = True):
+            makeSourceDirectory(
+                main_module = main_module
+            )
 
         frozen_code = generateBytecodeFrozenCode()
 
@@ -620,10 +820,20 @@ def compileTree(main_module):
                 source_code = frozen_code
             )
 
-        writeBinaryData(
-            filename    = Utils.joinpath(source_dir, "__constants.bin"),
-            binary_data = ConstantCodes.stream_data.getBytes()
-        )
+        with withTimedPhase("constants blob writing"):
+            if Options.isCompressConstants():
+                constants_data = ConstantCodes.stream_data.getCompressedBytes(
+                    chunk_size = Options.getCompressConstantsChunkSize()
+                )
+            else:
+                constants_data = ConstantCodes.stream_data.getBytes()
+
+            writeBinaryData(
+                filename    = Utils.joinpath(source_dir, "__constants.bin"),
+                binary_data = constants_data
+            )
+
+        removeStaleSourceFiles(source_dir)
     else:
         source_dir = getSourceDirectoryPath(main_module)
 
@@ -644,10 +854,11 @@ def compileTree(main_module):
         return True, {}
 
     # Run the Scons to build things.
-    result, options = runScons(
-        main_module = main_module,
-        quiet       = not Options.isShowScons()
-    )
+    with withTimedPhase("scons compile and link", children = True):
+        result, options = runScons(
+            main_module = main_module,
+            quiet       = not Options.isShowScons()
+        )
 
     return result, options
 
@@ -671,6 +882,10 @@ def main():
     positional_args = Options.getPositionalArgs()
     assert len(positional_args) > 0
 
+    # The report is written on exit, covering the failure exits too.
+    if Options.getTimingsReportFilename() is not None:
+        atexit.register(writeTimingsReport)
+
     filename = Options.getPositionalArgs()[0]
 
     # Inform the importing layer about the main script directory, so it can use
@@ -750,10 +965,12 @@ def main():
                     Plugins.considerExtraDlls(dist_dir, module)
                 )
 
-            copyUsedDLLs(
-                dist_dir                = dist_dir,
-                standalone_entry_points = standalone_entry_points
-            )
+            with withTimedPhase("standalone DLL detection and copying",
+                                children = True):
+                copyUsedDLLs(
+                    dist_dir                = dist_dir,
+                    standalone_entry_points = standalone_entry_points
+                )
 
 
             for module in ModuleRegistry.getDoneModules():
@@ -761,19 +978,38 @@ def main():
                     Plugins.considerDataFiles(module)
                 )
 
-            for source_filename, target_filename in data_files:
-                target_filename = Utils.joinpath(
-                    getStandaloneDirectoryPath(main_module),
-                    target_filename
-                )
+            copyDistFiles(
+                [
+                    (
+                        source_filename,
+                        Utils.joinpath(dist_dir, target_filename),
+                        False
+                    )
+                    for source_filename, target_filename in
+                    data_files
+                ]
+            )
 
-                Utils.makePath(Utils.dirname(target_filename))
+            if Options.isIncrementalDist():
+                keep_filenames = [
+                    standalone_entry_point[0]
+                    for standalone_entry_point in
+                    standalone_entry_points
+                ]
+
+                # Scons installs the constants file next to the binary.
+                if Options.isExternalConstants():
+                    keep_filenames.append(
+                        getResultBasepath(main_module) + ".const"
+                    )
 
-                shutil.copy2(
-                    source_filename,
-                    target_filename
+                removeStaleDistFiles(
+                    dist_dir       = dist_dir,
+                    keep_filenames = keep_filenames
                 )
 
+                storeDistFileRecords()
+
         # Modules should not be executable, but Scons creates them like it, fix
         # it up here.
         if Utils.getOS() != "Windows" and Options.shallMakeModule():
@@ -787,6 +1023,9 @@ def main():
 
         # Execute the module immediately if option was given.
         if Options.shallExecuteImmediately():
+            # Executing may replace the process, report before.
+            writeTimingsReport()
+
             if Options.shallMakeModule():
                 executeModule(
                     tree       = main_module,
@@ -155,7 +155,47 @@ def startTraversal():
         active_module.startTraversal()
 
 
+# Modules and functions used while optimizing a module, so that can be repeated
+# without optimizing it again.
+used_recording = None
+
+
+def startUsedRecording():
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global used_recording
+
+    used_recording = OrderedSet()
+
+
+def stopUsedRecording():
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global used_recording
+
+    result = used_recording
+    used_recording = None
+
+    return result
+
+
+def replayUsedRecording(recording):
+    for module, function_body in recording:
+        addUsedModule(module)
+
+        if function_body is not None:
+            module.addUsedFunction(function_body)
+
+
+def onUsedFunction(module, function_body):
+    if used_recording is not None:
+        used_recording.add((module, function_body))
+
+
 def addUsedModule(module):
+    if used_recording is not None:
+        used_recording.add((module, None))
+
     if module not in done_modules and module not in active_modules:
         active_modules.add(module)
 
@@ -176,6 +216,10 @@ def remainingCount():
     return len(active_modules)
 
 
+def getActiveModules():
+    return tuple(active_modules)
+
+
 def getDoneModules():
     return sorted(
         done_modules,
@@ -23,7 +23,7 @@ Copyright (C) 2016 Kay Hayen."""
 
 import logging
 import sys
-from optparse import SUPPRESS_HELP, OptionGroup, OptionParser
+from optparse import SUPPRESS_HELP, Option, OptionGroup, OptionParser
 
 from nuitka.PythonVersions import (
     getSupportedPythonVersions,
@@ -47,9 +47,19 @@ if not is_nuitka_run:
 else:
     usage = "usage: %prog [options] main_module.py"
 
+class NuitkaOption(Option):
+    """ Option that knows if it can change the module trees.
+
+        Options with "affects_trees = False" have no impact on the trees, so
+        changing them doesn't invalidate cached trees.
+    """
+    ATTRS = Option.ATTRS + ["affects_trees"]
+
+
 parser = OptionParser(
-    usage   = usage,
-    version = getVersion()
+    usage        = usage,
+    version      = getVersion(),
+    option_class = NuitkaOption
 )
 
 # This option is obsolete, and module should be used.
@@ -95,6 +105,32 @@ increase very much.
 """,
     )
 
+parser.add_option(
+    "--incremental-dist",
+    action        = "store_true",
+    dest          = "incremental_dist",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+In standalone mode, keep the ".dist" folder of the last compilation, and only
+copy files into it, that are not there with the same size and modification
+time already. Files no longer needed are removed. Defaults to off."""
+)
+
+parser.add_option(
+    "--dist-file-linking",
+    action        = "store",
+    dest          = "dist_file_linking",
+    affects_trees = False,
+    choices       = ("copy", "hardlink", "reflink"),
+    default       = "copy",
+    help          = """\
+How to put files into the ".dist" folder in standalone mode. With "hardlink",
+files are hard linked to their source, unless they need changes, and with
+"reflink", they are cloned on file systems that support it. Where it is not
+possible, files are copied. Defaults to "copy"."""
+)
+
 
 parser.add_option(
     "--python-version",
@@ -235,10 +271,11 @@ execute_group = OptionGroup(
 
 execute_group.add_option(
     "--run", "--execute",
-    action  = "store_true",
-    dest    = "immediate_execution",
-    default = is_nuitka_run,
-    help    = """\
+    action        = "store_true",
+    dest          = "immediate_execution",
+    affects_trees = False,
+    default       = is_nuitka_run,
+    help          = """\
 Execute immediately the created binary (or import the compiled module).
 Defaults to %s.""" %
        ("on" if is_nuitka_run else "off")
@@ -246,20 +283,22 @@ Defaults to %s.""" %
 
 execute_group.add_option(
     "--debugger", "--gdb",
-    action  = "store_true",
-    dest    = "debugger",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "debugger",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Execute inside "gdb" to automatically get a stack trace.
 Defaults to off."""
 )
 
 execute_group.add_option(
     "--execute-with-pythonpath", "--keep-pythonpath",
-    action  = "store_true",
-    dest    = "keep_pythonpath",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "keep_pythonpath",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 When immediately executing the created binary (--execute), don't reset
 PYTHONPATH. When all modules are successfully included, you ought to not need
 PYTHONPATH anymore."""
@@ -274,18 +313,20 @@ dump_group = OptionGroup(
 
 dump_group.add_option(
     "--dump-xml", "--xml",
-    action  = "store_true",
-    dest    = "dump_xml",
-    default = False,
-    help    = "Dump the final result of optimization as XML, then exit."
+    action        = "store_true",
+    dest          = "dump_xml",
+    affects_trees = False,
+    default       = False,
+    help          = "Dump the final result of optimization as XML, then exit."
 )
 
 dump_group.add_option(
     "--display-tree",
-    action  = "store_true",
-    dest    = "display_tree",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "display_tree",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Display the final result of optimization in a GUI, then exit."""
 )
 
@@ -345,6 +386,72 @@ codegen_group.add_option(
 # """Disable all unnecessary optimizations on Python level. Defaults to off."""
 )
 
+codegen_group.add_option(
+    "--external-constants",
+    action        = "store_true",
+    dest          = "external_constants",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Write the constants blob to a file next to the created binary, named like it
+with ".const" suffix, and map it into memory at program start, instead of
+linking it into the binary. Its pages are then read only, loaded when used
+only, and shared by all processes running the program. The file must be kept
+with the binary. Not for modules. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--compress-constants",
+    action        = "store_true",
+    dest          = "compress_constants",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Compress the constants blob with "zlib" in chunks, which are decompressed when
+a constant in them is first needed. The binary gets smaller, and less of it is
+read at program start, but this needs the "zlib" module. Defaults to off."""
+)
+
+# This is for testing framework, small chunks make values of the constants
+# blob be in many of them.
+codegen_group.add_option(
+    "--compress-constants-chunk-size",
+    action        = "store",
+    dest          = "compress_constants_chunk_size",
+    affects_trees = False,
+    default       = 64 * 1024,
+    type          = "int",
+    help          = SUPPRESS_HELP
+)
+
+codegen_group.add_option(
+    "--optimization-jobs",
+    action        = "store",
+    dest          = "optimization_jobs",
+    affects_trees = False,
+    metavar       = 'N',
+    default       = 1,
+    help          = """\
+Specify the allowed number of worker processes, that optimize modules in
+parallel. Modules are optimized in the workers, and then checked in the main
+process, repeating passes until nothing changes anymore. Only available where
+processes can be forked. Defaults to 1, i.e. no worker processes."""
+)
+
+codegen_group.add_option(
+    "--code-generation-jobs",
+    action        = "store",
+    dest          = "codegen_jobs",
+    affects_trees = False,
+    metavar       = 'N',
+    default       = 1,
+    help          = """\
+Specify the allowed number of worker processes, that generate the C code of
+modules in parallel. The constants used by the modules are merged in the main
+process afterwards. Only available where processes can be forked. Defaults to
+1, i.e. no worker processes."""
+)
+
 parser.add_option_group(codegen_group)
 
 outputdir_group = OptionGroup(
@@ -354,11 +461,12 @@ outputdir_group = OptionGroup(
 
 outputdir_group.add_option(
     "--output-dir",
-    action  = "store",
-    dest    = "output_dir",
-    metavar = "DIRECTORY",
-    default = "",
-    help    = """\
+    action        = "store",
+    dest          = "output_dir",
+    affects_trees = False,
+    metavar       = "DIRECTORY",
+    default       = "",
+    help          = """\
 Specify where intermediate and final output files should be put. DIRECTORY will
 be populated with C++ files, object files, etc. Defaults to current directory.
 """
@@ -366,16 +474,126 @@ be populated with C++ files, object files, etc. Defaults to current directory.
 
 outputdir_group.add_option(
     "--remove-output",
-    action  = "store_true",
-    dest    = "remove_build",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "remove_build",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Removes the build directory after producing the module or exe file.
 Defaults to off."""
 )
 
 parser.add_option_group(outputdir_group)
 
+caching_group = OptionGroup(
+    parser,
+    "Caching of results between compilations"
+)
+
+caching_group.add_option(
+    "--module-cache",
+    action        = "store_true",
+    dest          = "module_cache",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Cache the optimized trees of compiled modules in the Nuitka cache directory,
+and reuse them for unchanged modules in later compilations. The cache
+directory can be given with "NUITKA_CACHE_DIR" environment variable.
+Defaults to off."""
+)
+
+caching_group.add_option(
+    "--module-cache-size",
+    action        = "store",
+    dest          = "module_cache_size",
+    affects_trees = False,
+    metavar       = "MB",
+    default       = 256,
+    type          = "int",
+    help          = """\
+Size limit of the module tree cache in MB. Least recently used trees are
+removed, when it's exceeded. Defaults to %default."""
+)
+
+caching_group.add_option(
+    "--module-search-cache",
+    action        = "store_true",
+    dest          = "module_search_cache",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Cache where modules were found in the Nuitka cache directory, and reuse it in
+later compilations, unless the searched directories changed. This avoids most
+of the file system accesses of locating modules. Defaults to off."""
+)
+
+caching_group.add_option(
+    "--object-cache",
+    action        = "store_true",
+    dest          = "object_cache",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Cache the object files of C compilation in the Nuitka cache directory, shared
+between all compilations, and reuse them for unchanged modules and the static
+runtime files, even with a new build directory. Only for gcc and clang.
+Defaults to off."""
+)
+
+caching_group.add_option(
+    "--object-cache-size",
+    action        = "store",
+    dest          = "object_cache_size",
+    affects_trees = False,
+    metavar       = "MB",
+    default       = 1024,
+    type          = "int",
+    help          = """\
+Size limit of the object file cache in MB. Least recently used object files
+are removed, when it's exceeded. Defaults to %default."""
+)
+
+caching_group.add_option(
+    "--runtime-cache",
+    action        = "store_true",
+    dest          = "runtime_cache",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Keep the object files of the static runtime, e.g. compiled function and
+generator types, in the Nuitka cache directory, and link them as they are in
+later compilations with the same configuration, instead of compiling them
+again. Defaults to off."""
+)
+
+caching_group.add_option(
+    "--no-import-detection-cache",
+    action        = "store_false",
+    dest          = "import_detection_cache",
+    affects_trees = False,
+    default       = True,
+    help          = """\
+Do not cache the modules the Python interpreter imports at startup, which are
+detected for standalone mode by running it. By default, the result is kept in
+the Nuitka cache directory, and only detected again, if the interpreter, the
+search path directories, or the imported files changed."""
+)
+
+caching_group.add_option(
+    "--no-dll-detection-cache",
+    action        = "store_false",
+    dest          = "dll_detection_cache",
+    affects_trees = False,
+    default       = True,
+    help          = """\
+Do not cache the DLLs used by binaries, which are detected for standalone mode.
+By default, the result is kept in the Nuitka cache directory, and only detected
+again, if the binary or the DLLs it uses changed."""
+)
+
+parser.add_option_group(caching_group)
+
 
 windows_group = OptionGroup(
     parser,
@@ -419,10 +637,11 @@ Enable vmprof based profiling of time spent. Defaults to off."""
 
 debug_group.add_option(
     "--graph",
-    action  = "store_true",
-    dest    = "graph",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "graph",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Create graph of optimization process. Defaults to off."""
 )
 
@@ -438,10 +657,11 @@ Defaults to off."""
 
 debug_group.add_option(
     "--recompile-c++-only", "--recompile-c-only",
-    action  = "store_true",
-    dest    = "recompile_cpp_only",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "recompile_cpp_only",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Take existing files and compile them again.Allows compiling edited C++ files
 with the C++ compiler for quick debugging changes to the generated source.
 Defaults to off. Depends on compiling Python source to determine which files it
@@ -450,10 +670,11 @@ should look at."""
 
 debug_group.add_option(
     "--generate-c++-only",
-    action  = "store_true",
-    dest    = "generate_cpp_only",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "generate_cpp_only",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Generate only C++ source code, and do not compile it to binary or module. This
 is for debugging and code coverage analysis that doesn't waste CPU. Defaults to
 off."""
@@ -482,10 +703,11 @@ debug_group.add_option(
 # we can use it to make sure it's not done unknowingly.
 parser.add_option(
     "--must-not-re-execute",
-    action  = "store_false",
-    dest    = "allow_reexecute",
-    default = True,
-    help    = SUPPRESS_HELP
+    action        = "store_false",
+    dest          = "allow_reexecute",
+    affects_trees = False,
+    default       = True,
+    help          = SUPPRESS_HELP
 )
 
 
@@ -530,11 +752,12 @@ compilers. Defaults to the most recent version."""
 
 cpp_compiler_group.add_option(
     "-j", "--jobs",
-    action  = "store",
-    dest    = "jobs",
-    metavar = 'N',
-    default = Utils.getCoreCount(),
-    help    = """\
+    action        = "store",
+    dest          = "jobs",
+    affects_trees = False,
+    metavar       = 'N',
+    default       = Utils.getCoreCount(),
+    help          = """\
 Specify the allowed number of parallel C++ compiler jobs. Defaults to the
 system CPU count.""",
 )
@@ -549,6 +772,56 @@ Use link time optimizations if available and usable (g++ 4.6 and higher).
 Defaults to off."""
 )
 
+cpp_compiler_group.add_option(
+    "--unity-build",
+    action        = "store_true",
+    dest          = "unity_build",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Compile the code of small modules together in units, rather than each on its
+own, which avoids the startup and header parsing for every one of them. Large
+modules are still compiled alone. Defaults to off."""
+)
+
+cpp_compiler_group.add_option(
+    "--unity-build-size",
+    action        = "store",
+    dest          = "unity_build_size",
+    affects_trees = False,
+    metavar       = "KB",
+    default       = 512,
+    type          = "int",
+    help          = """\
+Size limit of the C code of a unit for "--unity-build" in KB, modules that are
+larger, are compiled alone. Units are made smaller, if needed to use all jobs.
+Defaults to %default."""
+)
+
+cpp_compiler_group.add_option(
+    "--split-modules",
+    action        = "store_true",
+    dest          = "split_modules",
+    affects_trees = False,
+    default       = False,
+    help          = """\
+Split the C code of large modules into several files, that are compiled in
+parallel, rather than compiling it in one go. Defaults to off."""
+)
+
+cpp_compiler_group.add_option(
+    "--split-modules-size",
+    action        = "store",
+    dest          = "split_modules_size",
+    affects_trees = False,
+    metavar       = "KB",
+    default       = 1024,
+    type          = "int",
+    help          = """\
+Size limit of the function code in the files of a module for "--split-modules"
+in KB, modules with more, are split. Defaults to %default."""
+)
+
 parser.add_option_group(cpp_compiler_group)
 
 tracing_group = OptionGroup(
@@ -558,48 +831,66 @@ tracing_group = OptionGroup(
 
 tracing_group.add_option(
     "--show-scons",
-    action  = "store_true",
-    dest    = "show_scons",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "show_scons",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Operate Scons in non-quiet mode, showing the executed commands.
 Defaults to off."""
 )
 
 tracing_group.add_option(
     "--show-progress",
-    action  = "store_true",
-    dest    = "show_progress",
-    default = False,
-    help    = """Provide progress information and statistics.
+    action        = "store_true",
+    dest          = "show_progress",
+    affects_trees = False,
+    default       = False,
+    help          = """Provide progress information and statistics.
 Defaults to off."""
 )
 
 tracing_group.add_option(
     "--show-memory",
-    action  = "store_true",
-    dest    = "show_memory",
-    default = False,
-    help    = """Provide memory information and statistics.
+    action        = "store_true",
+    dest          = "show_memory",
+    affects_trees = False,
+    default       = False,
+    help          = """Provide memory information and statistics.
 Defaults to off."""
 )
 
 
 tracing_group.add_option(
     "--show-modules",
-    action  = "store_true",
-    dest    = "show_inclusion",
-    default = False,
-    help    = """Provide a final summary on included modules.
+    action        = "store_true",
+    dest          = "show_inclusion",
+    affects_trees = False,
+    default       = False,
+    help          = """Provide a final summary on included modules.
 Defaults to off."""
 )
 
+tracing_group.add_option(
+    "--report-timings",
+    action        = "store",
+    dest          = "report_timings",
+    affects_trees = False,
+    metavar       = "FILENAME",
+    default       = None,
+    help          = """\
+Write a report of wall time, CPU time and peak memory usage of the phases of
+the compilation, and of the modules in them, to the given JSON file. Defaults
+to off."""
+)
+
 tracing_group.add_option(
     "--verbose",
-    action  = "store_true",
-    dest    = "verbose",
-    default = False,
-    help    = """\
+    action        = "store_true",
+    dest          = "verbose",
+    affects_trees = False,
+    default       = False,
+    help          = """\
 Output details of actions taken, esp. in optimizations. Can become a lot.
 Defaults to off."""
 )
@@ -718,6 +1009,10 @@ if options.is_standalone:
     if Utils.getOS() == "NetBSD":
         logging.warning("Standalone mode on NetBSD is not functional, due to $ORIGIN linkage not being supported.")
 
+if options.external_constants and not options.executable:
+    sys.exit("""
+Error, '--external-constants' is only for executables, not modules.""")
+
 def shallTraceExecution():
     return options.trace_execution
 
@@ -860,9 +1155,27 @@ def isShowScons():
 def getJobLimit():
     return int(options.jobs)
 
+def getOptimizationJobLimit():
+    return int(options.optimization_jobs)
+
+def getCodeGenerationJobLimit():
+    return int(options.codegen_jobs)
+
 def isLto():
     return options.lto
 
+def isUnityBuild():
+    return options.unity_build
+
+def getUnityBuildSizeLimit():
+    return options.unity_build_size * 1024
+
+def isSplitModules():
+    return options.split_modules
+
+def getSplitModulesSizeLimit():
+    return options.split_modules_size * 1024
+
 def isClang():
     return options.clang
 
@@ -887,6 +1200,47 @@ def isShowMemory():
 def isShowInclusion():
     return options.show_inclusion
 
+def getTimingsReportFilename():
+    return options.report_timings
+
+def shallCacheModuleTrees():
+    return options.module_cache
+
+def getModuleCacheSizeLimit():
+    return options.module_cache_size * 1024 * 1024
+
+def getTreeAffectingOptions():
+    """ The values of options that can change module trees, by name. """
+    neutral_names = set(
+        option.dest
+        for option in parser._get_all_options() # pylint: disable=W0212
+        if option.affects_trees is False
+    )
+
+    return dict(
+        (option_name, option_value)
+        for option_name, option_value in vars(options).items()
+        if option_name not in neutral_names
+    )
+
+def shallCacheModuleSearches():
+    return options.module_search_cache
+
+def shallCacheObjects():
+    return options.object_cache
+
+def getObjectCacheSizeLimit():
+    return options.object_cache_size * 1024 * 1024
+
+def shallCacheRuntime():
+    return options.runtime_cache
+
+def shallCacheImportDetection():
+    return options.import_detection_cache
+
+def shallCacheDLLDetection():
+    return options.dll_detection_cache
+
 def isRemoveBuildDir():
     return options.remove_build and not options.generate_cpp_only
 
@@ -904,6 +1258,21 @@ def shallExplainImports():
 def isStandaloneMode():
     return options.is_standalone
 
+def isExternalConstants():
+    return options.external_constants
+
+def isCompressConstants():
+    return options.compress_constants
+
+def getCompressConstantsChunkSize():
+    return options.compress_constants_chunk_size
+
+def isIncrementalDist():
+    return options.incremental_dist
+
+def getDistFileLinking():
+    return options.dist_file_linking
+
 def getIconPath():
     return options.icon_path
 
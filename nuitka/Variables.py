@@ -303,14 +303,14 @@ def updateFromCollection(old_collection, new_collection):
     touched_variables = set()
 
     if old_collection is not None:
-        for variable_trace in old_collection.getVariableTracesAll().values():
+        for variable_trace in old_collection.getVariableTracesAll():
             variable = variable_trace.getVariable()
 
             variable.removeTrace(variable_trace)
             touched_variables.add(variable)
 
     if new_collection is not None:
-        for variable_trace in new_collection.getVariableTracesAll().values():
+        for variable_trace in new_collection.getVariableTracesAll():
             variable = variable_trace.getVariable()
 
             variable.addTrace(variable_trace)
@@ -318,7 +318,6 @@ def updateFromCollection(old_collection, new_collection):
 
         # Release the memory, and prevent the "active" state from being ever
         # inspected, it's useless now.
-        new_collection.variable_actives.clear()
         del new_collection.variable_actives
 
     for variable in touched_variables:
@@ -31,6 +31,7 @@ import sys
 from nuitka import Options, Tracing
 from nuitka.PythonVersions import getTargetPythonDLLPath, python_version
 from nuitka.utils import Execution, Utils
+from nuitka.utils.AppDirs import trimCacheDir
 
 
 def getSconsDataPath():
@@ -211,4 +212,12 @@ def runScons(options, quiet):
         if Options.isShowScons():
             Tracing.printLine("Scons command:", ' '.join(scons_command))
 
-        return subprocess.call(scons_command, shell = False) == 0
+        result = subprocess.call(scons_command, shell = False) == 0
+
+    if "object_cache_dir" in options:
+        trimCacheDir(
+            cache_dir  = options["object_cache_dir"],
+            size_limit = Options.getObjectCacheSizeLimit()
+        )
+
+    return result
@@ -0,0 +1,107 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unity build, compiling the code of several modules as one file.
+
+Every C file costs a compiler process, and parsing all the headers of Nuitka
+and Python again. For programs with many small modules, that is most of the
+work. With "--unity-build", modules smaller than the unit size are written to
+".inc" files instead, and units include several of them, so they are compiled
+together. Larger modules are compiled on their own as usual.
+
+Generated module code has file level static names that are the same in all
+modules, e.g. "createModuleConstants", or that are made from hash values of
+their contents. These are renamed for each included module with macros.
+"""
+
+import re
+
+# Names of file level static declarations and definitions of generated code,
+# i.e. variables and functions, which start at the beginning of the line, and
+# are then followed by an initializer, the end, array sizes or parameters.
+_static_name_re = re.compile(
+    r"^(?:static|NUITKA_LOCAL_MODULE)\b[^=;(\[\n]*?(?<![A-Za-z_0-9$])([A-Za-z_$][A-Za-z_0-9$]*)\s*[=;(\[]",
+    re.MULTILINE
+)
+
+def getStaticNames(source_code):
+    """ Get the file level static names of generated C code.
+
+    """
+    return sorted(set(_static_name_re.findall(source_code)))
+
+
+def groupUnitModules(module_sizes, size_limit, job_limit):
+    """ Group small modules into units to be compiled together.
+
+        The module sizes is a list of module and size of their code pairs,
+        in the order they are to be grouped. Units are filled up to the size
+        limit, but made smaller for there to be at least as many units as
+        jobs, so the compilation is still done in parallel.
+
+        Returns a list of units, being lists of modules.
+    """
+    total_size = sum(size for _module, size in module_sizes)
+
+    size_limit = min(size_limit, total_size // max(job_limit, 1) + 1)
+
+    result = []
+    unit_size = size_limit
+
+    for module, size in module_sizes:
+        if unit_size + size > size_limit:
+            result.append([])
+            unit_size = 0
+
+        result[-1].append(module)
+        unit_size += size
+
+    return result
+
+
+def getUnitCode(unit_includes):
+    """ Get the code of a unit including the code of several modules.
+
+        The unit includes is a list of the filenames to include, relative to
+        the unit, and the static names of their code.
+    """
+    lines = [
+        "/* Unity build of several modules, created by Nuitka. */",
+        "",
+        # These come first, so the precompiled header can be used, and their
+        # names are not renamed.
+        '#include "nuitka/prelude.h"',
+        "",
+        '#include "__helpers.h"'
+    ]
+
+    for count, (include_filename, static_names) in enumerate(unit_includes):
+        lines.append("")
+
+        for static_name in static_names:
+            lines.append(
+                "#define %s %s$$$unit_%d" % (static_name, static_name, count)
+            )
+
+        lines.append('#include "%s"' % include_filename)
+
+        for static_name in static_names:
+            lines.append("#undef %s" % static_name)
+
+    lines.append("")
+
+    return '\n'.join(lines)
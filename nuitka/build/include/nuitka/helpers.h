@@ -763,7 +763,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *MODULE_NAME( PyObject *module )
     return PyDict_GetItem( module_dict, const_str_plain___name__ );
 }
 
-#if defined(_NUITKA_STANDALONE) || _NUITKA_FROZEN > 0
+#if defined(_NUITKA_STANDALONE) || _NUITKA_FROZEN > 0 || defined(_NUITKA_CONSTANTS_FROM_FILE)
 // Get the binary directory, translated to UTF8 or usable as a native path,
 // e.g. ANSI on Windows.
 extern char *getBinaryDirectoryUTF8Encoded();
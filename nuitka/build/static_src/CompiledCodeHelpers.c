@@ -1304,61 +1304,362 @@ bool PRINT_ITEM( PyObject *object )
 
 
 
-PyObject *UNSTREAM_CONSTANT( unsigned char const *buffer, Py_ssize_t size )
+#if defined(_NUITKA_CONSTANTS_COMPRESSED)
+
+// The constants blob is made of chunks, that are mostly compressed with "zlib",
+// and decompressed when first used. It starts with a table of the chunks, see
+// "BlobCodes.py" for how it is written.
+static uint32_t _readBlobValue( Py_ssize_t offset )
 {
-    assert( buffer );
+    uint32_t result = 0;
+
+    for ( int i = 3; i >= 0; i-- )
+    {
+        result = ( result << 8 ) | constant_bin[ offset + i ];
+    }
+
+    return result;
+}
+
+// The few chunks last decompressed are kept, as constants are mostly created
+// in the order of the stream.
+#define NUITKA_CONSTANTS_CHUNK_CACHE_SIZE 4
+
+static PyObject *chunk_cache_data[ NUITKA_CONSTANTS_CHUNK_CACHE_SIZE ];
+static Py_ssize_t chunk_cache_index[ NUITKA_CONSTANTS_CHUNK_CACHE_SIZE ] = { -1, -1, -1, -1 };
+static int chunk_cache_next = 0;
+
+unsigned char const *getConstantsBlobData( Py_ssize_t offset )
+{
+    Py_ssize_t chunk_count = _readBlobValue( 0 );
+    assert( chunk_count > 0 );
 
-    // We unstream difficult constant objects using the "pickle" module, this is
-    // aimed at being the exception, e.g. unicode that doesn't fit into UTF-8
-    // will be dealt with like this.
-    static PyObject *module_pickle = NULL;
+    // Find the last chunk that starts before the offset, these are sorted.
+    Py_ssize_t low = 0;
+    Py_ssize_t high = chunk_count - 1;
 
-    if ( module_pickle == NULL )
+    while ( low < high )
     {
-#if PYTHON_VERSION < 300
-        module_pickle = PyImport_ImportModule( "cPickle" );
-#else
-        module_pickle = PyImport_ImportModule( "pickle" );
-#endif
-        if (unlikely( module_pickle == NULL ))
+        Py_ssize_t middle = ( low + high + 1 ) / 2;
+
+        if ( (Py_ssize_t)_readBlobValue( 4 + middle * 20 ) <= offset )
+        {
+            low = middle;
+        }
+        else
+        {
+            high = middle - 1;
+        }
+    }
+
+    Py_ssize_t entry = 4 + low * 20;
+
+    Py_ssize_t chunk_start = _readBlobValue( entry );
+    Py_ssize_t blob_start = _readBlobValue( entry + 8 );
+    Py_ssize_t blob_size = _readBlobValue( entry + 12 );
+
+    assert( offset >= chunk_start );
+    assert( offset - chunk_start < (Py_ssize_t)_readBlobValue( entry + 4 ) );
+
+    if ( _readBlobValue( entry + 16 ) == 0 )
+    {
+        return &constant_bin[ blob_start + offset - chunk_start ];
+    }
+
+    for ( int i = 0; i < NUITKA_CONSTANTS_CHUNK_CACHE_SIZE; i++ )
+    {
+        if ( chunk_cache_index[ i ] == low )
+        {
+            return (unsigned char const *)PyBytes_AS_STRING( chunk_cache_data[ i ] ) + offset - chunk_start;
+        }
+    }
+
+    static PyObject *function_zlib_decompress = NULL;
+
+    if ( function_zlib_decompress == NULL )
+    {
+        PyObject *module_zlib = PyImport_ImportModule( "zlib" );
+
+        if (unlikely( module_zlib == NULL ))
         {
             PyErr_Print();
+            abort();
         }
 
-        assert( module_pickle );
+        function_zlib_decompress = PyObject_GetAttrString( module_zlib, "decompress" );
+
+        if (unlikely( function_zlib_decompress == NULL ))
+        {
+            PyErr_Print();
+            abort();
+        }
     }
 
-    static PyObject *function_pickle_loads = NULL;
+    PyObject *compressed = PyBytes_FromStringAndSize(
+        (char const *)&constant_bin[ blob_start ],
+        blob_size
+    );
+
+    PyObject *data = PyObject_CallFunctionObjArgs(
+        function_zlib_decompress,
+        compressed,
+        NULL
+    );
+
+    Py_DECREF( compressed );
 
-    if ( function_pickle_loads == NULL )
+    if (unlikely( data == NULL ))
     {
-        function_pickle_loads = PyObject_GetAttrString(
-            module_pickle,
-            "loads"
-        );
+        PyErr_Print();
+        abort();
+    }
+
+    assert( PyBytes_GET_SIZE( data ) == (Py_ssize_t)_readBlobValue( entry + 4 ) );
+
+    Py_XDECREF( chunk_cache_data[ chunk_cache_next ] );
+    chunk_cache_data[ chunk_cache_next ] = data;
+    chunk_cache_index[ chunk_cache_next ] = low;
+    chunk_cache_next = ( chunk_cache_next + 1 ) % NUITKA_CONSTANTS_CHUNK_CACHE_SIZE;
+
+    return (unsigned char const *)PyBytes_AS_STRING( data ) + offset - chunk_start;
+}
+#endif
+
+// We unstream constant objects that cannot be created from C literals from a
+// format of Nuitka, see "BlobCodes.py" for how it is written. Values start with
+// a type character, sizes are stored with 7 bits per byte. These are decoded
+// unsigned, as zig-zag encoded values may use all 64 bits.
+static unsigned long long _UNSTREAM_VARINT( unsigned char const **buffer )
+{
+    unsigned long long result = 0;
+    int shift = 0;
+
+    while ( true )
+    {
+        unsigned char c = *(*buffer)++;
 
-        if (unlikely( function_pickle_loads == NULL ))
+        result |= (unsigned long long)( c & 0x7f ) << shift;
+
+        if ( ( c & 0x80 ) == 0 ) break;
+
+        shift += 7;
+    }
+
+    return result;
+}
+
+static Py_ssize_t _UNSTREAM_SIZE( unsigned char const **buffer )
+{
+    return (Py_ssize_t)_UNSTREAM_VARINT( buffer );
+}
+
+// Constants cannot be missing, so failing to create one is fatal.
+static PyObject *_UNSTREAM_CHECKED( PyObject *value )
+{
+    if (unlikely( value == NULL ))
+    {
+        if ( ERROR_OCCURRED() )
         {
             PyErr_Print();
         }
 
-        assert( function_pickle_loads );
+        fprintf( stderr, "Error, failed to create constant.\n" );
+        abort();
+    }
+
+    return value;
+}
+
+static void _UNSTREAM_CHECK_STATUS( int status )
+{
+    if (unlikely( status != 0 ))
+    {
+        PyErr_Print();
+        fprintf( stderr, "Error, failed to fill constant.\n" );
+        abort();
     }
+}
+
+static PyObject *_UNSTREAM_VALUE( unsigned char const **buffer )
+{
+    PyObject *result;
+
+    unsigned char kind = *(*buffer)++;
+
+    switch ( kind )
+    {
+        case 'n':
+            result = Py_None;
+            Py_INCREF( result );
+            break;
+        case 't':
+            result = Py_True;
+            Py_INCREF( result );
+            break;
+        case 'F':
+            result = Py_False;
+            Py_INCREF( result );
+            break;
+        case '.':
+            result = Py_Ellipsis;
+            Py_INCREF( result );
+            break;
+        case 'T':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            result = _UNSTREAM_CHECKED( PyTuple_New( size ) );
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyTuple_SET_ITEM( result, i, _UNSTREAM_VALUE( buffer ) );
+            }
+
+            break;
+        }
+        case 'L':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            result = _UNSTREAM_CHECKED( PyList_New( size ) );
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyList_SET_ITEM( result, i, _UNSTREAM_VALUE( buffer ) );
+            }
+
+            break;
+        }
+        case 'D':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            result = _UNSTREAM_CHECKED( _PyDict_NewPresized( size ) );
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyObject *key = _UNSTREAM_VALUE( buffer );
+                PyObject *value = _UNSTREAM_VALUE( buffer );
+
+                _UNSTREAM_CHECK_STATUS( PyDict_SetItem( result, key, value ) );
+
+                Py_DECREF( key );
+                Py_DECREF( value );
+            }
+
+            assert( PyDict_Size( result ) == size );
+
+            break;
+        }
+        case 'S':
+        case 'P':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            // New frozen sets can be filled like sets, before they are used,
+            // but the empty one may be shared, so it is not touched.
+            if ( kind == 'S' )
+            {
+                result = _UNSTREAM_CHECKED( PySet_New( NULL ) );
+            }
+            else
+            {
+                result = _UNSTREAM_CHECKED( PyFrozenSet_New( NULL ) );
+            }
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyObject *element = _UNSTREAM_VALUE( buffer );
+
+                _UNSTREAM_CHECK_STATUS( PySet_Add( result, element ) );
+
+                Py_DECREF( element );
+            }
+
+            assert( PySet_Size( result ) == size );
+
+            break;
+        }
+#if PYTHON_VERSION < 300
+        case 'i':
+        {
+            // Zig-zag encoded, the lowest bit is the sign. The magnitude is
+            // taken before negating, so the smallest value doesn't overflow.
+            unsigned long long value = _UNSTREAM_VARINT( buffer );
+            long magnitude = (long)( value >> 1 );
+
+            result = _UNSTREAM_CHECKED( PyInt_FromLong( ( value & 1 ) ? -magnitude - 1 : magnitude ) );
+            break;
+        }
+#endif
+        case 'l':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            result = _UNSTREAM_CHECKED( _PyLong_FromByteArray( *buffer, size, 1, 1 ) );
+            *buffer += size;
+
+            break;
+        }
+        case 'f':
+        {
+            double value = _PyFloat_Unpack8( *buffer, 1 );
+            *buffer += 8;
+
+            result = _UNSTREAM_CHECKED( PyFloat_FromDouble( value ) );
+            break;
+        }
+        case 'j':
+        {
+            double real = _PyFloat_Unpack8( *buffer, 1 );
+            double imag = _PyFloat_Unpack8( *buffer + 8, 1 );
+            *buffer += 16;
+
+            result = _UNSTREAM_CHECKED( PyComplex_FromDoubles( real, imag ) );
+            break;
+        }
+        case 'b':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            result = _UNSTREAM_CHECKED( PyBytes_FromStringAndSize( (char const *)*buffer, size ) );
+            *buffer += size;
+
+            break;
+        }
+        case 'u':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
 
-    PyObject *result = PyObject_CallFunction(
-        function_pickle_loads,
 #if PYTHON_VERSION < 300
-        (char *)"(s#)", // TODO: Why the ()
+            result = _UNSTREAM_CHECKED( PyUnicode_DecodeUTF8( (char const *)*buffer, size, NULL ) );
 #else
-        (char *)"y#",
+            result = _UNSTREAM_CHECKED( PyUnicode_DecodeUTF8( (char const *)*buffer, size, "surrogatepass" ) );
 #endif
-        buffer,
-        size
-    );
+            *buffer += size;
 
-    if (unlikely( result == NULL ))
-    {
-        PyErr_Print();
+            break;
+        }
+        case 'N':
+            result = (PyObject *)Py_TYPE( Py_None );
+            Py_INCREF( result );
+            break;
+        case 'Y':
+        {
+            Py_ssize_t size = _UNSTREAM_SIZE( buffer );
+
+            PyObject *name = UNSTREAM_STRING( *buffer, size, true );
+            *buffer += size;
+
+            result = _UNSTREAM_CHECKED( PyDict_GetItem( (PyObject *)dict_builtin, name ) );
+            Py_INCREF( result );
+
+            Py_DECREF( name );
+            break;
+        }
+        default:
+            result = NULL;
+            NUITKA_CANNOT_GET_HERE( UNSTREAM_CONSTANT );
     }
 
     CHECK_OBJECT( result );
@@ -1366,6 +1667,20 @@ PyObject *UNSTREAM_CONSTANT( unsigned char const *buffer, Py_ssize_t size )
     return result;
 }
 
+PyObject *UNSTREAM_CONSTANT( unsigned char const *buffer, Py_ssize_t size )
+{
+    assert( buffer );
+
+    NUITKA_MAY_BE_UNUSED unsigned char const *end = buffer + size;
+
+    PyObject *result = _UNSTREAM_VALUE( &buffer );
+
+    assert( buffer == end );
+    assert( !ERROR_OCCURRED() );
+
+    return result;
+}
+
 #if PYTHON_VERSION < 300
 PyObject *UNSTREAM_UNICODE( unsigned char const *buffer, Py_ssize_t size )
 {
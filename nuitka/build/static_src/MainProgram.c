@@ -193,10 +193,103 @@ extern void _initCompiledCoroutineType();
 extern void _initCompiledCoroutineWrapperType();
 #endif
 
-#if defined(_NUITKA_CONSTANTS_FROM_RESOURCE)
+#if defined(_NUITKA_CONSTANTS_FROM_RESOURCE) || defined(_NUITKA_CONSTANTS_FROM_FILE)
 unsigned char const* constant_bin = NULL;
 #endif
 
+#if defined(_NUITKA_CONSTANTS_FROM_FILE)
+
+#if !defined(_WIN32)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#endif
+
+/* The constants blob is a file next to the binary, which is mapped read only,
+ * so its pages are loaded only when used, and shared by all processes running
+ * the program.
+ */
+static unsigned char const *mapConstantsFile( void )
+{
+    char filename[ MAXPATHLEN + 1 ];
+
+    snprintf(
+        filename,
+        sizeof( filename ),
+        "%s%c%s",
+        getBinaryDirectoryHostEncoded(),
+        SEP,
+        NUITKA_CONSTANTS_FILENAME
+    );
+
+    void *result = NULL;
+
+#if defined(_WIN32)
+    HANDLE file_handle = CreateFile(
+        filename,
+        GENERIC_READ,
+        FILE_SHARE_READ,
+        NULL,
+        OPEN_EXISTING,
+        FILE_ATTRIBUTE_NORMAL,
+        NULL
+    );
+
+    if ( file_handle != INVALID_HANDLE_VALUE )
+    {
+        HANDLE mapping_handle = CreateFileMapping(
+            file_handle,
+            NULL,
+            PAGE_READONLY,
+            0,
+            0,
+            NULL
+        );
+
+        if ( mapping_handle != NULL )
+        {
+            result = MapViewOfFile( mapping_handle, FILE_MAP_READ, 0, 0, 0 );
+        }
+    }
+#else
+    int file_handle = open( filename, O_RDONLY );
+
+    if ( file_handle != -1 )
+    {
+        struct stat file_stat;
+
+        if ( fstat( file_handle, &file_stat ) == 0 )
+        {
+            // Mapping nothing is not allowed, but then nothing is read either.
+            result = mmap(
+                NULL,
+                file_stat.st_size > 0 ? file_stat.st_size : 1,
+                PROT_READ,
+                MAP_SHARED,
+                file_handle,
+                0
+            );
+
+            if ( result == MAP_FAILED )
+            {
+                result = NULL;
+            }
+        }
+
+        close( file_handle );
+    }
+#endif
+
+    if (unlikely( result == NULL ))
+    {
+        fprintf( stderr, "Error, cannot map constants file '%s'.\n", filename );
+        exit( 1 );
+    }
+
+    return (unsigned char const *)result;
+}
+#endif
+
 
 #ifdef _NUITKA_WINMAIN_ENTRY_POINT
 int __stdcall WinMain( HINSTANCE hInstance, HINSTANCE hPrevInstance, char* lpCmdLine, int nCmdShow )
@@ -235,7 +328,7 @@ int main( int argc, char **argv )
 
     /* On Windows we support loading the constants blob from an embedded
      * resource. On Linux, where possible this is done automatically by
-     * the linker already.
+     * the linker already. Or it is mapped from a file next to the binary.
      */
 #if defined(_NUITKA_CONSTANTS_FROM_RESOURCE)
     NUITKA_PRINT_TRACE("main(): Loading constants blob from Windows resource.");
@@ -250,6 +343,12 @@ int main( int argc, char **argv )
     assert( constant_bin );
 #endif
 
+#if defined(_NUITKA_CONSTANTS_FROM_FILE)
+    NUITKA_PRINT_TRACE("main(): Mapping constants blob from file.");
+
+    constant_bin = mapConstantsFile();
+#endif
+
 
 #ifdef _NUITKA_STANDALONE
     NUITKA_PRINT_TRACE("main(): Prepare standalone environment.");
@@ -43,7 +43,9 @@ static
 #endif
 PyObject *metapath_based_loader = NULL;
 
+// The table of modules is sorted by name, for binary search.
 static struct Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
+static Py_ssize_t loader_entries_count = 0;
 
 static char *_kwlist[] = {
     (char *)"fullname",
@@ -51,22 +53,99 @@ static char *_kwlist[] = {
     NULL
 };
 
+static int compareModuleNames( void const *a, void const *b )
+{
+    return strcmp( *(char const **)a, *(char const **)b );
+}
+
+// The frozen modules table of CPython is not sorted, so an index of it is made
+// when first used, and again whenever it is replaced, or entries were added or
+// removed in place.
+static struct _frozen const *frozen_index_table = NULL;
+static char const **frozen_index = NULL;
+static size_t frozen_index_count = 0;
+
 static bool hasFrozenModule( char const *name )
 {
-    for ( struct _frozen const *p = PyImport_FrozenModules; ; p++ )
+    // Counting is cheap compared to comparing names.
+    size_t count = 0;
+
+    while ( PyImport_FrozenModules[ count ].name != NULL )
+    {
+        count++;
+    }
+
+    if ( frozen_index_table != PyImport_FrozenModules || frozen_index_count != count )
     {
-        if ( p->name == NULL )
+        free( frozen_index );
+        frozen_index = (char const **)malloc( sizeof( char const * ) * ( count + 1 ) );
+
+        if (unlikely( frozen_index == NULL ))
         {
+            frozen_index_table = NULL;
+            frozen_index_count = 0;
+
+            // Without memory for the index, search the table itself.
+            for ( size_t i = 0; i < count; i++ )
+            {
+                if ( strcmp( PyImport_FrozenModules[ i ].name, name ) == 0 )
+                {
+                    return true;
+                }
+            }
+
             return false;
         }
 
-        if ( strcmp( p->name, name ) == 0 )
+        for ( size_t i = 0; i < count; i++ )
         {
-            break;
+            frozen_index[ i ] = PyImport_FrozenModules[ i ].name;
         }
+
+        qsort( frozen_index, count, sizeof( char const * ), compareModuleNames );
+
+        frozen_index_table = PyImport_FrozenModules;
+        frozen_index_count = count;
     }
 
-    return true;
+    return bsearch(
+        &name,
+        frozen_index,
+        frozen_index_count,
+        sizeof( char const * ),
+        compareModuleNames
+    ) != NULL;
+}
+
+static struct Nuitka_MetaPathBasedLoaderEntry *findEntry( char const *name )
+{
+    assert( loader_entries );
+
+    // Find the first entry not before the name, for duplicates, the first one
+    // is used.
+    Py_ssize_t low = 0;
+    Py_ssize_t high = loader_entries_count;
+
+    while ( low < high )
+    {
+        Py_ssize_t middle = ( low + high ) / 2;
+
+        if ( strcmp( loader_entries[ middle ].name, name ) < 0 )
+        {
+            low = middle + 1;
+        }
+        else
+        {
+            high = middle;
+        }
+    }
+
+    if ( low < loader_entries_count && strcmp( loader_entries[ low ].name, name ) == 0 )
+    {
+        return &loader_entries[ low ];
+    }
+
+    return NULL;
 }
 
 
@@ -96,20 +175,13 @@ static PyObject *_path_unfreezer_find_module( PyObject *self, PyObject *args, Py
         PySys_WriteStderr( "import %s # considering responsibility\n", name );
     }
 
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-
-    while ( current->name != NULL )
+    if ( findEntry( name ) != NULL )
     {
-        if ( strcmp( name, current->name ) == 0 )
+        if ( Py_VerboseFlag )
         {
-            if ( Py_VerboseFlag )
-            {
-                PySys_WriteStderr( "import %s # claimed responsibility (compiled)\n", name );
-            }
-            return INCREASE_REFCOUNT( metapath_based_loader );
+            PySys_WriteStderr( "import %s # claimed responsibility (compiled)\n", name );
         }
-
-        current++;
+        return INCREASE_REFCOUNT( metapath_based_loader );
     }
 
     if ( hasFrozenModule( name ) )
@@ -328,25 +400,6 @@ PyObject *callIntoShlibModule( const char *full_name, const char *filename )
 #endif
 
 
-static struct Nuitka_MetaPathBasedLoaderEntry *findEntry( char const *name )
-{
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-
-    assert( current );
-
-    while ( current->name != NULL )
-    {
-        if ( strcmp( name, current->name ) == 0 )
-        {
-            return current;
-        }
-
-        current++;
-    }
-
-    return NULL;
-}
-
 static void loadTriggeredModule( char const *name, char const *trigger_name )
 {
     char trigger_module_name[2048];
@@ -432,7 +485,7 @@ static PyObject *loadModule( PyObject *module_name, struct Nuitka_MetaPathBasedL
     if ( ( entry->flags & NUITKA_BYTECODE_FLAG ) != 0 )
     {
         PyObject *code_object = PyMarshal_ReadObjectFromString(
-            (char *)&constant_bin[ entry->bytecode_start ],
+            (char *)CONSTANT_BIN( entry->bytecode_start ),
             entry->bytecode_size
         );
 
@@ -804,6 +857,14 @@ void registerMetaPathBasedUnfreezer( struct Nuitka_MetaPathBasedLoaderEntry *_lo
 
     loader_entries = _loader_entries;
 
+    while ( loader_entries[ loader_entries_count ].name != NULL )
+    {
+        // The code generation sorted these, binary search relies on it.
+        assert( loader_entries_count == 0 || strcmp( loader_entries[ loader_entries_count - 1 ].name, loader_entries[ loader_entries_count ].name ) <= 0 );
+
+        loader_entries_count++;
+    }
+
     // Build the dictionary of the "loader" object, which needs to have two
     // methods "find_module" where we acknowledge that we are capable of loading
     // the module, and "load_module" that does the actual thing.
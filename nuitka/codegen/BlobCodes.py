@@ -20,30 +20,256 @@
 This module offers means to store and encode binary blobs in C++ semi
 efficiently. The "StreamData" class is used in two places, for constants
 and for freezing of bytecode.
+
+Constants that cannot be created from C literals are streamed in a format of
+Nuitka, decoded by "UNSTREAM_CONSTANT" in "CompiledCodeHelpers.c". Every value
+starts with a type character, followed by its size as a variable length value
+with 7 bits per byte, if it has one, and then its contents, which for
+containers are values again.
 """
 
+import struct
+import sys
+import zlib
+
+from nuitka.__past__ import iterItems, long, unicode  # pylint: disable=W0622
+from nuitka.PythonVersions import python_version
+
+if python_version >= 300:
+    _builtins_module = sys.modules["builtins"]
+else:
+    _builtins_module = sys.modules["__builtin__"]
+
+_container_kinds = {
+    tuple     : b'T',
+    list      : b'L',
+    set       : b'S',
+    frozenset : b'P'
+}
+
+
+def _getSizeBytes(size):
+    result = bytearray()
+
+    while True:
+        if size < 0x80:
+            result.append(size)
+            break
+
+        result.append((size & 0x7f) | 0x80)
+        size >>= 7
+
+    return bytes(result)
+
+
+def _getLongBytes(value):
+    """ The value as signed little endian bytes, as many as needed. """
+
+    # Python2.6 has no "bit_length" yet, for zero this is one bit too much,
+    # which doesn't change the size.
+    bit_length = len(bin(abs(value))) - 2
+
+    size = (bit_length + 8) // 8
+
+    if value < 0:
+        value += 1 << (size * 8)
+
+    result = bytearray()
+
+    for _count in range(size):
+        result.append(value & 0xff)
+        value >>= 8
+
+    return bytes(result)
+
+
+def _streamConstant(constant_value, write):
+    # Many cases to deal with, pylint: disable=R0912
+
+    constant_type = type(constant_value)
+
+    if constant_value is None:
+        write(b'n')
+    elif constant_value is True:
+        write(b't')
+    elif constant_value is False:
+        write(b'F')
+    elif constant_value is Ellipsis:
+        write(b'.')
+    elif constant_type in _container_kinds:
+        write(_container_kinds[constant_type])
+        write(_getSizeBytes(len(constant_value)))
+
+        for element in constant_value:
+            _streamConstant(element, write)
+    elif constant_type is dict:
+        write(b'D')
+        write(_getSizeBytes(len(constant_value)))
+
+        for key, value in iterItems(constant_value):
+            _streamConstant(key, write)
+            _streamConstant(value, write)
+    elif constant_type is int and python_version < 300:
+        # Python2: Zig-zag encoded, so small negative values are short too.
+        write(b'i')
+        write(
+            _getSizeBytes(
+                constant_value * 2 if constant_value >= 0 else
+                -constant_value * 2 - 1
+            )
+        )
+    elif constant_type is long:
+        encoded = _getLongBytes(constant_value)
+
+        write(b'l')
+        write(_getSizeBytes(len(encoded)))
+        write(encoded)
+    elif constant_type is float:
+        write(b'f')
+        write(struct.pack("<d", constant_value))
+    elif constant_type is complex:
+        write(b'j')
+        write(struct.pack("<dd", constant_value.real, constant_value.imag))
+    elif constant_type is bytes:
+        write(b'b')
+        write(_getSizeBytes(len(constant_value)))
+        write(constant_value)
+    elif constant_type is unicode:
+        # Python3: Lone surrogates are what cannot be encoded as UTF-8, these
+        # are passed, and Python2 does that anyway.
+        if python_version >= 300:
+            encoded = constant_value.encode("utf-8", "surrogatepass")
+        else:
+            encoded = constant_value.encode("utf-8")
+
+        write(b'u')
+        write(_getSizeBytes(len(encoded)))
+        write(encoded)
+    elif constant_type is type and \
+         constant_value is type(None):
+        write(b'N')
+    elif constant_type is type and \
+         getattr(_builtins_module, constant_value.__name__, None) is constant_value:
+        encoded = constant_value.__name__.encode("utf-8")
+
+        write(b'Y')
+        write(_getSizeBytes(len(encoded)))
+        write(encoded)
+    else:
+        raise TypeError(
+            "Cannot stream constant of type %s" % constant_type.__name__
+        )
+
+
+def getStreamedConstant(constant_value):
+    """ Get the bytes for "UNSTREAM_CONSTANT" to create a constant value.
+
+    """
+    result = []
+
+    _streamConstant(constant_value, result.append)
+
+    return b"".join(result)
+
 class StreamData:
     def __init__(self):
         self.stream_data = bytes()
 
+        # The ranges of the stream that values are read from, and if they must
+        # be readable without decompression.
+        self.stream_ranges = set()
+
     def getStreamDataCode(self, value, fixed_size = False):
         offset = self.getStreamDataOffset(value)
 
         if fixed_size:
-            return "&constant_bin[ %d ]" % offset
+            return "CONSTANT_BIN( %d )" % offset
         else:
-            return "&constant_bin[ %d ], %d" % (
+            return "CONSTANT_BIN( %d ), %d" % (
                 offset,
                 len(value)
             )
 
-    def getStreamDataOffset(self, value):
+    def getStreamDataOffset(self, value, uncompressed = False):
+        """ Get the offset of a value in the stream, adding it if necessary.
+
+            Values that are used before Python is initialized, e.g. frozen
+            modules, must be "uncompressed", as that needs "zlib".
+        """
         offset = self.stream_data.find(value)
         if offset == -1:
             offset = len(self.stream_data)
             self.stream_data += value
 
+        self.stream_ranges.add((offset, offset + len(value), uncompressed))
+
         return offset
 
     def getBytes(self):
         return self.stream_data
+
+    def _getChunks(self, chunk_size):
+        # Values must not span chunks, so they are read from one chunk only,
+        # and uncompressed values are put in chunks of their own.
+        chunks = []
+
+        for start, end, uncompressed in sorted(self.stream_ranges):
+            if chunks and start < chunks[-1][1]:
+                chunks[-1][1] = max(chunks[-1][1], end)
+                chunks[-1][2] = chunks[-1][2] or uncompressed
+            elif chunks and end - chunks[-1][0] <= chunk_size and \
+                 chunks[-1][2] == uncompressed:
+                chunks[-1][1] = end
+            else:
+                chunks.append(
+                    [chunks[-1][1] if chunks else 0, end, uncompressed]
+                )
+
+        if chunks:
+            chunks[-1][1] = len(self.stream_data)
+
+        return chunks
+
+    def getCompressedBytes(self, chunk_size):
+        """ Get the stream compressed in chunks, for "getConstantsBlobData".
+
+            The blob starts with the number of chunks, followed by a table of
+            their offset and size in the stream, offset and size in the blob,
+            and if compressed, as 32 bits values each, then their data. The
+            chunks are decompressed as a whole, so they are kept small, but
+            still large enough to compress well.
+        """
+        chunks = self._getChunks(chunk_size)
+
+        header_size = 4 + 20 * len(chunks)
+
+        table = [struct.pack("<I", len(chunks))]
+        chunk_data = []
+        blob_offset = header_size
+
+        for start, end, uncompressed in chunks:
+            data = self.stream_data[start:end]
+
+            if not uncompressed:
+                compressed_data = zlib.compress(data, 9)
+
+                if len(compressed_data) < len(data):
+                    data = compressed_data
+                else:
+                    uncompressed = True
+
+            table.append(
+                struct.pack(
+                    "<IIIII",
+                    start,
+                    end - start,
+                    blob_offset,
+                    len(data),
+                    0 if uncompressed else 1
+                )
+            )
+            chunk_data.append(data)
+
+            blob_offset += len(data)
+
+        return b"".join(table + chunk_data)
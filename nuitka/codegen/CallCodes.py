@@ -304,6 +304,15 @@ def getCallCodeNoArgs(to_name, called_name, needs_check, emit, context):
 quick_calls_used = set([1, 2, 3])
 quick_instance_calls_used = set()
 
+def getUsedQuickCalls():
+    return tuple(quick_calls_used), tuple(quick_instance_calls_used)
+
+def addUsedQuickCalls(quick_calls):
+    calls_used, instance_calls_used = quick_calls
+
+    quick_calls_used.update(calls_used)
+    quick_instance_calls_used.update(instance_calls_used)
+
 def getCallCodePosArgsQuick(to_name, called_name, arg_names, needs_check,
                             emit, context):
 
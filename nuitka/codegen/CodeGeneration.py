@@ -26,6 +26,9 @@ branches and make a code block out of it. But it doesn't contain any target
 language syntax.
 """
 
+import os
+from logging import debug
+
 from nuitka import Options
 from nuitka.__past__ import iterItems
 from nuitka.PythonVersions import python_version
@@ -63,7 +66,13 @@ from .BuiltinCodes import (
     generateBuiltinXrange2Code,
     generateBuiltinXrange3Code
 )
-from .CallCodes import generateCallCode, getCallsCode, getCallsDecls
+from .CallCodes import (
+    addUsedQuickCalls,
+    generateCallCode,
+    getCallsCode,
+    getCallsDecls,
+    getUsedQuickCalls
+)
 from .ClassCodes import (
     generateBuiltinIsinstanceCode,
     generateBuiltinSuperCode,
@@ -178,7 +187,9 @@ from .LoopCodes import (
 from .ModuleCodes import (
     generateModuleFileAttributeCode,
     getModuleCode,
-    getModuleValues
+    getModulePartCodes,
+    getModuleValues,
+    splitFunctionCodes
 )
 from .OperationCodes import (
     generateOperationBinaryCode,
@@ -227,6 +238,12 @@ from .VariableCodes import (
 )
 from .YieldCodes import generateYieldCode, generateYieldFromCode
 
+# Work around for CPython 3.x removal of "cpickle".
+try:
+    import cPickle as cpickle
+except ImportError:
+    import pickle as cpickle
+
 _generated_functions = {}
 
 
@@ -464,7 +481,21 @@ def prepareModuleCode(global_context, module, module_name):
     for _identifier, code in sorted(iterItems(context.getDeclarations())):
         function_decl_codes.append(code)
 
-    function_body_codes = "\n\n".join(function_body_codes)
+    # Large modules are split into parts, to be compiled in parallel.
+    if Options.isSplitModules() and not module.isInternalModule():
+        function_body_parts = splitFunctionCodes(
+            function_codes = function_body_codes,
+            size_limit     = Options.getSplitModulesSizeLimit()
+        )
+    else:
+        function_body_parts = [function_body_codes]
+
+    function_body_codes = "\n\n".join(function_body_parts[0])
+    function_part_codes = [
+        "\n\n".join(function_body_part)
+        for function_body_part in
+        function_body_parts[1:]
+    ]
     function_decl_codes = "\n\n".join(function_decl_codes)
 
     template_values = getModuleValues(
@@ -473,6 +504,7 @@ def prepareModuleCode(global_context, module, module_name):
         codes               = codes.codes,
         function_decl_codes = function_decl_codes,
         function_body_codes = function_body_codes,
+        function_part_codes = function_part_codes,
         temp_variables      = module.getTempVariables(),
         is_main_module      = module.isMainModule(),
         is_internal_module  = module.isInternalModule(),
@@ -485,10 +517,177 @@ def prepareModuleCode(global_context, module, module_name):
     return template_values, context
 
 
-def generateModuleCode(module_context, template_values):
+# Modules and global context of the worker processes, inherited by forking.
+_worker_modules = ()
+_worker_global_context = None
+
+def _prepareModuleCodeInWorker(module_index):
+    """ Prepare the code of a module in a worker process.
+
+        Returns the template values, the state of the module context, and the
+        constants usage, pickled, or None if that is not possible, then the
+        main process has to do it.
+    """
+    module = _worker_modules[module_index]
+    global_context = _worker_global_context
+
+    constant_use_count = dict(global_context.constant_use_count)
+    constants = set(global_context.constants)
+
+    try:
+        template_values, context = prepareModuleCode(
+            global_context = global_context,
+            module         = module,
+            module_name    = module.getFullName()
+        )
+
+        # The changes of the global context done for this module.
+        constant_values = {}
+        constant_use_deltas = {}
+
+        for key, count in iterItems(global_context.constant_use_count):
+            delta = count - constant_use_count.get(key, 0)
+
+            if delta:
+                constant_values[key] = global_context.constants[key]
+                constant_use_deltas[key] = delta
+
+        for key in global_context.constants:
+            if key not in constants:
+                constant_values[key] = global_context.constants[key]
+
+        return cpickle.dumps(
+            (
+                template_values,
+                context.getConstants(),
+                context.needsModuleFilenameObject(),
+                context.code_objects,
+                context.helper_codes,
+                context.declaration_codes,
+                constant_values,
+                constant_use_deltas,
+                getUsedQuickCalls()
+            ),
+            cpickle.HIGHEST_PROTOCOL
+        )
+    except Exception as e: # Catching anything, main process will do it, pylint: disable=W0703
+        debug(
+            "Not preparing code of module '%s' in worker: %s" % (
+                module.getFullName(),
+                e
+            )
+        )
+
+        return None
+
+
+def _adoptPreparedModuleCode(global_context, module, data):
+    template_values, constants, needs_module_filename_object, code_objects, \
+      helper_codes, declaration_codes, constant_values, constant_use_deltas, \
+      quick_calls = cpickle.loads(data)
+
+    for key, value in iterItems(constant_values):
+        if key not in global_context.constants:
+            global_context.constants[key] = value
+
+    for key, delta in iterItems(constant_use_deltas):
+        global_context.constant_use_count[key] = \
+          global_context.constant_use_count.get(key, 0) + delta
+
+    addUsedQuickCalls(quick_calls)
+
+    context = Contexts.PythonModuleContext(
+        module         = module,
+        module_name    = module.getFullName(),
+        code_name      = module.getCodeName(),
+        filename       = module.getFilename(),
+        global_context = global_context
+    )
+
+    # The module context as the worker left it, e.g. the parts of modules
+    # split into parts declare the code objects too.
+    context.constants.update(constants)
+    context.code_objects.update(code_objects)
+    context.helper_codes.update(helper_codes)
+    context.declaration_codes.update(declaration_codes)
+
+    if needs_module_filename_object:
+        context.markAsNeedsModuleFilenameObject()
+
+    return template_values, context
+
+
+def prepareModulesCode(global_context, modules):
+    """ Prepare the code of compiled modules, potentially in worker processes.
+
+        Returns a dictionary of modules to template values and module context
+        as "prepareModuleCode" gives them. With worker processes, the constant
+        usages of the modules are merged into the global context afterwards.
+    """
+
+    # Using global here, as forked processes inherit it, pylint: disable=W0603
+    global _worker_modules, _worker_global_context
+
+    result = {}
+
+    jobs = Options.getCodeGenerationJobLimit()
+
+    if jobs > 1 and len(modules) > 1 and hasattr(os, "fork"):
+        # Only imported when needed, as it's quite costly.
+        import multiprocessing
+
+        _worker_modules = tuple(modules)
+        _worker_global_context = global_context
+
+        pool = multiprocessing.Pool(
+            processes = min(jobs, len(modules))
+        )
+
+        try:
+            results = pool.map(
+                _prepareModuleCodeInWorker,
+                range(len(modules)),
+                chunksize = 1
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        _worker_modules = ()
+        _worker_global_context = None
+
+        for module, data in zip(modules, results):
+            if data is not None:
+                result[module] = _adoptPreparedModuleCode(
+                    global_context = global_context,
+                    module         = module,
+                    data           = data
+                )
+
+    for module in modules:
+        if module not in result:
+            result[module] = prepareModuleCode(
+                global_context = global_context,
+                module         = module,
+                module_name    = module.getFullName(),
+            )
+
+    return result
+
+
+def generateModuleCode(module_context, template_values, header_name):
     return getModuleCode(
         module_context  = module_context,
-        template_values = template_values
+        template_values = template_values,
+        header_name     = header_name
+    )
+
+
+def generateModulePartCodes(module_context, template_values, header_name):
+    return getModulePartCodes(
+        module_context  = module_context,
+        template_values = template_values,
+        header_name     = header_name
     )
 
 
@@ -31,7 +31,7 @@ def getCodeObjectsDeclCode(context):
     statements = []
 
     for _code_object_key, code_identifier in context.getCodeObjects():
-        declaration = "static PyCodeObject *%s;" % code_identifier
+        declaration = "NUITKA_LOCAL_MODULE PyCodeObject *%s;" % code_identifier
 
         statements.append(declaration)
 
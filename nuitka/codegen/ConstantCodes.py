@@ -49,11 +49,13 @@ from nuitka.Constants import (
 )
 from nuitka.PythonVersions import python_version
 
-from .BlobCodes import StreamData
+from .BlobCodes import StreamData, getStreamedConstant
 from .Emission import SourceCodeCollector
 from .Indentation import indented
-from .Pickling import getStreamedConstant
-from .templates.CodeTemplatesConstants import template_constants_reading
+from .templates.CodeTemplatesConstants import (
+    template_constants_reading,
+    template_module_shared_constants
+)
 
 
 def generateConstantReferenceCode(to_name, expression, emit, context):
@@ -142,7 +144,8 @@ def _getUnstreamCode2(constant_value):
 def _getUnstreamCode(constant_value, constant_identifier):
     """ Get code to assign given constant value to an identifier from a stream.
 
-        This uses pickle, and usage should be minimized.
+        This is for values that cannot be created from C literals, see
+        "BlobCodes" for the format.
     """
 
     return "%s = UNSTREAM_CONSTANT( %s );" % (
@@ -161,6 +164,11 @@ min_signed_long = -(2**(sizeof_long*8-1)-1)
 
 done = set()
 
+# Shared constants that are not created with the global ones, but by the modules
+# that use them, whichever comes first, and which of them were checked already.
+lazy_constants = set()
+lazy_checked = set()
+
 def _getConstantInitValueCode(constant_value, constant_type):
     """ Return code, if possible, to create a constant.
 
@@ -174,7 +182,7 @@ def _getConstantInitValueCode(constant_value, constant_type):
     if constant_type is unicode:
         # Python3: Strings that can be encoded as UTF-8 are done more or less
         # directly. When they cannot be expressed as UTF-8, that is rare not we
-        # can indeed use pickling.
+        # can indeed stream it.
         try:
             encoded = constant_value.encode("utf-8")
 
@@ -327,6 +335,37 @@ def _addConstantInitCode(context, emit, check, constant_type, constant_value,
     if constant_identifier in done:
         return
 
+    if constant_identifier in lazy_constants:
+        # Another module may have created it already, then nothing is to be
+        # done, not even for the constants it contains.
+        lazy_emit = SourceCodeCollector()
+        lazy_check = SourceCodeCollector()
+
+        _addNamedConstantInitCode(context, lazy_emit, lazy_check, constant_type,
+                                  constant_value, constant_identifier,
+                                  module_level)
+
+        emit("if ( %s == NULL )" % constant_identifier)
+        emit('{')
+        emit(indented(lazy_emit.codes))
+        emit('}')
+
+        if lazy_check.codes and constant_identifier not in lazy_checked:
+            lazy_checked.add(constant_identifier)
+
+            check("if ( %s != NULL )" % constant_identifier)
+            check('{')
+            check(indented(lazy_check.codes))
+            check('}')
+    else:
+        _addNamedConstantInitCode(context, emit, check, constant_type,
+                                  constant_value, constant_identifier,
+                                  module_level)
+
+
+def _addNamedConstantInitCode(context, emit, check, constant_type,
+                              constant_value, constant_identifier,
+                              module_level):
     if Options.shallTraceExecution():
         emit("""NUITKA_PRINT_TRACE("Creating constant: %s");""" % constant_identifier)
 
@@ -478,7 +517,7 @@ CHECK_OBJECT( const_int_pos_1 );
     elif constant_type is str:
         # Python3: Strings that can be encoded as UTF-8 are done more or less
         # directly. When they cannot be expressed as UTF-8, that is rare not we
-        # can indeed use pickling.
+        # can indeed stream it.
         assert str is bytes
 
         if len(constant_value) == 1:
@@ -843,18 +882,18 @@ CHECK_OBJECT( const_int_pos_1 );
     assert False, (type(constant_value), constant_value, constant_identifier)
 
 
-def getConstantsInitCode(context):
+def getConstantsInitCode(context, constant_identifiers, check):
     emit = SourceCodeCollector()
 
-    check = SourceCodeCollector()
-
     # Sort items by length and name, so we are deterministic and pretty.
     sorted_constants = sorted(
-        iterItems(context.getConstants()),
-        key = lambda k: (len(k[0]), k[0])
+        constant_identifiers,
+        key = lambda k: (len(k), k)
     )
 
-    for constant_identifier, constant_value in sorted_constants:
+    for constant_identifier in sorted_constants:
+        constant_value = context.constants[constant_identifier]
+
         _addConstantInitCode(
             emit                = emit,
             check               = check,
@@ -865,7 +904,7 @@ def getConstantsInitCode(context):
             context             = context
         )
 
-    return emit.codes, check.codes
+    return emit.codes
 
 
 def getConstantsDeclCode(context):
@@ -1021,9 +1060,11 @@ def getConstantInitCodes(module_context):
     inits = Emission.SourceCodeCollector()
     checks = Emission.SourceCodeCollector()
 
+    # Sort by length and name, so we are deterministic, module constants are
+    # a set.
     sorted_constants = sorted(
         module_context.getConstants(),
-        key = lambda k: (len(k[0]), k[0])
+        key = lambda k: (len(k), k)
     )
 
     global_context = module_context.global_context
@@ -1122,17 +1163,74 @@ def allocateNestedConstants(module_context):
             considerForDeferral(constant_value)
 
 
-def getConstantsDefinitionCode(context):
+def _isEagerModule(module_context):
+    # The main module is run right away, and the internal module has functions
+    # that other modules use, possibly before it was initialized.
+    module = module_context.module
+
+    return module.isMainModule() or module.isInternalModule()
+
+
+def getConstantsDefinitionCode(context, module_contexts):
     """ Create the code code "__constants.cpp" file.
 
         This needs to create code to make all global constants (used in more
         than one module) and create them.
 
+        Only constants of the static code, and of modules that are sure to be
+        used, are created with the global ones. The others are created by
+        the modules using them, when their init code runs, so constants of
+        modules that are never imported are not created at all.
     """
-    constant_inits, constant_checks = getConstantsInitCode(
-        context = context
+    constant_checks = SourceCodeCollector()
+
+    eager_constants = set(context.getDefaultConstants())
+
+    for module_context in module_contexts:
+        if _isEagerModule(module_context):
+            eager_constants.update(module_context.getConstants())
+
+    constant_inits = getConstantsInitCode(
+        context              = context,
+        constant_identifiers = eager_constants,
+        check                = constant_checks
+    )
+
+    # Everything created eagerly, including nested constants, is in "done" now,
+    # the other shared constants are created by their modules.
+    eager_done = set(done)
+
+    lazy_constants.update(
+        constant_identifier
+        for constant_identifier in context.getConstants()
+        if constant_identifier not in eager_done
+        if context.getConstantUseCount(constant_identifier) != 1
     )
 
+    module_constant_codes = []
+
+    for module_context in sorted(module_contexts,
+                                 key = lambda c: c.getModuleCodeName()):
+        done.clear()
+        done.update(eager_done)
+
+        module_constant_inits = getConstantsInitCode(
+            context              = context,
+            constant_identifiers = [
+                constant_identifier
+                for constant_identifier in module_context.getConstants()
+                if constant_identifier in lazy_constants
+            ],
+            check                = constant_checks
+        )
+
+        module_constant_codes.append(
+            template_module_shared_constants % {
+                "module_identifier"     : module_context.getModuleCodeName(),
+                "module_constant_inits" : indented(module_constant_inits)
+            }
+        )
+
     constant_declarations = getConstantsDeclCode(
         context = context
     )
@@ -1145,6 +1243,7 @@ def getConstantsDefinitionCode(context):
     return template_constants_reading % {
         "constant_declarations" : '\n'.join(constant_declarations),
         "constant_inits"        : indented(constant_inits),
-        "constant_checks"       : indented(constant_checks),
+        "constant_checks"       : indented(constant_checks.codes),
+        "module_constant_codes" : '\n'.join(module_constant_codes),
         "sys_executable"        : sys_executable
     }
@@ -447,8 +447,12 @@ class PythonGlobalContext:
         self.constants = {}
         self.constant_use_count = {}
 
+        # The constants that static code uses too, these are always created.
+        self.default_constants = set()
+
         for constant in _getConstantDefaultPopulation():
             code = self.getConstantCode(constant)
+            self.default_constants.add(code)
 
             # Force them to be global.
             self.countConstantUse(code)
@@ -503,6 +507,9 @@ class PythonGlobalContext:
     def getConstants(self):
         return self.constants
 
+    def getDefaultConstants(self):
+        return self.default_constants
+
 
 class FrameDeclarationsMixin:
     def __init__(self):
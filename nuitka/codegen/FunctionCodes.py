@@ -42,6 +42,7 @@ from .templates.CodeTemplatesFunction import (
     function_dict_setup,
     function_direct_body_template,
     template_function_body,
+    template_function_body_declaration,
     template_function_direct_declaration,
     template_function_exception_exit,
     template_function_make_declaration,
@@ -634,7 +635,9 @@ def generateFunctionDeclCode(function_body, context):
             context             = context
         )
     else:
-        return None
+        return template_function_body_declaration % {
+            "function_identifier" : function_body.getCodeName()
+        }
 
 
 def generateFunctionCallCode(to_name, expression, emit, context):
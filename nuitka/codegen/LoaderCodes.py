@@ -72,20 +72,26 @@ def getMetapathLoaderBodyCode(other_modules):
                 flags.append("NUITKA_PACKAGE_FLAG")
 
             metapath_loader_inittab.append(
-                template_metapath_loader_bytecode_module_entry % {
-                    "module_name" : other_module.getFullName(),
-                    "bytecode"    : stream_data.getStreamDataOffset(code_data),
-                    "size"        : len(code_data),
-                    "flags"       : " | ".join(flags)
-                }
+                (
+                    other_module.getFullName(),
+                    template_metapath_loader_bytecode_module_entry % {
+                        "module_name" : other_module.getFullName(),
+                        "bytecode"    : stream_data.getStreamDataOffset(code_data),
+                        "size"        : len(code_data),
+                        "flags"       : " | ".join(flags)
+                    }
+                )
             )
         else:
             metapath_loader_inittab.append(
-                getModuleMetapathLoaderEntryCode(
-                    module_name       = other_module.getFullName(),
-                    module_identifier = other_module.getCodeName(),
-                    is_shlib          = other_module.isPythonShlibModule(),
-                    is_package        = other_module.isCompiledPythonPackage()
+                (
+                    other_module.getFullName(),
+                    getModuleMetapathLoaderEntryCode(
+                        module_name       = other_module.getFullName(),
+                        module_identifier = other_module.getCodeName(),
+                        is_shlib          = other_module.isPythonShlibModule(),
+                        is_package        = other_module.isCompiledPythonPackage()
+                    )
                 )
             )
 
@@ -103,16 +109,29 @@ def getMetapathLoaderBodyCode(other_modules):
             flags.append("NUITKA_PACKAGE_FLAG")
 
         metapath_loader_inittab.append(
-            template_metapath_loader_bytecode_module_entry % {
-                "module_name" : uncompiled_module.getFullName(),
-                "bytecode"    : stream_data.getStreamDataOffset(code_data),
-                "size"        : len(code_data),
-                "flags"       : " | ".join(flags)
-            }
+            (
+                uncompiled_module.getFullName(),
+                template_metapath_loader_bytecode_module_entry % {
+                    "module_name" : uncompiled_module.getFullName(),
+                    "bytecode"    : stream_data.getStreamDataOffset(code_data),
+                    "size"        : len(code_data),
+                    "flags"       : " | ".join(flags)
+                }
+            )
         )
 
+    # The loader does a binary search for module names, so the table is sorted
+    # by them, in the order of "strcmp". Sorting is stable, so for duplicate
+    # names, the first one is still found first.
+    metapath_loader_inittab.sort(key = lambda entry: entry[0])
 
     return template_metapath_loader_body % {
         "metapath_module_decls"   : indented(metapath_module_decls, 0),
-        "metapath_loader_inittab" : indented(metapath_loader_inittab)
+        "metapath_loader_inittab" : indented(
+            [
+                entry_code
+                for _module_name, entry_code in
+                metapath_loader_inittab
+            ]
+        )
     }
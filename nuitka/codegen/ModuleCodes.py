@@ -35,9 +35,12 @@ from .ErrorCodes import (
 from .Indentation import indented
 from .templates.CodeTemplatesModules import (
     template_global_copyright,
+    template_header_guard,
     template_module_body_template,
     template_module_exception_exit,
-    template_module_noexception_exit
+    template_module_header,
+    template_module_noexception_exit,
+    template_module_part
 )
 from .VariableCodes import getLocalVariableInitCode
 
@@ -47,8 +50,9 @@ def getModuleAccessCode(context):
 
 
 def getModuleValues(context, module_name, module_identifier, codes,
-                    function_decl_codes, function_body_codes, temp_variables,
-                    is_main_module, is_internal_module):
+                    function_decl_codes, function_body_codes,
+                    function_part_codes, temp_variables, is_main_module,
+                    is_internal_module):
     # For the module code, lots of arguments and attributes come together.
     # pylint: disable=R0914
 
@@ -101,6 +105,8 @@ def getModuleValues(context, module_name, module_identifier, codes,
         "module_identifier"        : module_identifier,
         "module_functions_decl"    : function_decl_codes,
         "module_functions_code"    : function_body_codes,
+        "module_functions_parts"   : function_part_codes,
+        "module_header_include"    : "",
         "temps_decl"               : indented(local_var_inits),
         "module_code"              : indented(codes),
         "module_exit"              : module_exit,
@@ -117,25 +123,56 @@ def getModuleValues(context, module_name, module_identifier, codes,
     allocateNestedConstants(context)
 
     # Force internal module to not need constants init, by making all its
-    # constants be shared.
-    if is_internal_module:
+    # constants be shared. For modules split into parts, that also makes them
+    # usable from all parts.
+    if is_internal_module or function_part_codes:
         for constant in context.getConstants():
             context.global_context.countConstantUse(constant)
 
     return module_body_template_values
 
 
-def getModuleCode(module_context, template_values):
+def splitFunctionCodes(function_codes, size_limit):
+    """ Split the function codes of a module into parts of limited size.
+
+        Returns a list of lists of function codes, the first one stays in the
+        module code, the others become parts of their own. Functions are not
+        split, so a part can be larger than the limit.
+    """
+    result = [[]]
+    part_size = 0
+
+    for function_code in function_codes:
+        if part_size + len(function_code) > size_limit and result[-1]:
+            result.append([])
+            part_size = 0
+
+        result[-1].append(function_code)
+        part_size += len(function_code)
+
+    return result
+
+
+def getModuleCode(module_context, template_values, header_name):
+    """ Get the code of a module.
+
+        For modules split into parts, the header name is included, and
+        "getModulePartCodes" gives the codes of that and the parts.
+    """
     header = template_global_copyright % {
         "name"    : module_context.getName(),
         "version" : Options.getVersion(),
         "year"    : Options.getYear()
     }
 
+    if template_values["module_functions_parts"]:
+        template_values["module_header_include"] = \
+          '#include "%s"\n' % header_name
+
     decls, inits, checks = getConstantInitCodes(module_context)
 
     if module_context.needsModuleFilenameObject():
-        decls.append("static PyObject *module_filename_obj;")
+        decls.append("NUITKA_LOCAL_MODULE PyObject *module_filename_obj;")
 
     template_values["constant_decl_codes"] = indented(
         decls,
@@ -152,7 +189,68 @@ def getModuleCode(module_context, template_values):
         1
     )
 
-    return header + template_module_body_template % template_values
+    # The parts are not part of the module code, see "getModulePartCodes".
+    body_template_values = dict(template_values)
+    del body_template_values["module_functions_parts"]
+
+    return header + template_module_body_template % body_template_values
+
+
+def getModulePartCodes(module_context, template_values, header_name):
+    """ Get the codes of the header and parts of a module split into parts.
+
+        The header declares everything the parts share with the module code,
+        and makes it visible to them. Returns None for modules not split.
+    """
+    function_part_codes = template_values["module_functions_parts"]
+
+    if not function_part_codes:
+        return None
+
+    header = template_global_copyright % {
+        "name"    : module_context.getName(),
+        "version" : Options.getVersion(),
+        "year"    : Options.getYear()
+    }
+
+    # The constants used in functions are all shared, see "getModuleValues",
+    # the others are only used by the module code.
+    decls = [
+        decl
+        for decl in getConstantInitCodes(module_context)[0]
+        if decl.startswith("extern ")
+    ]
+
+    decls += [
+        "extern PyCodeObject *%s;" % code_identifier
+        for _code_object_key, code_identifier in
+        module_context.getCodeObjects()
+    ]
+
+    if module_context.needsModuleFilenameObject():
+        decls.append("extern PyObject *module_filename_obj;")
+
+    header_code = header + template_header_guard % {
+        "header_guard_name" : "__NUITKA_MODULE_%s_H__" % (
+            template_values["module_identifier"]
+        ),
+        "header_body"       : template_module_header % {
+            "module_identifier"     : template_values["module_identifier"],
+            "shared_decl_codes"     : indented(decls, 0),
+            "module_functions_decl" : template_values["module_functions_decl"]
+        }
+    }
+
+    part_codes = [
+        header + template_module_part % {
+            "header_name"           : header_name,
+            "module_functions_code" : function_part_code
+        }
+        for function_part_code in
+        function_part_codes
+    ]
+
+    return header_code, part_codes
 
 
 def generateModuleFileAttributeCode(to_name, expression, emit, context):
@@ -51,6 +51,10 @@ static void _createGlobalConstants( void )
 #endif
 }
 
+// The shared constants, that are created by the modules using them, when their
+// init code runs.
+%(module_constant_codes)s
+
 // In debug mode we can check that the constants were not tampered with in any
 // given moment. We typically do it at program exit, but we can add extra calls
 // for sanity.
@@ -78,5 +82,19 @@ void createGlobalConstants( void )
 }
 """
 
+template_module_shared_constants = """
+void createModuleSharedConstants_%(module_identifier)s( void )
+{
+    NUITKA_MAY_BE_UNUSED PyObject *exception_type, *exception_value;
+    NUITKA_MAY_BE_UNUSED PyTracebackObject *exception_tb;
+
+#ifdef _MSC_VER
+    (void *)exception_type; (void *)exception_value; (void *)exception_tb;
+#endif
+
+%(module_constant_inits)s
+}
+"""
+
 from . import TemplateDebugWrapper # isort:skip
 TemplateDebugWrapper.checkDebug(globals())
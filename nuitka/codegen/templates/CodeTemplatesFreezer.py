@@ -54,11 +54,15 @@ void copyFrozenModulesTo( struct _frozen *destination )
     for(;;)
     {
         destination->name = (char *)current->name;
-        destination->code = (unsigned char *)&constant_bin[ current->start ];
+        destination->code = NULL;
         destination->size = current->size;
 
         if (destination->name == NULL) break;
 
+        // This is before Python is initialized, the frozen modules are in
+        // uncompressed parts of the blob.
+        destination->code = (unsigned char *)CONSTANT_BIN( current->start );
+
         current += 1;
         destination += 1;
     };
@@ -20,7 +20,11 @@
 """
 
 template_function_make_declaration = """\
-static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_arg_spec)s );
+NUITKA_LOCAL_MODULE PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_arg_spec)s );
+"""
+
+template_function_body_declaration = """\
+NUITKA_LOCAL_MODULE PyObject *impl_%(function_identifier)s( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
 """
 
 template_function_direct_declaration = """\
@@ -28,7 +32,7 @@ template_function_direct_declaration = """\
 """
 
 template_make_function_template = """
-static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args)s )
+NUITKA_LOCAL_MODULE PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args)s )
 {
     struct Nuitka_FunctionObject *result = Nuitka_Function_New(
         %(function_impl_identifier)s,
@@ -52,7 +56,7 @@ static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args
 """
 
 template_function_body = """\
-static PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
+NUITKA_LOCAL_MODULE PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
 {
     // Preserve error status for checks
 #ifndef __NUITKA_NO_ASSERT__
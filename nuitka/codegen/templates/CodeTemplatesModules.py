@@ -45,7 +45,7 @@ template_module_body_template = """
 #include "nuitka/prelude.h"
 
 #include "__helpers.h"
-
+%(module_header_include)s
 /* The _module_%(module_identifier)s is a Python object pointer of module type. */
 
 /* Note: For full compatibility with CPython, every module variable access
@@ -112,6 +112,8 @@ static struct PyModuleDef mdef_%(module_identifier)s =
 extern PyObject *metapath_based_loader;
 #endif
 
+extern void createModuleSharedConstants_%(module_identifier)s( void );
+
 extern void _initCompiledCellType();
 extern void _initCompiledGeneratorType();
 extern void _initCompiledFunctionType();
@@ -182,6 +184,14 @@ MOD_INIT_DECL( %(module_identifier)s )
 
 #endif
 
+    /* The constants shared with other modules, but not created with the
+     * global ones, are created now, unless another module did that already.
+     */
+#ifdef _NUITKA_TRACE
+    puts("%(module_name)s: Calling createModuleSharedConstants().");
+#endif
+    createModuleSharedConstants_%(module_identifier)s();
+
     /* The constants only used by this module are created now. */
 #ifdef _NUITKA_TRACE
     puts("%(module_name)s: Calling createModuleConstants().");
@@ -286,6 +296,36 @@ extern PyObject *callPythonFunction( PyObject *func, PyObject **args, int count
 
 """
 
+template_module_header = """\
+/* Declarations shared by the files of a module split into parts. What is local
+ * to the module file otherwise, is made visible to all parts.
+ */
+#undef NUITKA_LOCAL_MODULE
+#define NUITKA_LOCAL_MODULE
+
+#define module_filename_obj module_filename_obj_%(module_identifier)s
+
+extern PyObject *module_%(module_identifier)s;
+extern PyDictObject *moduledict_%(module_identifier)s;
+
+// The module constants and code objects used.
+%(shared_decl_codes)s
+
+// The module function declarations.
+%(module_functions_decl)s
+"""
+
+template_module_part = """
+#include "nuitka/prelude.h"
+
+#include "__helpers.h"
+
+#include "%(header_name)s"
+
+// The module function definitions.
+%(module_functions_code)s
+"""
+
 template_header_guard = """\
 #ifndef %(header_guard_name)s
 #define %(header_guard_name)s
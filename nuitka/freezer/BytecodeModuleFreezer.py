@@ -56,7 +56,10 @@ def generateBytecodeFrozenCode():
             """\
 {{ "{module_name}", {start}, {size} }},""".format(
                 module_name = module_name,
-                start       = stream_data.getStreamDataOffset(code_data),
+                start       = stream_data.getStreamDataOffset(
+                    value        = code_data,
+                    uncompressed = True
+                ),
                 size        = size
             )
         )
@@ -0,0 +1,333 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Putting files into the ".dist" folder of standalone mode.
+
+Files that are already present with the same size and modification time as
+their source are not copied again, which makes recompilation with the option
+"--incremental-dist" cheap, where the folder is kept. Instead of copying, files
+can also be hard linked or cloned ("reflink") with "--dist-file-linking", where
+the file system allows it.
+
+Binaries that get changed in the folder, e.g. to remove their "RPATH", are never
+hard linked, as that would change the source file too. For these, the callers
+are to use "isUnchangedDistFile" to avoid repeating the changes, and to report
+them with "noteDistFileModified" when done. Changed binaries no longer match
+their source, so the size and modification time of the source are recorded in
+the cache directory for them, and compared with instead, see
+"loadDistFileRecords" and "storeDistFileRecords".
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+from logging import debug
+
+from nuitka import Options
+from nuitka.utils import Utils
+from nuitka.utils.AppDirs import getCacheSubDir
+
+from .ElfFiles import readElfFileInfo
+
+# Work around for CPython 3.x removal of "cpickle".
+try:
+    import cPickle as cpickle
+except ImportError:
+    import pickle as cpickle
+
+# The "ioctl" to clone a file on Linux.
+_FICLONE = 0x40049409
+
+# Sources of the files put into the dist folder, by target filename.
+_dist_file_sources = {}
+
+# Files that were found to be up to date.
+_unchanged_dist_files = set()
+
+# For binaries that were changed after being put into the dist folder, by their
+# normalized target filename, the size and modification time of the source,
+# and the size and modification time of the changed file.
+_modified_file_records = {}
+
+# Where the records of the current dist folder are stored.
+_records_filename = None
+
+
+def needsBinaryFixups(filename):
+    """ Will the binary be changed after being copied to the dist folder.
+
+    """
+    if Utils.getOS() == "Darwin":
+        return True
+    elif Utils.getOS() == "Linux":
+        elf_info = readElfFileInfo(filename)
+
+        return elf_info is None or elf_info.rpath is not None
+    else:
+        return False
+
+
+def _getRecordKey(target_path):
+    return Utils.normcase(Utils.abspath(target_path))
+
+
+def _isUpToDate(source_stat, target_path):
+    try:
+        target_stat = os.stat(target_path)
+    except OSError:
+        return False
+
+    if source_stat.st_size == target_stat.st_size and \
+       int(source_stat.st_mtime) == int(target_stat.st_mtime):
+        return True
+
+    # Changed binaries are compared with the record of their source.
+    return _modified_file_records.get(_getRecordKey(target_path)) == (
+        source_stat.st_size,
+        int(source_stat.st_mtime),
+        target_stat.st_size,
+        int(target_stat.st_mtime)
+    )
+
+
+def _deleteDistFile(filename):
+    # Read-only files cannot be deleted on Windows.
+    if not Utils.isLink(filename):
+        os.chmod(filename, stat.S_IWRITE | stat.S_IREAD)
+
+    Utils.deleteFile(filename, must_exist = True)
+
+
+def _cloneFile(source_path, target_path):
+    # Only imported when needed, not available on Windows.
+    import fcntl
+
+    with open(source_path, "rb") as source_file:
+        with open(target_path, "wb") as target_file:
+            fcntl.ioctl(target_file.fileno(), _FICLONE, source_file.fileno())
+
+
+def _putFile(source_path, target_path, may_link):
+    linking = Options.getDistFileLinking()
+
+    if linking == "hardlink" and may_link and hasattr(os, "link"):
+        try:
+            # Linking a symbolic link would not link the file it points to.
+            os.link(Utils.realpath(source_path), target_path)
+            return
+        except OSError as e:
+            debug("Cannot hard link '%s': %s" % (source_path, e))
+    elif linking == "reflink" and Utils.getOS() == "Linux":
+        try:
+            _cloneFile(source_path, target_path)
+            shutil.copymode(source_path, target_path)
+            return
+        except (OSError, IOError) as e:
+            debug("Cannot clone '%s': %s" % (source_path, e))
+
+            Utils.deleteFile(target_path, must_exist = False)
+
+    shutil.copy(source_path, target_path)
+
+
+def copyDistFile(source_path, target_path, is_binary):
+    """ Put a file into the dist folder, unless it's up to date there.
+
+        Returns True if the file was put there, False if it was up to date.
+    """
+    source_stat = os.stat(source_path)
+
+    _dist_file_sources[target_path] = source_path
+
+    if _isUpToDate(source_stat, target_path):
+        _unchanged_dist_files.add(target_path)
+
+        return False
+
+    target_dir = Utils.dirname(target_path)
+
+    if not Utils.isDir(target_dir):
+        Utils.makePath(target_dir)
+
+    # Never write into an existing file, it might be a link to the source, or
+    # be made read-only by the last compilation.
+    if os.path.lexists(target_path):
+        _deleteDistFile(target_path)
+
+    # Until it is changed again, a record of earlier changes doesn't apply.
+    _modified_file_records.pop(_getRecordKey(target_path), None)
+
+    will_modify = is_binary and needsBinaryFixups(source_path)
+
+    _putFile(source_path, target_path, may_link = not will_modify)
+
+    # Files that get changed only get the source time once that is done, so
+    # interrupted compilations do not leave files that look up to date.
+    if not will_modify:
+        _setSourceTime(target_path, source_stat)
+
+    return True
+
+
+def copyDistFiles(copies):
+    """ Put files into the dist folder, using threads where useful.
+
+        The "copies" are tuples of source path, target path, and a flag if it
+        is a binary, see "copyDistFile".
+    """
+    jobs = min(Options.getJobLimit(), len(copies))
+
+    if jobs > 1:
+        # Only imported when needed. Copying is mostly waiting for the file
+        # system, so threads are good enough.
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(
+            processes = jobs
+        )
+
+        try:
+            pool.map(
+                lambda copy: copyDistFile(*copy),
+                copies,
+                chunksize = 1
+            )
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for copy in copies:
+            copyDistFile(*copy)
+
+
+def _setSourceTime(target_path, source_stat):
+    os.utime(target_path, (source_stat.st_atime, source_stat.st_mtime))
+
+
+def isUnchangedDistFile(target_path):
+    """ Was the file found up to date, no need to change it then.
+
+    """
+    return target_path in _unchanged_dist_files
+
+
+def noteDistFileModified(target_path):
+    """ Mark a changed file as complete, so it is up to date next time.
+
+    """
+    source_path = _dist_file_sources.get(target_path)
+
+    if source_path is not None and target_path not in _unchanged_dist_files:
+        source_stat = os.stat(source_path)
+
+        _setSourceTime(target_path, source_stat)
+
+        target_stat = os.stat(target_path)
+
+        _modified_file_records[_getRecordKey(target_path)] = (
+            source_stat.st_size,
+            int(source_stat.st_mtime),
+            target_stat.st_size,
+            int(target_stat.st_mtime)
+        )
+
+
+def loadDistFileRecords(dist_dir):
+    """ Load the records of changed binaries of a kept dist folder.
+
+        These are stored in the cache directory by "storeDistFileRecords",
+        and not in the dist folder, which is to be shipped.
+    """
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _records_filename
+
+    hash_value = hashlib.md5()
+    hash_value.update(_getRecordKey(dist_dir).encode("utf-8"))
+
+    _records_filename = Utils.joinpath(
+        getCacheSubDir("dist-files"),
+        hash_value.hexdigest() + ".pickle"
+    )
+
+    if Utils.isFile(_records_filename):
+        try:
+            with open(_records_filename, "rb") as records_file:
+                _modified_file_records.update(cpickle.load(records_file))
+        except Exception as e: # Catching anything unpickling throws, pylint: disable=W0703
+            debug("Ignoring unusable dist file records: %s" % e)
+
+
+def storeDistFileRecords():
+    """ Store the records of changed binaries for the next compilation.
+
+    """
+    if _records_filename is None:
+        return
+
+    # Only the files still in the dist folder are of interest.
+    current_keys = set(
+        _getRecordKey(target_path)
+        for target_path in
+        _dist_file_sources
+    )
+
+    records = dict(
+        (key, record)
+        for key, record in
+        _modified_file_records.items()
+        if key in current_keys
+    )
+
+    temp_filename = "%s.%d.tmp" % (_records_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "wb") as records_file:
+            cpickle.dump(records, records_file, 2)
+
+        if Utils.isFile(_records_filename):
+            os.unlink(_records_filename)
+
+        os.rename(temp_filename, _records_filename)
+    except (OSError, IOError) as e:
+        debug("Not storing dist file records: %s" % e)
+
+        Utils.deleteFile(temp_filename, must_exist = False)
+
+
+def removeStaleDistFiles(dist_dir, keep_filenames):
+    """ Remove files of earlier compilations from the dist folder.
+
+        Kept are the files put there by "copyDistFile", and the ones given.
+    """
+    keep_filenames = set(
+        Utils.normcase(Utils.abspath(filename))
+        for filename in
+        tuple(keep_filenames) + tuple(_dist_file_sources)
+    )
+
+    for filename in tuple(Utils.getFileList(dist_dir)):
+        if Utils.normcase(Utils.abspath(filename)) not in keep_filenames:
+            debug("Removing stale dist folder file '%s'." % filename)
+
+            _deleteDistFile(filename)
+
+    # Directories left empty, deepest first.
+    for dirpath, _dirnames, _filenames in sorted(os.walk(dist_dir), reverse = True):
+        if dirpath != dist_dir and not os.listdir(dirpath):
+            os.rmdir(dirpath)
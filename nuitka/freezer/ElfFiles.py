@@ -0,0 +1,388 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reading of ELF files for the shared libraries they use.
+
+For standalone mode on Linux, the shared libraries used by binaries have to be
+found, and running "ldd" for every one of them is expensive. Instead, the
+dynamic section of the ELF files is read, and the needed libraries are located
+like the dynamic loader does it, following "RPATH", "LD_LIBRARY_PATH",
+"RUNPATH", and the directories configured in "/etc/ld.so.conf".
+
+Whenever something is not understood, e.g. a needed library is not found, or
+the file uses unsupported expansions in its search path, None is returned, and
+callers are expected to use "ldd" instead.
+"""
+
+import glob
+import os
+import struct
+
+from nuitka.PythonVersions import python_version
+from nuitka.utils import Utils
+
+# Program header types and dynamic section tags used.
+_PT_LOAD = 1
+_PT_DYNAMIC = 2
+
+_DT_NULL = 0
+_DT_NEEDED = 1
+_DT_STRTAB = 5
+_DT_RPATH = 15
+_DT_RUNPATH = 29
+
+
+class ElfFileInfo(object):
+    """ What the dynamic loader needs to know about an ELF file.
+
+    """
+    __slots__ = ("elf_class", "machine", "needed", "rpath", "runpath")
+
+    def __init__(self, elf_class, machine, needed, rpath, runpath):
+        self.elf_class = elf_class
+        self.machine = machine
+        self.needed = needed
+        self.rpath = rpath
+        self.runpath = runpath
+
+    def isCompatible(self, other):
+        return self.elf_class == other.elf_class and \
+               self.machine == other.machine
+
+
+def _readStruct(elf_file, offset, fmt):
+    elf_file.seek(offset)
+
+    size = struct.calcsize(fmt)
+    data = elf_file.read(size)
+
+    if len(data) != size:
+        raise ValueError("Truncated ELF file.")
+
+    return struct.unpack(fmt, data)
+
+
+def _readString(elf_file, offset):
+    elf_file.seek(offset)
+
+    result = b""
+
+    while True:
+        chunk = elf_file.read(64)
+
+        if not chunk:
+            raise ValueError("Truncated ELF string.")
+
+        end = chunk.find(b"\0")
+
+        if end != -1:
+            result += chunk[:end]
+            break
+
+        result += chunk
+
+    if python_version >= 300:
+        result = result.decode("utf-8")
+
+    return result
+
+
+def readElfFileInfo(filename):
+    """ Read the needed libraries and search paths of an ELF file.
+
+        Returns None for files that are not ELF files.
+    """
+    # Many fields to read, pylint: disable=R0914
+    try:
+        elf_file = open(filename, "rb")
+    except (OSError, IOError):
+        return None
+
+    with elf_file:
+        ident = elf_file.read(16)
+
+        if len(ident) != 16 or ident[:4] != b"\x7fELF":
+            return None
+
+        elf_class = ident[4:5]
+        byte_order = '<' if ident[5:6] == b"\x01" else '>'
+
+        try:
+            if elf_class == b"\x02":
+                machine, = _readStruct(elf_file, 18, byte_order + 'H')
+                phoff, = _readStruct(elf_file, 32, byte_order + 'Q')
+                phentsize, phnum = _readStruct(elf_file, 54, byte_order + "HH")
+                program_header_format = byte_order + "IIQQQQQQ"
+                dynamic_format = byte_order + "qQ"
+            elif elf_class == b"\x01":
+                machine, = _readStruct(elf_file, 18, byte_order + 'H')
+                phoff, = _readStruct(elf_file, 28, byte_order + 'I')
+                phentsize, phnum = _readStruct(elf_file, 42, byte_order + "HH")
+                program_header_format = byte_order + "IIIIIIII"
+                dynamic_format = byte_order + "iI"
+            else:
+                return None
+
+            loads = []
+            dynamic = None
+
+            for count in range(phnum):
+                values = _readStruct(
+                    elf_file,
+                    phoff + count * phentsize,
+                    program_header_format
+                )
+
+                # The field order differs between 32 and 64 bits.
+                if elf_class == b"\x02":
+                    p_type, _p_flags, p_offset, p_vaddr, _p_paddr, p_filesz = values[:6]
+                else:
+                    p_type, p_offset, p_vaddr, _p_paddr, p_filesz = values[:5]
+
+                if p_type == _PT_LOAD:
+                    loads.append((p_vaddr, p_offset, p_filesz))
+                elif p_type == _PT_DYNAMIC:
+                    dynamic = p_offset, p_filesz
+
+            needed = []
+            rpath = None
+            runpath = None
+
+            if dynamic is not None:
+                entries = []
+                strtab = None
+
+                entry_size = struct.calcsize(dynamic_format)
+
+                for count in range(dynamic[1] // entry_size):
+                    tag, value = _readStruct(
+                        elf_file,
+                        dynamic[0] + count * entry_size,
+                        dynamic_format
+                    )
+
+                    if tag == _DT_NULL:
+                        break
+                    elif tag == _DT_STRTAB:
+                        strtab = value
+                    elif tag in (_DT_NEEDED, _DT_RPATH, _DT_RUNPATH):
+                        entries.append((tag, value))
+
+                if entries:
+                    # The string table is given as an address, which has to be
+                    # translated to the file offset.
+                    for vaddr, offset, filesz in loads:
+                        if vaddr <= strtab < vaddr + filesz:
+                            strtab = strtab - vaddr + offset
+                            break
+                    else:
+                        return None
+
+                    for tag, value in entries:
+                        string = _readString(elf_file, strtab + value)
+
+                        if tag == _DT_NEEDED:
+                            needed.append(string)
+                        elif tag == _DT_RPATH:
+                            rpath = string
+                        else:
+                            runpath = string
+        except (ValueError, struct.error, TypeError):
+            return None
+
+    return ElfFileInfo(
+        elf_class = elf_class,
+        machine   = machine,
+        needed    = tuple(needed),
+        rpath     = rpath,
+        runpath   = runpath
+    )
+
+
+def _readLdSoConf(filename, result):
+    try:
+        lines = open(filename).readlines()
+    except (OSError, IOError):
+        return
+
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+
+        if not line:
+            continue
+
+        if line.startswith("include "):
+            pattern = line[8:].strip()
+
+            if not os.path.isabs(pattern):
+                pattern = Utils.joinpath(Utils.dirname(filename), pattern)
+
+            for include_filename in sorted(glob.glob(pattern)):
+                _readLdSoConf(include_filename, result)
+        elif line.startswith("hwcap "):
+            continue
+        else:
+            result.append(line)
+
+
+_system_library_dirs = None
+
+def getSystemLibraryDirs():
+    """ The directories the dynamic loader searches, after the search paths.
+
+        These are the ones configured for "ldconfig", followed by the trusted
+        directories of the loader.
+    """
+
+    # Using global here, as this is computed once only, pylint: disable=W0603
+    global _system_library_dirs
+
+    if _system_library_dirs is None:
+        _system_library_dirs = []
+        _readLdSoConf("/etc/ld.so.conf", _system_library_dirs)
+
+        _system_library_dirs += ["/lib64", "/usr/lib64", "/lib", "/usr/lib"]
+
+    return _system_library_dirs
+
+
+def _expandSearchPath(search_path, origin):
+    """ Split a search path, expanding "$ORIGIN", None for unknown tokens.
+
+    """
+    result = []
+
+    for element in search_path.split(':'):
+        if not element:
+            continue
+
+        element = element.replace("${ORIGIN}", origin)
+        element = element.replace("$ORIGIN", origin)
+
+        if '$' in element:
+            return None
+
+        result.append(element)
+
+    return result
+
+
+# The dynamic loader itself and the C library are not to be included.
+_loader_prefixes = ("ld-linux", "ld64.so.", "ld.so.")
+
+
+def getElfDependencies(filename):
+    """ Locate the shared libraries an ELF file uses, directly or indirectly.
+
+        Returns a set of filenames like "ldd" gives them, or None if it needs
+        to be asked instead.
+    """
+    # Loader semantics require a few branches, pylint: disable=R0912
+    root_info = readElfFileInfo(filename)
+
+    if root_info is None:
+        return None
+
+    ld_library_path = _expandSearchPath(
+        os.environ.get("LD_LIBRARY_PATH", ""),
+        Utils.dirname(Utils.abspath(filename))
+    )
+
+    if ld_library_path is None:
+        return None
+
+    result = set()
+    infos = {}
+
+    # Pending are files with the "RPATH" values of their loaders, which apply
+    # to them too, unless they have a "RUNPATH".
+    pending = [
+        (filename, root_info, ())
+    ]
+
+    while pending:
+        current_filename, current_info, inherited_rpaths = pending.pop()
+
+        origin = Utils.dirname(Utils.abspath(current_filename))
+
+        search_path = []
+
+        if current_info.runpath is None:
+            rpaths = inherited_rpaths
+
+            if current_info.rpath is not None:
+                rpath = _expandSearchPath(current_info.rpath, origin)
+
+                if rpath is None:
+                    return None
+
+                rpaths = (rpath,) + rpaths
+
+            for rpath in rpaths:
+                search_path += rpath
+        else:
+            rpaths = ()
+
+        search_path += ld_library_path
+
+        if current_info.runpath is not None:
+            runpath = _expandSearchPath(current_info.runpath, origin)
+
+            if runpath is None:
+                return None
+
+            search_path += runpath
+
+        search_path += getSystemLibraryDirs()
+
+        for needed in current_info.needed:
+            if needed.startswith(_loader_prefixes):
+                continue
+
+            if '/' in needed:
+                candidates = [needed]
+            else:
+                candidates = [
+                    Utils.joinpath(element, needed)
+                    for element in search_path
+                ]
+
+            for candidate in candidates:
+                if candidate in infos:
+                    needed_info = infos[candidate]
+                elif Utils.isFile(candidate):
+                    needed_info = infos[candidate] = readElfFileInfo(candidate)
+                else:
+                    continue
+
+                if needed_info is not None and \
+                   needed_info.isCompatible(root_info):
+                    break
+            else:
+                # Not found, let "ldd" decide what that means.
+                return None
+
+            candidate = os.path.normpath(candidate)
+
+            if candidate not in result:
+                result.add(candidate)
+
+                pending.append(
+                    (candidate, needed_info, rpaths)
+                )
+
+    return result
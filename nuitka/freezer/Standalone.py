@@ -22,8 +22,8 @@ MacOS, Windows, and Linux. Patches for other platforms are
 very welcome.
 """
 
+import hashlib
 import os
-import shutil
 import subprocess
 import sys
 from logging import debug, info, warning
@@ -44,8 +44,22 @@ from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
+from nuitka.utils.AppDirs import getCacheSubDir
+from nuitka.utils.Timing import addCounter, withTimedPhase
 
 from .DependsExe import getDependsExePath
+from .DistFolder import (
+    copyDistFiles,
+    isUnchangedDistFile,
+    noteDistFileModified
+)
+from .ElfFiles import getElfDependencies
+
+# Work around for CPython 3.x removal of "cpickle".
+try:
+    import cPickle as cpickle
+except ImportError:
+    import pickle as cpickle
 
 
 def loadCodeObjectData(precompiled_filename):
@@ -189,6 +203,157 @@ def _detectedShlibFile(filename, module_name):
     module_names.add(module_name)
 
 
+def _runImportDetection(command):
+    """ Run the command with verbose imports, and return the import lines.
+
+    """
+    import tempfile
+    tmp_file, tmp_filename = tempfile.mkstemp()
+
+    try:
+        if python_version >= 300:
+            command = command.encode("ascii")
+        os.write(tmp_file, command)
+        os.close(tmp_file)
+
+        process = subprocess.Popen(
+            args   = [sys.executable, "-s", "-S", "-v", tmp_filename],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+        )
+        _stdout, stderr = process.communicate()
+    finally:
+        os.unlink(tmp_filename)
+
+    # Don't let errors here go unnoticed.
+    if process.returncode != 0:
+        warning("There is a problem with detecting imports, CPython said:")
+        for line in stderr.split(b"\n"):
+            Tracing.printLine(line)
+        sys.exit("Error, please report the issue with above output.")
+
+    return [
+        line
+        for line in
+        stderr.replace(b"\r", b"").split(b"\n")
+        if line.startswith(b"import ")
+    ]
+
+
+def _parseImportLine(line):
+    """ Split an import line into module name, origin, and filename.
+
+        The filename is None for origins without one, e.g. built-in modules.
+    """
+    parts = line.split(b" # ", 2)
+
+    module_name = parts[0].split(b" ", 2)[1]
+    origin = parts[1].split()[0]
+
+    for filename_prefix in (b"precompiled from ", b"sourcefile ",
+                            b"dynamically loaded from "):
+        if parts[1].startswith(filename_prefix):
+            filename = parts[1][len(filename_prefix):]
+            break
+    else:
+        filename = None
+
+    if python_version >= 300:
+        module_name = module_name.decode("utf-8")
+
+        if filename is not None:
+            filename = filename.decode("utf-8")
+
+    return module_name, origin, filename
+
+
+def _getFileStamp(filename):
+    try:
+        stat_result = os.stat(filename)
+    except OSError:
+        return None
+
+    return stat_result.st_size, stat_result.st_mtime
+
+
+def _getImportLines(command, search_path):
+    """ Get the import lines of a command, cached if allowed.
+
+        The cached lines are used as long as the interpreter binary, the search
+        path directories, and all the files imported are unchanged.
+    """
+    if not Options.shallCacheImportDetection():
+        return _runImportDetection(command)
+
+    hash_value = hashlib.md5()
+
+    key_parts = (
+        Options.getVersion(),
+        sys.version,
+        sys.executable,
+        repr(_getFileStamp(sys.executable)),
+        os.environ.get("PYTHONPATH", ""),
+        os.environ.get("PYTHONHOME", ""),
+        command
+    )
+
+    for key_part in key_parts:
+        hash_value.update(key_part.encode("utf-8"))
+        hash_value.update(b'\0')
+
+    cache_filename = Utils.joinpath(
+        getCacheSubDir("import-detection"),
+        hash_value.hexdigest() + ".pickle"
+    )
+
+    if Utils.isFile(cache_filename):
+        try:
+            with open(cache_filename, "rb") as cache_file:
+                file_stamps, import_lines = cpickle.load(cache_file)
+        except Exception as e: # Catching anything unpickling throws, pylint: disable=W0703
+            debug("Ignoring unusable import detection cache: %s" % e)
+        else:
+            for filename, file_stamp in file_stamps:
+                if _getFileStamp(filename) != file_stamp:
+                    break
+            else:
+                addCounter("import_detection_cache_hits")
+
+                return import_lines
+
+    addCounter("import_detection_cache_misses")
+
+    import_lines = _runImportDetection(command)
+
+    filenames = list(search_path)
+
+    for line in import_lines:
+        filename = _parseImportLine(line)[2]
+
+        if filename is not None:
+            filenames.append(filename)
+
+    file_stamps = [
+        (filename, _getFileStamp(filename))
+        for filename in
+        filenames
+    ]
+
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "wb") as cache_file:
+            cpickle.dump((file_stamps, import_lines), cache_file, 2)
+
+        os.rename(temp_filename, cache_filename)
+    except (OSError, IOError) as e:
+        debug("Not storing import detection cache: %s" % e)
+
+        Utils.deleteFile(temp_filename, must_exist = False)
+
+    return import_lines
+
+
 def _detectImports(command, user_provided, technical):
     # This is pretty complicated stuff, with variants to deal with.
     # pylint: disable=R0912,R0914,R0915
@@ -217,109 +382,70 @@ def _detectImports(command, user_provided, technical):
     # is used.
     command = ("import sys; sys.path = %s;" % repr(reduced_path)) + command
 
-    import tempfile
-    tmp_file, tmp_filename = tempfile.mkstemp()
-
-    try:
-        if python_version >= 300:
-            command = command.encode("ascii")
-        os.write(tmp_file, command)
-        os.close(tmp_file)
-
-        process = subprocess.Popen(
-            args   = [sys.executable, "-s", "-S", "-v", tmp_filename],
-            stdout = subprocess.PIPE,
-            stderr = subprocess.PIPE,
-        )
-        _stdout, stderr = process.communicate()
-    finally:
-        os.unlink(tmp_filename)
-
-    # Don't let errors here go unnoticed.
-    if process.returncode != 0:
-        warning("There is a problem with detecting imports, CPython said:")
-        for line in stderr.split(b"\n"):
-            Tracing.printLine(line)
-        sys.exit("Error, please report the issue with above output.")
+    import_lines = _getImportLines(
+        command     = command,
+        search_path = reduced_path
+    )
 
     result = []
 
     debug("Detecting imports:")
 
-    for line in stderr.replace(b"\r", b"").split(b"\n"):
-        if line.startswith(b"import "):
-            # print(line)
-
-            parts = line.split(b" # ", 2)
+    for line in import_lines:
+        module_name, origin, filename = _parseImportLine(line)
 
-            module_name = parts[0].split(b" ", 2)[1]
-            origin = parts[1].split()[0]
+        if origin == b"precompiled":
+            # This is a ".pyc" file that was imported, even before we have a
+            # chance to do anything, we need to preserve it.
 
-            if python_version >= 300:
-                module_name = module_name.decode("utf-8")
-
-            if origin == b"precompiled":
-                # This is a ".pyc" file that was imported, even before we have a
-                # chance to do anything, we need to preserve it.
-                filename = parts[1][len(b"precompiled from "):]
-                if python_version >= 300:
-                    filename = filename.decode("utf-8")
+            # Do not leave standard library when freezing.
+            if not isStandardLibraryPath(filename):
+                continue
 
-                # Do not leave standard library when freezing.
-                if not isStandardLibraryPath(filename):
-                    continue
+            _detectedPrecompiledFile(
+                filename      = filename,
+                module_name   = module_name,
+                result        = result,
+                user_provided = user_provided,
+                technical     = technical
+            )
+        elif origin == b"sourcefile":
+            # Do not leave standard library when freezing.
+            if not isStandardLibraryPath(filename):
+                continue
 
-                _detectedPrecompiledFile(
+            if filename.endswith(".py"):
+                _detectedSourceFile(
                     filename      = filename,
                     module_name   = module_name,
                     result        = result,
                     user_provided = user_provided,
                     technical     = technical
                 )
-            elif origin == b"sourcefile":
-                filename = parts[1][len(b"sourcefile "):]
-                if python_version >= 300:
-                    filename = filename.decode("utf-8")
-
-                # Do not leave standard library when freezing.
-                if not isStandardLibraryPath(filename):
-                    continue
-
-                if filename.endswith(".py"):
-                    _detectedSourceFile(
-                        filename      = filename,
-                        module_name   = module_name,
-                        result        = result,
-                        user_provided = user_provided,
-                        technical     = technical
-                    )
-                elif not filename.endswith("<frozen>"):
-                    # Python3 started lying in "__name__" for the "_decimal"
-                    # calls itself "decimal", which then is wrong and also
-                    # clashes with "decimal" proper
-                    if python_version >= 300:
-                        if module_name == "decimal":
-                            module_name = "_decimal"
-
-                    _detectedShlibFile(
-                        filename    = filename,
-                        module_name = module_name
-                    )
-            elif origin == b"dynamically":
-                # Shared library in early load, happens on RPM based systems and
-                # or self compiled Python installations.
-                filename = parts[1][len(b"dynamically loaded from "):]
+            elif not filename.endswith("<frozen>"):
+                # Python3 started lying in "__name__" for the "_decimal"
+                # calls itself "decimal", which then is wrong and also
+                # clashes with "decimal" proper
                 if python_version >= 300:
-                    filename = filename.decode("utf-8")
-
-                # Do not leave standard library when freezing.
-                if not isStandardLibraryPath(filename):
-                    continue
+                    if module_name == "decimal":
+                        module_name = "_decimal"
 
                 _detectedShlibFile(
                     filename    = filename,
                     module_name = module_name
                 )
+        elif origin == b"dynamically":
+            # Shared library in early load, happens on RPM based systems and
+            # or self compiled Python installations.
+
+            # Do not leave standard library when freezing.
+            if not isStandardLibraryPath(filename):
+                continue
+
+            _detectedShlibFile(
+                filename    = filename,
+                module_name = module_name
+            )
 
     return result
 
@@ -434,11 +560,9 @@ def detectEarlyImports():
     if python_version >= 300:
         import_code += "import inspect;"
 
-    # We might need the pickle module when creating global constants.
-    if python_version >= 300:
-        import_code += "import pickle;"
-    else:
-        import_code += "import cPickle;"
+    # We need the zlib module when creating constants from a compressed blob.
+    if Options.isCompressConstants():
+        import_code += "import zlib;"
 
     result = _detectImports(
         command       = import_code,
@@ -481,7 +605,31 @@ def detectEarlyImports():
     return result
 
 
+def _isKernelSpecificLibrary(filename):
+    return Utils.basename(filename).startswith(
+        (
+            "libc.so.",
+            "libpthread.so.",
+            "libm.so.",
+            "libdl.so."
+        )
+    )
+
+
 def _detectBinaryPathDLLsLinuxBSD(binary_filename):
+    # Reading the ELF files ourselves is a lot faster than running "ldd", but
+    # it gives up for things it doesn't know how the loader handles.
+    if Utils.getOS() == "Linux":
+        elf_dependencies = getElfDependencies(binary_filename)
+
+        if elf_dependencies is not None:
+            return set(
+                filename
+                for filename in
+                elf_dependencies
+                if not _isKernelSpecificLibrary(filename)
+            )
+
     # Ask "ldd" about the libraries being used by the created binary, these
     # are the ones that interest us.
     result = set()
@@ -522,14 +670,7 @@ def _detectBinaryPathDLLsLinuxBSD(binary_filename):
             continue
 
         # Do not include kernel specific libraries.
-        if Utils.basename(filename).startswith(
-                (
-                    "libc.so.",
-                    "libpthread.so.",
-                    "libm.so.",
-                    "libdl.so."
-                )
-            ):
+        if _isKernelSpecificLibrary(filename):
             continue
 
         result.add(filename)
@@ -757,15 +898,129 @@ def detectBinaryDLLs(binary_filename, package_name):
         assert False, Utils.getOS()
 
 
+def _getCachedBinaryDLLs(binary_filename, package_name):
+    """ Detect the DLLs used by a binary, cached if allowed.
+
+        The cached result is used as long as the binary and the DLLs it found
+        are unchanged, and the library search configuration is the same.
+    """
+    if not Options.shallCacheDLLDetection():
+        return detectBinaryDLLs(
+            binary_filename = binary_filename,
+            package_name    = package_name
+        )
+
+    hash_value = hashlib.md5()
+
+    key_parts = (
+        Options.getVersion(),
+        sys.version,
+        binary_filename,
+        package_name or "",
+        os.environ.get("LD_LIBRARY_PATH", ""),
+        os.environ.get("DYLD_LIBRARY_PATH", ""),
+        os.environ.get("PATH", ""),
+        os.environ.get("PYTHONPATH", ""),
+        repr(_getFileStamp("/etc/ld.so.cache"))
+    )
+
+    for key_part in key_parts:
+        hash_value.update(key_part.encode("utf-8"))
+        hash_value.update(b'\0')
+
+    cache_filename = Utils.joinpath(
+        getCacheSubDir("dll-dependencies"),
+        hash_value.hexdigest() + ".pickle"
+    )
+
+    if Utils.isFile(cache_filename):
+        try:
+            with open(cache_filename, "rb") as cache_file:
+                file_stamps, used_dlls = cpickle.load(cache_file)
+        except Exception as e: # Catching anything unpickling throws, pylint: disable=W0703
+            debug("Ignoring unusable DLL detection cache: %s" % e)
+        else:
+            for filename, file_stamp in file_stamps:
+                if _getFileStamp(filename) != file_stamp:
+                    break
+            else:
+                addCounter("dll_detection_cache_hits")
+
+                return used_dlls
+
+    addCounter("dll_detection_cache_misses")
+
+    used_dlls = detectBinaryDLLs(
+        binary_filename = binary_filename,
+        package_name    = package_name
+    )
+
+    file_stamps = [
+        (filename, _getFileStamp(filename))
+        for filename in
+        [binary_filename] + sorted(used_dlls)
+    ]
+
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "wb") as cache_file:
+            cpickle.dump((file_stamps, used_dlls), cache_file, 2)
+
+        os.rename(temp_filename, cache_filename)
+    except (OSError, IOError) as e:
+        debug("Not storing DLL detection cache: %s" % e)
+
+        Utils.deleteFile(temp_filename, must_exist = False)
+
+    return used_dlls
+
+
 def detectUsedDLLs(standalone_entry_points):
     result = {}
 
-    for binary_filename, package_name in standalone_entry_points:
-        used_dlls = detectBinaryDLLs(
+    def detectEntryPointDLLs(standalone_entry_point):
+        binary_filename, package_name = standalone_entry_point
+
+        return _getCachedBinaryDLLs(
             binary_filename = binary_filename,
             package_name    = package_name
         )
 
+    jobs = min(Options.getJobLimit(), len(standalone_entry_points))
+
+    if jobs > 1:
+        # Make sure "depends.exe" is there, before the threads need it, as
+        # downloading it might require to ask the user.
+        if Utils.getOS() == "Windows":
+            getDependsExePath()
+
+        # Only imported when needed. The scans are mostly waiting for tools
+        # or files, so threads are good enough.
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(
+            processes = jobs
+        )
+
+        try:
+            results = pool.map(
+                detectEntryPointDLLs,
+                standalone_entry_points,
+                chunksize = 1
+            )
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [
+            detectEntryPointDLLs(standalone_entry_point)
+            for standalone_entry_point in
+            standalone_entry_points
+        ]
+
+    for (binary_filename, _package_name), used_dlls in \
+        zip(standalone_entry_points, results):
         for dll_filename in used_dlls:
             # We want these to be absolute paths.
             assert Utils.isAbsolutePath(dll_filename), dll_filename
@@ -857,7 +1112,8 @@ def copyUsedDLLs(dist_dir, standalone_entry_points):
 
     dll_map = []
 
-    used_dlls = detectUsedDLLs(standalone_entry_points)
+    with withTimedPhase("standalone DLL detection", children = True):
+        used_dlls = detectUsedDLLs(standalone_entry_points)
 
     for dll_filename1, sources1 in tuple(iterItems(used_dlls)):
         for dll_filename2, sources2 in tuple(iterItems(used_dlls)):
@@ -910,6 +1166,8 @@ different from
                 )
             )
 
+    copies = []
+
     for dll_filename, sources in iterItems(used_dlls):
         dll_name = Utils.basename(dll_filename)
 
@@ -918,9 +1176,8 @@ different from
             dll_name
         )
 
-        shutil.copy(
-            dll_filename,
-            target_path
+        copies.append(
+            (dll_filename, target_path, True)
         )
 
         dll_map.append(
@@ -935,22 +1192,37 @@ different from
                  )
             )
 
+    copyDistFiles(copies)
+
+    # Only binaries that were just copied need to be changed, unchanged ones
+    # were done by an earlier compilation already.
+    changed_entry_points = [
+        standalone_entry_point
+        for standalone_entry_point in
+        standalone_entry_points
+        if not isUnchangedDistFile(standalone_entry_point[0])
+    ]
+
+    changed_dll_filenames = [
+        Utils.joinpath(dist_dir, dll_filename)
+        for _original_path, dll_filename in
+        dll_map
+        if not isUnchangedDistFile(Utils.joinpath(dist_dir, dll_filename))
+    ]
+
     if Utils.getOS() == "Darwin":
         # For MacOS, the binary and the DLLs needs to be changed to reflect
         # the relative DLL location in the ".dist" folder.
-        for standalone_entry_point in standalone_entry_points:
+        for standalone_entry_point in changed_entry_points:
             fixupBinaryDLLPaths(
                 binary_filename = standalone_entry_point[0],
                 is_exe          = standalone_entry_point is standalone_entry_points[0],
                 dll_map         = dll_map
             )
 
-        for _original_path, dll_filename in dll_map:
+        for dll_filename in changed_dll_filenames:
             fixupBinaryDLLPaths(
-                binary_filename = Utils.joinpath(
-                    dist_dir,
-                    dll_filename
-                ),
+                binary_filename = dll_filename,
                 is_exe          = False,
                 dll_map         = dll_map
             )
@@ -958,12 +1230,17 @@ different from
     if Utils.getOS() == "Linux":
         # For Linux, the "rpath" of libraries may be an issue and must be
         # removed.
-        for _original_path, dll_filename in dll_map:
-            removeSharedLibraryRPATH(
-                Utils.joinpath(dist_dir, dll_filename)
-            )
+        for dll_filename in changed_dll_filenames:
+            removeSharedLibraryRPATH(dll_filename)
 
-        for standalone_entry_point in standalone_entry_points[1:]:
-            removeSharedLibraryRPATH(
-                standalone_entry_point[0]
-            )
+        for standalone_entry_point in changed_entry_points:
+            if standalone_entry_point is not standalone_entry_points[0]:
+                removeSharedLibraryRPATH(
+                    standalone_entry_point[0]
+                )
+
+    for dll_filename in changed_dll_filenames:
+        noteDistFileModified(dll_filename)
+
+    for standalone_entry_point in changed_entry_points:
+        noteDistFileModified(standalone_entry_point[0])
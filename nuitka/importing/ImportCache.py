@@ -70,6 +70,10 @@ def getImportedModuleByName(full_name):
     return imported_by_name[full_name]
 
 
+def getImportedModules():
+    return tuple(imported_by_name.values())
+
+
 def getImportedModuleByPath(module_relpath):
     for key in imported_modules:
         if key[0] == module_relpath:
@@ -45,7 +45,12 @@ from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.utils import Utils
 
-from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
+from . import ModuleSearchCache
+from .PreloadedPackages import (
+    getPreloadedPackagePath,
+    getPreloadedPackagePaths,
+    isPreloadedPackagePath
+)
 from .Whitelisting import isWhiteListedNotExistingModule
 
 _debug_module_finding = Options.shallExplainImports()
@@ -318,6 +323,8 @@ def _findModuleInPath2(module_name, search_path):
             continue
         considered.add(Utils.normcase(entry))
 
+        ModuleSearchCache.noteSearchedName(entry, module_name)
+
         package_directory = os.path.join(entry, module_name)
 
         # First, check for a package with an init file, that would be the
@@ -395,6 +402,8 @@ def getPackageSearchPath(package_name):
                 child_package_name
             )
 
+            ModuleSearchCache.noteSearchedName(element, child_package_name)
+
             if isPackageDir(package_dir):
                 result.append(package_dir)
                 # Hack for "uniconverter". TODO: Move this to plug-in decision. This
@@ -421,6 +430,11 @@ def getPackageSearchPath(package_name):
         result = []
         for element in getPackageSearchPath(None):
             for package_dir, force_package in getPackageDirCandidates(element):
+                ModuleSearchCache.noteSearchedName(
+                    element,
+                    Utils.basename(package_dir)
+                )
+
                 if isPackageDir(package_dir) or force_package:
                     result.append(package_dir)
 
@@ -472,6 +486,20 @@ def _findModuleInPath(module_name, package_name):
 
 module_search_cache = {}
 
+def _getSearchContext():
+    """ What module searches depend on, other than the searched directories.
+
+    """
+    return repr(
+        (
+            getPackageSearchPath(None),
+            sorted(getPreloadedPackagePaths().items()),
+            os.environ.get("NUITKA_SITE_FILENAME", ""),
+            python_version
+        )
+    )
+
+
 def _findModule(module_name):
     if _debug_module_finding:
         print(
@@ -496,7 +524,14 @@ def _findModule(module_name):
             return result
 
     try:
-        module_search_cache[key] = _findModule2(module_name)
+        if Options.shallCacheModuleSearches():
+            module_search_cache[key] = ModuleSearchCache.getSearchResult(
+                module_name = module_name,
+                search      = _findModule2,
+                context     = _getSearchContext()
+            )
+        else:
+            module_search_cache[key] = _findModule2(module_name)
     except ImportError:
         new_module_name = Plugins.considerFailedImportReferrals(module_name)
 
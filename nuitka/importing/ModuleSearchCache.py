@@ -0,0 +1,269 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Cache of module search results between compilations.
+
+Locating a module looks into every directory of the search path, with many
+file system accesses for all the possible file names, and the next compilation
+is going to do exactly the same. With "--module-search-cache", the results are
+stored in the Nuitka cache directory, together with the names the search looked
+for in each directory.
+
+A stored result is only used again, if the directory entries with these names
+are still the same. For that, the directory listings are stored as well, with
+the modification time of the directory, so for unchanged directories, a single
+"stat" call is all it takes, and changed ones are listed only once.
+"""
+
+import hashlib
+import os
+import sys
+import time
+from logging import debug, info
+
+from nuitka import Options
+from nuitka.utils import Utils
+from nuitka.utils.AppDirs import getCacheSubDir
+
+# Work around for CPython 3.x removal of "cpickle".
+try:
+    import cPickle as cpickle
+except ImportError:
+    import pickle as cpickle
+
+# Some platforms are case insensitive.
+_case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
+
+# Modification times this close to the listing of a directory cannot tell if
+# the listing is complete, as the file system resolution might be coarse.
+_racy_mtime_delta = 2
+
+_cache_filename = None
+
+# Stored directory listings, mapping directory names to the modification time
+# and the directory entries by name key, see "_getNameKey".
+_directories = {}
+
+# Directories that were confirmed or listed in this compilation.
+_confirmed_directories = set()
+
+# Stored search results, mapping module names to the result, and the name keys
+# searched in directories, with the entries found for them.
+_search_results = {}
+
+_changed = False
+
+_search_count = 0
+_reuse_count = 0
+
+# While searching, the directory and name keys looked at.
+_searched_names = None
+
+
+def _getNameKey(name):
+    """ The part of a directory entry name that decides if a search sees it.
+
+        Modules and packages are named like files and directories, followed by
+        a suffix, e.g. "os.py" and "os.pyc" are relevant for module "os".
+    """
+    name = name.split('.', 1)[0]
+
+    if not _case_sensitive:
+        name = name.lower()
+
+    return name
+
+
+def _getDirectoryEntries(dirname):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _changed
+
+    if dirname not in _confirmed_directories:
+        try:
+            mtime = os.stat(dirname).st_mtime
+        except OSError:
+            mtime = None
+
+        stored = _directories.get(dirname)
+
+        if mtime is None or stored is None or stored[0] != mtime:
+            entries = {}
+
+            if mtime is not None:
+                # For files, e.g. zip files on the search path, there is
+                # nothing to list.
+                try:
+                    names = os.listdir(dirname)
+                except OSError:
+                    names = ()
+
+                for name in names:
+                    entries.setdefault(_getNameKey(name), []).append(name)
+
+                for name_key, names in entries.items():
+                    entries[name_key] = tuple(sorted(names))
+
+                # Do not trust this listing next time, if the directory might
+                # change within the same modification time.
+                if time.time() - mtime < _racy_mtime_delta:
+                    mtime = None
+
+            _directories[dirname] = mtime, entries
+            _changed = True
+
+        _confirmed_directories.add(dirname)
+
+    return _directories[dirname][1]
+
+
+def noteSearchedName(dirname, name):
+    """ Note that a search for a module looked for a name in a directory.
+
+        For packages, their "__init__" files matter too. Only while searching
+        with "getSearchResult", this is recorded.
+    """
+    if _searched_names is not None:
+        _searched_names.add((dirname, _getNameKey(name)))
+
+        package_dir = Utils.joinpath(dirname, name)
+
+        if Utils.isDir(package_dir):
+            _searched_names.add((package_dir, "__init__"))
+
+
+def _isValidSearchResult(searched_entries):
+    for dirname, name_key, entries in searched_entries:
+        if _getDirectoryEntries(dirname).get(name_key) != entries:
+            return False
+
+    return True
+
+
+def _loadSearchResults(context):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _cache_filename, _directories, _search_results
+
+    hash_value = hashlib.md5()
+
+    for key_part in (Options.getVersion(), sys.version, sys.executable, context):
+        hash_value.update(key_part.encode("utf-8"))
+        hash_value.update(b'\0')
+
+    _cache_filename = Utils.joinpath(
+        getCacheSubDir("module-searches"),
+        hash_value.hexdigest() + ".pickle"
+    )
+
+    if Utils.isFile(_cache_filename):
+        try:
+            with open(_cache_filename, "rb") as cache_file:
+                _directories, _search_results = cpickle.load(cache_file)
+        except Exception as e: # Catching anything unpickling throws, pylint: disable=W0703
+            debug("Ignoring unusable module search cache: %s" % e)
+
+
+def getSearchResult(module_name, search, context):
+    """ Search a module, reusing the result of earlier compilations if valid.
+
+        The "search" function is called with the module name, if there is no
+        valid stored result, and may raise "ImportError", which is stored too.
+        The "context" string is to contain what else searches depend on, e.g.
+        the search path, and selects the stored results to use.
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _searched_names, _changed, _search_count, _reuse_count
+
+    if _cache_filename is None:
+        _loadSearchResults(context)
+
+    _search_count += 1
+
+    if module_name in _search_results:
+        result, searched_entries = _search_results[module_name]
+
+        if _isValidSearchResult(searched_entries):
+            _reuse_count += 1
+
+            if result is ImportError:
+                raise ImportError
+
+            return result
+
+    assert _searched_names is None, module_name
+    _searched_names = set()
+
+    try:
+        result = search(module_name)
+    except ImportError:
+        result = ImportError
+    finally:
+        searched_names = _searched_names
+        _searched_names = None
+
+    _search_results[module_name] = (
+        result,
+        tuple(
+            (dirname, name_key, _getDirectoryEntries(dirname).get(name_key))
+            for dirname, name_key in
+            searched_names
+        )
+    )
+    _changed = True
+
+    if result is ImportError:
+        raise ImportError
+
+    return result
+
+
+def storeSearchResults():
+    """ Store the module search results, if there are any new ones.
+
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _changed
+
+    if Options.isShowProgress():
+        info(
+            "Module search cache: %d searches reused, %d made." % (
+                _reuse_count,
+                _search_count - _reuse_count
+            )
+        )
+
+    if not _changed:
+        return
+
+    temp_filename = "%s.%d.tmp" % (_cache_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "wb") as cache_file:
+            cpickle.dump((_directories, _search_results), cache_file, 2)
+
+        os.rename(temp_filename, _cache_filename)
+    except (OSError, IOError) as e:
+        debug("Not storing module search cache: %s" % e)
+
+        Utils.deleteFile(temp_filename, must_exist = False)
+    else:
+        _changed = False
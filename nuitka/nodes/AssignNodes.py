@@ -62,7 +62,10 @@ class StatementAssignmentVariable(StatementChildrenHavingBase):
         "variable_ref"
     )
 
-    inplace_suspect = None
+    __slots__ = (
+        "inplace_suspect",
+        "variable_trace"
+    )
 
     def __init__(self, variable_ref, source, source_ref):
         assert variable_ref is not None, source_ref
@@ -81,6 +84,8 @@ class StatementAssignmentVariable(StatementChildrenHavingBase):
 
         self.variable_trace = None
 
+        self.inplace_suspect = None
+
     def getDetail(self):
         variable_ref = self.getTargetVariableRef()
         variable = variable_ref.getVariable()
@@ -338,6 +343,12 @@ class StatementDelVariable(StatementChildrenHavingBase):
         "variable_ref",
     )
 
+    __slots__ = (
+        "previous_trace",
+        "tolerant",
+        "variable_trace"
+    )
+
     def __init__(self, variable_ref, tolerant, source_ref):
         assert variable_ref is not None
         assert variable_ref.isTargetVariableRef()
@@ -455,6 +466,11 @@ class StatementReleaseVariable(NodeBase):
     """
     kind = "STATEMENT_RELEASE_VARIABLE"
 
+    __slots__ = (
+        "variable",
+        "variable_trace"
+    )
+
     def __init__(self, variable, source_ref):
         assert variable is not None, source_ref
 
@@ -538,6 +554,8 @@ class StatementReleaseVariable(NodeBase):
 class ExpressionTargetVariableRef(ExpressionVariableRef):
     kind = "EXPRESSION_TARGET_VARIABLE_REF"
 
+    __slots__ = ("variable_version",)
+
     # TODO: Remove default and correct argument order later.
     def __init__(self, variable_name, source_ref, variable = None, version = None):
         ExpressionVariableRef.__init__(self, variable_name, source_ref)
@@ -599,6 +617,8 @@ class ExpressionTargetVariableRef(ExpressionVariableRef):
 class ExpressionTargetTempVariableRef(ExpressionTempVariableRef):
     kind = "EXPRESSION_TARGET_TEMP_VARIABLE_REF"
 
+    __slots__ = ("variable_version",)
+
     def __init__(self, variable, source_ref, version = None):
         ExpressionTempVariableRef.__init__(self, variable, source_ref)
 
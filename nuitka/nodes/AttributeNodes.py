@@ -61,6 +61,8 @@ class StatementAssignmentAttribute(StatementChildrenHavingBase):
         "expression"
     )
 
+    __slots__ = ("attribute_name",)
+
     def __init__(self, expression, attribute_name, source, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
@@ -124,6 +126,8 @@ class StatementDelAttribute(StatementChildrenHavingBase):
         "expression",
     )
 
+    __slots__ = ("attribute_name",)
+
     def __init__(self, expression, attribute_name, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
@@ -181,6 +185,8 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
         "source",
     )
 
+    __slots__ = ("attribute_name",)
+
     def __init__(self, source, attribute_name, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
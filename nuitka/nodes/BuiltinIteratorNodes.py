@@ -148,6 +148,8 @@ class StatementSpecialUnpackCheck(StatementChildrenHavingBase):
         "iterator",
     )
 
+    __slots__ = ("count",)
+
     def __init__(self, iterator, count, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
@@ -47,6 +47,11 @@ class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
 class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
     kind = "EXPRESSION_SPECIAL_UNPACK"
 
+    __slots__ = (
+        "count",
+        "expected"
+    )
+
     def __init__(self, value, count, expected, source_ref):
         ExpressionBuiltinNext1.__init__(
             self,
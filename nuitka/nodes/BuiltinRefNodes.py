@@ -40,6 +40,12 @@ from .NodeBases import CompileTimeConstantExpressionMixin, NodeBase
 
 
 class ExpressionBuiltinRefBase(CompileTimeConstantExpressionMixin, NodeBase):
+
+    __slots__ = (
+        "builtin_name",
+        "computed_attribute"
+    )
+
     def __init__(self, builtin_name, source_ref):
         NodeBase.__init__(self, source_ref = source_ref)
         CompileTimeConstantExpressionMixin.__init__(self)
@@ -41,6 +41,11 @@ class ExpressionClassBody(ExpressionFunctionBodyBase, MarkLocalsDictIndicator):
         "body" : checkStatementsSequenceOrNone
     }
 
+    __slots__ = (
+        "doc",
+        "needs_locals_dict"
+    )
+
     def __init__(self, provider, name, doc, flags, source_ref):
         while provider.isExpressionOutlineBody():
             provider = provider.getParentVariableProvider()
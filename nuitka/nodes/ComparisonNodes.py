@@ -37,6 +37,8 @@ class ExpressionComparison(ExpressionChildrenHavingBase):
         "right"
     )
 
+    __slots__ = ("comparator",)
+
     def __init__(self, left, right, comparator, source_ref):
         assert left.isExpression()
         assert right.isExpression()
@@ -125,6 +127,9 @@ Replaced negated comparison with inverse comparison."""
 
 
 class ExpressionComparisonIsIsNotBase(ExpressionComparison):
+
+    __slots__ = ("match_value",)
+
     def __init__(self, left, right, comparator, source_ref):
         ExpressionComparison.__init__(
             self,
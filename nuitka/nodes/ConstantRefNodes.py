@@ -64,7 +64,12 @@ from .shapes.BuiltinTypeShapes import (
 
 
 class ExpressionConstantRefBase(CompileTimeConstantExpressionMixin, NodeBase):
-    user_provided = False
+
+    __slots__ = (
+        "computed_attribute",
+        "constant",
+        "user_provided"
+    )
 
     def __init__(self, constant, source_ref, user_provided = False):
         NodeBase.__init__(self, source_ref = source_ref)
@@ -74,9 +79,7 @@ class ExpressionConstantRefBase(CompileTimeConstantExpressionMixin, NodeBase):
 
         self.constant = constant
 
-        # Memory saving method, have the attribute only where necessary.
-        if user_provided:
-            self.user_provided = user_provided
+        self.user_provided = user_provided
 
         if not user_provided and isDebug():
             try:
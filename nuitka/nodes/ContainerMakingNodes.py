@@ -41,6 +41,8 @@ class ExpressionMakeSequenceBase(SideEffectsFromChildrenMixin,
         "elements",
     )
 
+    __slots__ = ("sequence_kind",)
+
     def __init__(self, sequence_kind, elements, source_ref):
         assert sequence_kind in ("TUPLE", "LIST", "SET"), sequence_kind
 
@@ -22,7 +22,6 @@ whose implementation lives here. The creation itself also lives here.
 
 """
 
-from nuitka.PythonVersions import python_version
 
 from .Checkers import checkStatementsSequenceOrNone
 from .FunctionNodes import ExpressionFunctionBodyBase
@@ -42,6 +41,8 @@ class ExpressionMakeCoroutineObject(ExpressionChildrenHavingBase):
 
     getCoroutineRef = ExpressionChildrenHavingBase.childGetter("coroutine_ref")
 
+    __slots__ = ("code_object",)
+
     def __init__(self, coroutine_ref, code_object, source_ref):
         assert coroutine_ref.getFunctionBody().isExpressionCoroutineObjectBody()
 
@@ -95,8 +96,13 @@ class ExpressionCoroutineObjectBody(ExpressionFunctionBodyBase,
         "body" : checkStatementsSequenceOrNone
     }
 
-    if python_version >= 340:
-        qualname_setup = None
+    __slots__ = (
+        "exec_source_ref",
+        "needs_generator_return_exit",
+        "needs_locals_dict",
+        "unoptimized_locals",
+        "unqualified_exec"
+    )
 
     def __init__(self, provider, name, flags, source_ref):
         while provider.isExpressionOutlineBody():
@@ -38,6 +38,8 @@ class StatementRaiseException(StatementChildrenHavingBase):
         "exception_cause"
     )
 
+    __slots__ = ("reraise_finally",)
+
     def __init__(self, exception_type, exception_value, exception_trace,
                  exception_cause, source_ref):
         if exception_type is None:
@@ -236,6 +238,8 @@ class ExpressionBuiltinMakeException(ExpressionChildrenHavingBase):
         "args",
     )
 
+    __slots__ = ("exception_name",)
+
     def __init__(self, exception_name, args, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
@@ -57,6 +57,12 @@ class StatementsFrame(StatementsSequence):
         "statements" : checkFrameStatements
     }
 
+    __slots__ = (
+        "code_object",
+        "guard_mode",
+        "needs_frame_exception_preserve"
+    )
+
     def __init__(self, statements, guard_mode, code_object, source_ref):
         StatementsSequence.__init__(
             self,
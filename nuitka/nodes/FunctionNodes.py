@@ -62,6 +62,17 @@ from .ParameterSpecs import ParameterSpec, TooManyArguments, matchCall
 class ExpressionFunctionBodyBase(ClosureTakerMixin, ChildrenHavingMixin,
                                  ClosureGiverNodeBase, ExpressionMixin):
 
+    __slots__ = (
+        "early_closure",
+        "flags",
+        "non_local_declarations",
+        "provider",
+        "qualname_provider",
+        "qualname_setup",
+        "taken",
+        "trace_collection"
+    )
+
     def __init__(self, provider, name, code_prefix, is_class, flags, source_ref,
                  body = None):
         ClosureTakerMixin.__init__(
@@ -97,6 +108,9 @@ class ExpressionFunctionBodyBase(ClosureTakerMixin, ChildrenHavingMixin,
         if python_version >= 340:
             self.qualname_provider = provider
 
+            # Set by the building of function and class bodies.
+            self.qualname_setup = None
+
         # Non-local declarations.
         self.non_local_declarations = []
 
@@ -314,8 +328,18 @@ class ExpressionFunctionBody(ExpressionFunctionBodyBase,
         "body" : checkStatementsSequenceOrNone
     }
 
-    if python_version >= 340:
-        qualname_setup = None
+    __slots__ = (
+        "cross_module_use",
+        "doc",
+        "exec_source_ref",
+        "needs_creation",
+        "needs_direct",
+        "needs_locals_dict",
+        "parameters",
+        "return_exception",
+        "unoptimized_locals",
+        "unqualified_exec"
+    )
 
     def __init__(self, provider, name, doc, parameters, flags, source_ref,
                  body = None):
@@ -510,6 +534,8 @@ class ExpressionFunctionCreation(SideEffectsFromChildrenMixin,
         "kw_defaults" : convertNoneConstantOrEmptyDictToNone,
     }
 
+    __slots__ = ("code_object",)
+
     def __init__(self, function_ref, code_object, defaults, kw_defaults,
                  annotations, source_ref):
         assert kw_defaults is None or kw_defaults.isExpression()
@@ -753,6 +779,11 @@ error""" % self.getName()
 class ExpressionFunctionRef(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_FUNCTION_REF"
 
+    __slots__ = (
+        "code_name",
+        "function_body"
+    )
+
     def __init__(self, source_ref, function_body = None, code_name = None):
         assert function_body is not None or code_name is not None
         assert code_name != "None"
@@ -911,6 +942,12 @@ class ExpressionFunctionCall(ExpressionChildrenHavingBase):
 class ExpressionFunctionQualnameRef(CompileTimeConstantExpressionMixin,
                                     NodeBase):
     kind = "EXPRESSION_FUNCTION_QUALNAME_REF"
+
+    __slots__ = (
+        "computed_attribute",
+        "function_body"
+    )
+
     def __init__(self, function_body, source_ref):
         NodeBase.__init__(self, source_ref = source_ref)
         CompileTimeConstantExpressionMixin.__init__(self)
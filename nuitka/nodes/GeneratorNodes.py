@@ -22,7 +22,6 @@ whose implementation lives here. The creation itself also lives here.
 
 """
 
-from nuitka.PythonVersions import python_version
 
 from .Checkers import checkStatementsSequenceOrNone
 from .FunctionNodes import ExpressionFunctionBodyBase
@@ -43,6 +42,8 @@ class ExpressionMakeGeneratorObject(ExpressionChildrenHavingBase):
 
     getGeneratorRef = ExpressionChildrenHavingBase.childGetter("generator_ref")
 
+    __slots__ = ("code_object",)
+
     def __init__(self, generator_ref, code_object, source_ref):
         assert generator_ref.getFunctionBody().isExpressionGeneratorObjectBody()
 
@@ -91,8 +92,13 @@ class ExpressionGeneratorObjectBody(ExpressionFunctionBodyBase,
         "body" : checkStatementsSequenceOrNone
     }
 
-    if python_version >= 340:
-        qualname_setup = None
+    __slots__ = (
+        "exec_source_ref",
+        "needs_generator_return_exit",
+        "needs_locals_dict",
+        "unoptimized_locals",
+        "unqualified_exec"
+    )
 
     def __init__(self, provider, name, flags, source_ref):
         ExpressionFunctionBodyBase.__init__(
@@ -54,6 +54,16 @@ class ExpressionImportModule(NodeBase, ExpressionMixin):
     # about it.
     _warned_about = set()
 
+    __slots__ = (
+        "finding",
+        "found",
+        "found_modules",
+        "import_list",
+        "imported_module",
+        "level",
+        "module_name"
+    )
+
     def __init__(self, module_name, import_list, level, source_ref):
         assert type(module_name) in (str, unicode), type(module_name)
 
@@ -113,6 +123,30 @@ class ExpressionImportModule(NodeBase, ExpressionMixin):
             source_ref  = source_ref
         )
 
+    def __getstate__(self):
+        # Cached module trees must resolve their imports again, as the found
+        # modules are not part of the cached module.
+        result = self.getResolvedState()
+
+        result["found"] = None
+        result["found_modules"] = None
+        result["finding"] = None
+
+        return result
+
+    def getResolvedState(self):
+        """ State of the node, including the resolution of the import.
+
+            This is only valid in the same compilation, where the found
+            modules are known by their names.
+        """
+        result = NodeBase.__getstate__(self)
+
+        # The module itself is only needed to resolve it.
+        result["imported_module"] = None
+
+        return result
+
     def getModuleName(self):
         return self.module_name
 
@@ -282,6 +316,12 @@ class ExpressionImportModuleHard(NodeBase, ExpressionMixin):
 
     """
     kind = "EXPRESSION_IMPORT_MODULE_HARD"
+
+    __slots__ = (
+        "import_name",
+        "module_name"
+    )
+
     def __init__(self, module_name, import_name, source_ref):
         NodeBase.__init__(
             self,
@@ -444,6 +484,8 @@ class ExpressionImportName(ExpressionChildrenHavingBase):
         "module",
     )
 
+    __slots__ = ("import_name",)
+
     def __init__(self, module, import_name, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
@@ -24,7 +24,10 @@ used like this.
 """
 
 
-class MarkLocalsDictIndicator:
+class MarkLocalsDictIndicator(object):
+    # The node classes using this, declare a slot for "needs_locals_dict".
+    __slots__ = ()
+
     def __init__(self):
         self.needs_locals_dict = False
 
@@ -35,13 +38,17 @@ class MarkLocalsDictIndicator:
         self.needs_locals_dict = True
 
 
-class MarkUnoptimizedFunctionIndicator:
+class MarkUnoptimizedFunctionIndicator(object):
     """ Mixin for indication that a function contains an exec or star import.
 
         These do not access global variables directly, but check a locals dictionary
         first, because they do.
     """
 
+    # The node classes using this, declare slots for its attributes
+    # "exec_source_ref", "unoptimized_locals", and "unqualified_exec".
+    __slots__ = ()
+
     def __init__(self):
         self.unoptimized_locals = False
         self.unqualified_exec = False
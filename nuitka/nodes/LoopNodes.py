@@ -40,6 +40,8 @@ class StatementLoop(StatementChildrenHavingBase):
         "body" : checkStatementsSequenceOrNone
     }
 
+    __slots__ = ("loop_variables",)
+
     def __init__(self, body, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
@@ -48,7 +48,11 @@ from .NodeBases import (
 )
 
 
-class PythonModuleMixin:
+class PythonModuleMixin(object):
+    # The node classes using this, declare slots for its attributes "name",
+    # "package", and "package_name".
+    __slots__ = ()
+
     def __init__(self, name, package_name):
         assert type(name) is str, type(name)
         assert '.' not in name, name
@@ -188,6 +192,16 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
         "body": checkStatementsSequenceOrNone
     }
 
+    __slots__ = (
+        "active_functions",
+        "cross_used_functions",
+        "mode",
+        "package",
+        "package_name",
+        "trace_collection",
+        "variables"
+    )
+
     def __init__(self, name, package_name, mode, source_ref):
         ClosureGiverNodeBase.__init__(
             self,
@@ -263,7 +277,7 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
         for function_body in self.active_functions:
             trace_collection = function_body.trace_collection
 
-            for (_variable, _version), variable_trace in trace_collection.getVariableTracesAll().items():
+            for variable_trace in trace_collection.getVariableTracesAll():
                 node = makeTraceNodeName(variable_trace)
 
                 previous = variable_trace.getPrevious()
@@ -368,6 +382,9 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
         if function_body not in self.active_functions:
             self.active_functions.add(function_body)
 
+        from nuitka.ModuleRegistry import onUsedFunction
+        onUsedFunction(self, function_body)
+
     def getUsedFunctions(self):
         return self.active_functions
 
@@ -494,6 +511,17 @@ class UncompiledPythonModule(PythonModuleMixin, NodeBase):
 
     kind = "UNCOMPILED_PYTHON_MODULE"
 
+    __slots__ = (
+        "bytecode",
+        "filename",
+        "name",
+        "package",
+        "package_name",
+        "technical",
+        "used_modules",
+        "user_provided"
+    )
+
     def __init__(self, name, package_name, bytecode, filename, user_provided,
                  technical, source_ref):
         NodeBase.__init__(
@@ -549,6 +577,8 @@ class UncompiledPythonPackage(UncompiledPythonModule):
 class PythonMainModule(CompiledPythonModule):
     kind = "PYTHON_MAIN_MODULE"
 
+    __slots__ = ("main_added",)
+
     def __init__(self, main_added, mode, source_ref):
         CompiledPythonModule.__init__(
             self,
@@ -665,6 +695,12 @@ class PythonShlibModule(PythonModuleMixin, NodeBase):
 
     avoid_duplicates = set()
 
+    __slots__ = (
+        "name",
+        "package",
+        "package_name"
+    )
+
     def __init__(self, name, package_name, source_ref):
         NodeBase.__init__(
             self,
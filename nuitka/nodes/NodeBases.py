@@ -22,6 +22,8 @@ These classes provide the generic base classes available for nodes.
 """
 
 
+import inspect
+
 from nuitka import Options, Tracing, TreeXML, Variables
 from nuitka.__past__ import iterItems
 from nuitka.Constants import isCompileTimeConstantValue
@@ -53,6 +55,21 @@ class NodeCheckMetaClass(type):
         # This is in conflict with either PyDev or Pylint, pylint: disable=C0204
         assert len(bases) == len(set(bases))
 
+        # Nodes have slots, to avoid a "__dict__" for every one. The classes
+        # declare them for the attributes they and the mixins they use assign,
+        # and nodes with named children get one for their values.
+        slot_names = tuple(dictionary.get("__slots__", ()))
+
+        if "named_children" in dictionary or \
+           any(hasattr(base, "named_children") for base in bases):
+            if not any(
+                    "child_values" in getattr(base, "slot_names", ())
+                    for base in bases
+                ):
+                slot_names += ("child_values",)
+
+        dictionary["__slots__"] = slot_names
+
         return type.__new__(cls, name, bases, dictionary)
 
     def __init__(cls, name, bases, dictionary):
@@ -90,6 +107,13 @@ class NodeCheckMetaClass(type):
 
         type.__init__(cls, name, bases, dictionary)
 
+        # All slots of the node class, these make up the state of nodes.
+        cls.slot_names = tuple(
+            slot_name
+            for mro_class in inspect.getmro(cls)
+            for slot_name in mro_class.__dict__.get("__slots__", ())
+        )
+
 # For every node type, there is a test, and then some more members,
 
 # For Python2/3 compatible source, we create a base class that has the metaclass
@@ -98,6 +122,14 @@ NodeMetaClassBase = NodeCheckMetaClass("NodeMetaClassBase", (object,), {})
 
 
 class NodeBase(NodeMetaClassBase):
+    __slots__ = (
+        "parent",
+        "source_ref",
+        "effective_source_ref",
+        # Code generation marks the nodes it has done.
+        "code_generated"
+    )
+
     # String to identify the node class, to be consistent with its name.
     kind = None
 
@@ -116,6 +148,20 @@ class NodeBase(NodeMetaClassBase):
 
     __del__ = counted_del()
 
+    def __getstate__(self):
+        # Nodes have slots only, and these may not all be set.
+        result = {}
+
+        for slot_name in self.slot_names:
+            if hasattr(self, slot_name):
+                result[slot_name] = getattr(self, slot_name)
+
+        return result
+
+    def __setstate__(self, state):
+        for slot_name, value in iterItems(state):
+            setattr(self, slot_name, value)
+
     def __repr__(self):
         # This is to avoid crashes, because of bugs in detail.
         # pylint: disable=W0703
@@ -310,8 +356,8 @@ class NodeBase(NodeMetaClassBase):
         if self.source_ref is not source_ref and \
            Options.isFullCompat() and \
            self.source_ref != source_ref:
-            # An attribute outside of "__init__", so we save one memory for the
-            # most cases. Very few cases involve splitting across lines.
+            # An attribute outside of "__init__", as very few cases involve
+            # splitting across lines, its slot remains unset for most nodes.
             # pylint: disable=W0201
             self.effective_source_ref = source_ref
 
@@ -587,6 +633,14 @@ class NodeBase(NodeMetaClassBase):
 
 
 class CodeNodeBase(NodeBase):
+
+    __slots__ = (
+        "code_name",
+        "code_prefix",
+        "name",
+        "uids"
+    )
+
     def __init__(self, name, code_prefix, source_ref):
         assert name is not None
 
@@ -658,7 +712,11 @@ class CodeNodeBase(NodeBase):
         return self.uids[node.kind]
 
 
-class ChildrenHavingMixin:
+class ChildrenHavingMixin(object):
+    # The node classes using this, get a slot for "child_values" from the
+    # meta class.
+    __slots__ = ()
+
     named_children = ()
 
     checkers = {}
@@ -865,6 +923,14 @@ class ChildrenHavingMixin:
 
 class ClosureGiverNodeBase(CodeNodeBase):
     """ Blass class for nodes that provide variables for closure takers. """
+
+    __slots__ = (
+        "preserver_id",
+        "providing",
+        "temp_scopes",
+        "temp_variables"
+    )
+
     def __init__(self, name, code_prefix, source_ref):
         CodeNodeBase.__init__(
             self,
@@ -977,9 +1043,13 @@ class ClosureGiverNodeBase(CodeNodeBase):
         return self.preserver_id
 
 
-class ClosureTakerMixin:
+class ClosureTakerMixin(object):
     """ Mixin for nodes that accept variables from closure givers. """
 
+    # The node classes using this, declare slots for its attributes
+    # "provider", "early_closure", and "taken".
+    __slots__ = ()
+
     def __init__(self, provider, early_closure):
         assert provider.isParentVariableProvider(), provider
 
@@ -1052,7 +1122,10 @@ class ClosureTakerMixin:
         return self.early_closure
 
 
-class ExpressionMixin:
+class ExpressionMixin(object):
+    # This has no attributes, so no slots.
+    __slots__ = ()
+
     def getValueShape(self):
         return self
 
@@ -1515,12 +1588,13 @@ class ExpressionMixin:
 
 
 class CompileTimeConstantExpressionMixin(ExpressionMixin):
-    # TODO: Do this for all computations, do this in the base class of all
-    # nodes.
-    computed_attribute = None
+    # The node classes using this, declare a slot for "computed_attribute".
+    __slots__ = ()
 
     def __init__(self):
-        pass
+        # TODO: Do this for all computations, do this in the base class of all
+        # nodes.
+        self.computed_attribute = None
 
     def isCompileTimeConstant(self):
         """ Has a value that we can use at compile time.
@@ -1696,6 +1770,9 @@ Predicted '%s' on compiled time constant values.""" % in_node.comparator
 
 
 class ExpressionSpecBasedComputationMixin(ExpressionMixin):
+    # This has no attributes, so no slots.
+    __slots__ = ()
+
     builtin_spec = None
 
     def computeBuiltinSpec(self, trace_collection, given_values):
@@ -1816,7 +1893,10 @@ class ExpressionBuiltinSingleArgBase(ExpressionChildrenHavingBase,
             )
 
 
-class SideEffectsFromChildrenMixin:
+class SideEffectsFromChildrenMixin(object):
+    # This has no attributes, so no slots.
+    __slots__ = ()
+
     def mayHaveSideEffects(self):
         for child in self.getVisitableNodes():
             if child.mayHaveSideEffects():
@@ -31,7 +31,11 @@ from .shapes.StandardShapes import ShapeUnknown, vshape_unknown
 
 class ExpressionOperationBase(ExpressionChildrenHavingBase):
 
-    inplace_suspect = False
+    __slots__ = (
+        "inplace_suspect",
+        "operator",
+        "simulator"
+    )
 
     def __init__(self, operator, simulator, values, source_ref):
         ExpressionChildrenHavingBase.__init__(
@@ -44,6 +48,8 @@ class ExpressionOperationBase(ExpressionChildrenHavingBase):
 
         self.simulator = simulator
 
+        self.inplace_suspect = False
+
     def markAsInplaceSuspect(self):
         self.inplace_suspect = True
 
@@ -220,6 +226,8 @@ class ShapeLargeConstantValuePredictable(ShapeLargeConstantValue):
 class ExpressionOperationBinaryMult(ExpressionOperationBinary):
     kind = "EXPRESSION_OPERATION_BINARY_MULT"
 
+    __slots__ = ("shape",)
+
     def __init__(self, left, right, source_ref):
         ExpressionOperationBinary.__init__(
             self,
@@ -43,6 +43,12 @@ class ExpressionOutlineBody(ExpressionChildrenHavingBase):
         "body",
     )
 
+    __slots__ = (
+        "name",
+        "provider",
+        "temp_scope"
+    )
+
     def __init__(self, provider, name, source_ref, body = None):
         assert name != ""
 
@@ -277,6 +277,8 @@ class StatementGeneratorEntry(NodeBase):
 class StatementPreserveFrameException(NodeBase):
     kind = "STATEMENT_PRESERVE_FRAME_EXCEPTION"
 
+    __slots__ = ("preserver_id",)
+
     def __init__(self, preserver_id, source_ref):
         NodeBase.__init__(
             self,
@@ -316,6 +318,8 @@ class StatementPreserveFrameException(NodeBase):
 class StatementRestoreFrameException(NodeBase):
     kind = "STATEMENT_RESTORE_FRAME_EXCEPTION"
 
+    __slots__ = ("preserver_id",)
+
     def __init__(self, preserver_id, source_ref):
         NodeBase.__init__(
             self,
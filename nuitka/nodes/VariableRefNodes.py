@@ -40,6 +40,12 @@ from .shapes.StandardShapes import ShapeUnknown
 class ExpressionVariableRef(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_VARIABLE_REF"
 
+    __slots__ = (
+        "variable",
+        "variable_name",
+        "variable_trace"
+    )
+
     def __init__(self, variable_name, source_ref, variable = None):
         NodeBase.__init__(
             self,
@@ -356,6 +362,11 @@ Check '%s' on dictionary lowered to dictionary '%s'.""" % (
 class ExpressionTempVariableRef(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_TEMP_VARIABLE_REF"
 
+    __slots__ = (
+        "variable",
+        "variable_trace"
+    )
+
     def __init__(self, variable, source_ref):
         assert variable.isTempVariable()
 
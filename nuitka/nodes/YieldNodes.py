@@ -45,6 +45,8 @@ class ExpressionYield(ExpressionChildrenHavingBase):
 
     named_children = ("expression",)
 
+    __slots__ = ("exception_preserving",)
+
     def __init__(self, expression, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
@@ -91,6 +93,8 @@ class ExpressionYieldFrom(ExpressionChildrenHavingBase):
 
     named_children = ("expression",)
 
+    __slots__ = ("exception_preserving",)
+
     def __init__(self, expression, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
@@ -24,14 +24,23 @@ make others possible.
 
 
 import inspect
+import os
 from logging import debug, info
 
 from nuitka import ModuleRegistry, Options, Variables
+from nuitka.containers.oset import OrderedSet
 from nuitka.importing import ImportCache
 from nuitka.optimizations import Graphs, TraceCollections
 from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
+from nuitka.tree import ModuleTreeCache
+from nuitka.tree.InternalModule import (
+    getInternalModule,
+    getOnceFunctionName,
+    getOnceFunctionValue
+)
 from nuitka.utils import MemoryUsage
+from nuitka.utils.Timing import withTimedPhase
 
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
 from .Tags import TagSet
@@ -53,6 +62,9 @@ def _attemptRecursion(module):
 
 tag_set = None
 
+# The files changes were signalled for, only collected in worker processes.
+_changed_filenames = None
+
 def signalChange(tags, source_ref, message):
     """ Indicate a change to the optimization framework.
 
@@ -68,11 +80,14 @@ def signalChange(tags, source_ref, message):
 
     tag_set.onSignal(tags)
 
+    if _changed_filenames is not None:
+        _changed_filenames.add(source_ref.getFilename())
+
 # Use this globally from there, without cyclic dependency.
 TraceCollections.signalChange = signalChange
 
 
-def optimizeCompiledPythonModule(module):
+def optimizeCompiledPythonModule(module, collected_tags = None):
     if _progress:
         printLine(
             "Doing module local optimizations for '{module_name}'.".format(
@@ -96,6 +111,9 @@ def optimizeCompiledPythonModule(module):
 
         Graphs.onModuleOptimizationStep(module)
 
+        if collected_tags is not None:
+            collected_tags.update(tag_set)
+
         # Search for local change tags.
         for tag in tag_set:
             if tag == "new_code":
@@ -148,12 +166,122 @@ def optimizeShlibModule(module):
     Plugins.considerImplicitImports(module, signal_change = signalChange)
 
 
+# Dependency tracking of compiled modules, so modules need not be optimized
+# again, if neither they nor the modules they use changed. The ticks count
+# module optimizations, and give an order to changes.
+_tick = 0
+
+# Per module, the tick of its last optimization, the variable completeness
+# then, the modules and functions it used, and if it was left unchanged.
+_module_states = {}
+
+# Per module, the tick of its last change.
+_changed_ticks = {}
+
+# Per module adopted from worker processes in this pass, the tags signalled
+# while optimizing it there.
+_adopted_module_tags = {}
+
+
+def _isDirtyModule(module):
+    if module not in _module_states:
+        return True
+
+    tick, complete, recording, clean = _module_states[module]
+
+    if not clean or complete != Variables.complete:
+        return True
+
+    # Changes of the module itself were done by optimizing it.
+    for used_module, _function_body in recording:
+        if used_module is not module and \
+           _changed_ticks.get(used_module, 0) > tick:
+            return True
+
+    return False
+
+
+def _markModuleChanged(module):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _tick
+    _tick += 1
+
+    _changed_ticks[module] = _tick
+
+    if module in _module_states:
+        _module_states[module] = _module_states[module][:3] + (False,)
+
+
+def _optimizeCompiledPythonModuleTracked(module):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _tick
+
+    if module in _adopted_module_tags:
+        if _progress:
+            printLine(
+                "Adopting module '{module_name}' from worker process.".format(
+                    module_name = module.getFullName()
+                )
+            )
+
+        # Do the same uses, and give the same changes, as optimizing did in
+        # the worker.
+        ModuleRegistry.replayUsedRecording(_module_states[module][2])
+
+        tags = _adopted_module_tags.pop(module)
+        tag_set.onSignal(tags)
+
+        return any(tag != "new_code" for tag in tags)
+
+    if not _isDirtyModule(module):
+        if _progress:
+            printLine(
+                "Skipping unchanged module '{module_name}'.".format(
+                    module_name = module.getFullName()
+                )
+            )
+
+        # Do the same uses again, as optimizing would.
+        ModuleRegistry.replayUsedRecording(_module_states[module][2])
+
+        return False
+
+    ModuleRegistry.startUsedRecording()
+
+    try:
+        changed = optimizeCompiledPythonModule(module)
+    finally:
+        recording = ModuleRegistry.stopUsedRecording()
+
+    _tick += 1
+
+    if changed:
+        _changed_ticks[module] = _tick
+
+        # Functions of other modules, e.g. helpers of the internal module,
+        # were optimized as part of it, so they may have changed too.
+        for used_module, function_body in recording:
+            if function_body is not None and used_module is not module:
+                _changed_ticks[used_module] = _tick
+
+    _module_states[module] = (
+        _tick,
+        Variables.complete,
+        recording,
+        not changed
+    )
+
+    return changed
+
+
 def optimizeModule(module):
     if module.isPythonShlibModule():
         optimizeShlibModule(module)
         changed = False
     elif module.isCompiledPythonModule():
-        changed = optimizeCompiledPythonModule(module)
+        changed = _optimizeCompiledPythonModuleTracked(module)
     else:
         optimizeUncompiledPythonModule(module)
         changed = False
@@ -285,6 +413,17 @@ def optimizeUnusedTempVariables(provider):
             provider.removeTempVariable(temp_variable)
 
 
+def _getVariablesSignature(module):
+    result = [len(module.getTempVariables())]
+
+    for function_body in module.getUsedFunctions():
+        result.append(len(function_body.getUserLocalVariables()))
+        result.append(len(function_body.getClosureVariables()))
+        result.append(len(function_body.getTempVariables()))
+
+    return result
+
+
 def optimizeVariables(module):
     if module.isCompiledPythonModule():
         if Variables.complete:
@@ -314,23 +453,261 @@ after that.""".format(
     printLine(output)
 
 
-def restoreFromXML(text):
-    from nuitka.TreeXML import fromString
-    from nuitka.nodes.NodeBases import fromXML
-    xml = fromString(text)
+# Modules to be optimized by the worker processes, and the modules known to the
+# main process, these inherit it by forking.
+_worker_modules = ()
+_known_modules = ()
+_known_module_indexes = {}
+
+
+def _getKnownModules():
+    result = set(ModuleRegistry.getRootModules())
+    result.update(ModuleRegistry.getActiveModules())
+    result.update(ModuleRegistry.getDoneModules())
+    result.update(ImportCache.getImportedModules())
+    result.add(getInternalModule())
+
+    return tuple(result)
+
+
+def _encodeUsedRecording(module, recording):
+    """ Encode the used modules and functions of a worker for the main process.
+
+        Modules are given by their index in the known modules, and functions
+        by their code name, or for helpers, by their name. Returns None if
+        anything is not known to the main process, e.g. modules only recursed
+        to in the worker.
+    """
+    result = []
+
+    for used_module, function_body in recording:
+        module_index = _known_module_indexes.get(used_module)
+
+        if module_index is None:
+            return None
+
+        if function_body is None:
+            function_name = None
+        elif used_module is module:
+            function_name = function_body.getCodeName()
+        else:
+            helper_name = getOnceFunctionName(function_body)
+
+            if helper_name is None:
+                return None
+
+            function_name = "helper:" + helper_name
+
+        result.append((module_index, function_name))
+
+    return result
+
+
+def _decodeUsedRecording(module, used_recording):
+    """ Decode the result of "_encodeUsedRecording" in the main process.
+
+        Returns None if it cannot be replayed, because a helper function was
+        not yet optimized by the main process.
+    """
+    result = OrderedSet()
+
+    for module_index, function_name in used_recording:
+        used_module = _known_modules[module_index]
+
+        if function_name is None:
+            function_body = None
+        elif function_name.startswith("helper:"):
+            function_body = getOnceFunctionValue(function_name[7:])
+
+            # Helpers are optimized with the modules using them, only in the
+            # worker is not enough.
+            if function_body.trace_collection is None:
+                return None
+        else:
+            function_body = module.getFunctionFromCodeName(function_name)
+
+        result.add((used_module, function_body))
+
+    return result
 
-    module = fromXML(
-        provider = None,
-        xml      = xml
+
+def _optimizeModuleInWorker(module_index):
+    """ Optimize a module in a worker process, and return its tree.
+
+        Returns a tuple of change indicator, the dumped tree, the encoded
+        used modules and functions, and the signalled tags, or None if the
+        module could not be handled, then the main process does it. The used
+        modules are only given, if the module can be adopted as it is, and
+        then the tree includes the resolved imports.
+    """
+
+    # The tag set is global, so it can react to changes without context.
+    # pylint: disable=W0603
+    global tag_set, _changed_filenames
+    tag_set = TagSet()
+    _changed_filenames = set()
+
+    module = _worker_modules[module_index]
+
+    def optimizeAndDump():
+        collected_tags = TagSet()
+
+        ModuleRegistry.startUsedRecording()
+
+        try:
+            changed = optimizeCompiledPythonModule(module, collected_tags)
+        finally:
+            recording = ModuleRegistry.stopUsedRecording()
+
+        # Changes of other code, e.g. of helper functions, only happened in
+        # this process, so the main process has to optimize the module again.
+        _changed_filenames.discard(module.getSourceReference().getFilename())
+
+        if _changed_filenames:
+            used_recording = None
+        else:
+            used_recording = _encodeUsedRecording(module, recording)
+
+        data = ModuleTreeCache.dumpModuleTree(
+            module           = module,
+            resolved_imports = used_recording is not None
+        )
+
+        return changed, data, used_recording, tuple(collected_tags)
+
+    try:
+        return ModuleTreeCache.runWithDeepStack(optimizeAndDump)
+    except Exception as e: # Catching anything, main process will do it, pylint: disable=W0703
+        debug(
+            "Not optimizing module '%s' in worker: %s" % (
+                module.getFullName(),
+                e
+            )
+        )
+
+        return None
+
+
+def _optimizeModulesInWorkers(modules, changed_modules):
+    """ Optimize compiled modules in worker processes.
+
+        The main process adopts the resulting trees. The modules and functions
+        used by the workers, and the tags they signalled, are merged, so the
+        modules are not optimized again in this pass, and later only if they
+        or modules they use changed. Modules that changed code of others, e.g.
+        helper functions, or recursed to new modules, are still optimized by
+        the main process, but their trees are optimized already, so that is
+        cheap.
+    """
+
+    # Using global here, as forked processes inherit it, pylint: disable=W0603
+    global _worker_modules, _known_modules, _known_module_indexes, _tick
+
+    # Only imported when needed, as it's quite costly.
+    import multiprocessing
+
+    _worker_modules = tuple(modules)
+    _known_modules = _getKnownModules()
+    _known_module_indexes = dict(
+        (module, module_index)
+        for module_index, module in enumerate(_known_modules)
     )
 
-    return module
+    if _progress:
+        printLine(
+            "Optimizing {count:d} modules in worker processes.".format(
+                count = len(_worker_modules)
+            )
+        )
 
+    pool = multiprocessing.Pool(
+        processes = min(Options.getOptimizationJobLimit(), len(_worker_modules))
+    )
+
+    try:
+        results = pool.map(
+            _optimizeModuleInWorker,
+            range(len(_worker_modules)),
+            chunksize = 1
+        )
+    finally:
+        pool.close()
+        pool.join()
+
+    adopted_modules = {}
+    worker_changed_modules = []
+
+    for module, result in zip(_worker_modules, results):
+        if result is None:
+            continue
+
+        changed, data, used_recording, tags = result
+
+        ModuleTreeCache.runWithDeepStack(
+            ModuleTreeCache.loadModuleTree,
+            module,
+            data
+        )
+
+        if used_recording is not None:
+            recording = _decodeUsedRecording(module, used_recording)
+
+            if recording is not None:
+                adopted_modules[module] = recording
+                _adopted_module_tags[module] = tags
+
+        if changed:
+            worker_changed_modules.append(module)
+
+    # The workers optimized all modules at the same time, so their changes are
+    # after all of these, and make the adopted modules using them dirty.
+    _tick += 1
+
+    for module, recording in adopted_modules.items():
+        _module_states[module] = (
+            _tick,
+            Variables.complete,
+            recording,
+            module not in worker_changed_modules
+        )
+
+    for module in worker_changed_modules:
+        changed_modules.add(module)
+
+        _markModuleChanged(module)
+
+    if _progress:
+        printLine(
+            "Adopted {count:d} modules from worker processes.".format(
+                count = len(adopted_modules)
+            )
+        )
+
+    _worker_modules = ()
+    _known_modules = ()
+    _known_module_indexes = {}
+
+
+def _shallOptimizeInWorkers():
+    return Options.getOptimizationJobLimit() > 1 and hasattr(os, "fork")
+
+
+pass_count = 0
 
 def makeOptimizationPass(initial_pass):
     """ Make a single pass for optimization, indication potential completion.
 
     """
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global pass_count
+    pass_count += 1
+
+    with withTimedPhase("optimization pass %d" % pass_count, children = True):
+        return _makeOptimizationPass(initial_pass)
+
+
+def _makeOptimizationPass(initial_pass):
     finished = True
 
     ModuleRegistry.startTraversal()
@@ -341,7 +718,32 @@ def makeOptimizationPass(initial_pass):
         else:
             printLine("Next global optimization pass.")
 
+    # Modules already handled by worker processes in this pass, and the ones
+    # that were changed by them.
+    worker_modules = set()
+    worker_changed_modules = set()
+
+    # Adopted modules not reached in the last pass are optimized normally.
+    _adopted_module_tags.clear()
+
     while True:
+        if _shallOptimizeInWorkers():
+            modules = [
+                module
+                for module in ModuleRegistry.getActiveModules()
+                if module.isCompiledPythonModule()
+                # The helper functions of the internal module are shared
+                # with other modules, and must stay the same.
+                if not module.isInternalModule()
+                if module not in worker_modules
+                if _isDirtyModule(module)
+            ]
+
+            if len(modules) > 1:
+                worker_modules.update(modules)
+
+                _optimizeModulesInWorkers(modules, worker_changed_modules)
+
         current_module = ModuleRegistry.nextModule()
 
         if current_module is None:
@@ -355,9 +757,10 @@ def makeOptimizationPass(initial_pass):
         global tag_set
         tag_set = TagSet()
 
-        changed = optimizeModule(current_module)
+        with withTimedPhase("module optimization", current_module.getFullName()):
+            changed = optimizeModule(current_module)
 
-        if changed:
+        if changed or current_module in worker_changed_modules:
             finished = False
 
     # Unregister collection traces from now unused code, dropping the trace
@@ -372,8 +775,18 @@ def makeOptimizationPass(initial_pass):
 
                 function.trace_collection = None
 
-    for current_module in ModuleRegistry.getDoneModules():
-        optimizeVariables(current_module)
+    with withTimedPhase("variable optimization"):
+        for current_module in ModuleRegistry.getDoneModules():
+            if current_module.isCompiledPythonModule():
+                variables_signature = _getVariablesSignature(current_module)
+
+                optimizeVariables(current_module)
+
+                # Removed variables need the module to be optimized again.
+                if variables_signature != _getVariablesSignature(current_module):
+                    _markModuleChanged(current_module)
+            else:
+                optimizeVariables(current_module)
 
     return finished
 
@@ -391,39 +804,21 @@ def optimize():
     finished = makeOptimizationPass(False)
 
     if Options.isExperimental():
-        new_roots = ModuleRegistry.root_modules.__class__()  # @UndefinedVariable
-
-        for module in tuple(ModuleRegistry.getDoneModules()):
-            ModuleRegistry.root_modules.remove(module)
-
-            if module.isPythonShlibModule():
+        # Round trip the trees through their serialization, which must not
+        # change anything about them.
+        def roundTripTree(module):
+            try:
+                data = ModuleTreeCache.dumpModuleTree(module)
+            except ModuleTreeCache.UncachableModuleTree:
+                return
+
+            ModuleTreeCache.loadModuleTree(module, data)
+
+        for module in ModuleRegistry.getDoneModules():
+            if not module.isCompiledPythonModule():
                 continue
 
-            text = module.asXmlText()
-            open("out.xml", 'w').write(text)
-            restored = restoreFromXML(text)
-            retext = restored.asXmlText()
-            open("out2.xml", 'w').write(retext)
-
-            assert module.getOutputFilename() == restored.getOutputFilename(), \
-               (module.getOutputFilename(),restored.getOutputFilename())
-
-            # The variable versions give diffs.
-            if False: # To manually enable, pylint: disable=W0125
-                import difflib
-                diff = difflib.unified_diff(
-                    text.splitlines(),
-                    retext.splitlines(),
-                    "xml orig",
-                    "xml reloaded"
-                )
-                for line in diff:
-                    printLine(line)
-
-            new_roots.add(restored)
-
-        ModuleRegistry.root_modules = new_roots
-        ModuleRegistry.startTraversal()
+            ModuleTreeCache.runWithDeepStack(roundTripTree, module)
 
     # Demote to bytecode, now that imports had a chance to be resolved, and
     # dependencies were handled.
@@ -50,10 +50,136 @@ from .VariableTraces import (
 signalChange = None
 
 
+class VariableActives(object):
+    """ Copy on write mapping of variables to their active versions.
+
+        Branches of a trace collection start out with the same active versions,
+        and most of the time change only few of them. Forking makes the
+        current content a shared layer, that is not changed anymore, and the
+        branches only record their own changes on top of it. Merging then
+        only needs to consider the variables changed in the layers above the
+        one the branches have in common.
+    """
+
+    __slots__ = ("base", "changes")
+
+    def __init__(self, base = None, changes = None):
+        self.base = base
+        self.changes = {} if changes is None else changes
+
+    def get(self, variable):
+        layer = self
+
+        while layer is not None:
+            changes = layer.changes
+
+            if variable in changes:
+                return changes[variable]
+
+            layer = layer.base
+
+        return None
+
+    def __setitem__(self, variable, version):
+        self.changes[variable] = version
+
+    def keys(self):
+        result = set()
+
+        layer = self
+
+        while layer is not None:
+            result.update(layer.changes)
+            layer = layer.base
+
+        return result
+
+    def items(self):
+        return [
+            (variable, self.get(variable))
+            for variable in
+            self.keys()
+        ]
+
+    def fork(self):
+        """ Make a copy of the mapping, both can then be changed separately.
+
+        """
+        changes = self.changes
+
+        if changes:
+            base = self.base
+
+            # Keep the number of layers low, by combining layers that are not
+            # larger than the ones above them.
+            while base is not None and len(changes) >= len(base.changes):
+                for variable, version in iterItems(base.changes):
+                    if variable not in changes:
+                        changes[variable] = version
+
+                base = base.base
+
+            self.base = VariableActives(base, changes)
+            self.changes = {}
+
+        return VariableActives(self.base)
+
+    def getLayers(self):
+        layer = self.base
+
+        while layer is not None:
+            yield layer
+
+            layer = layer.base
+
+    def getChanges(self, common_base):
+        """ The versions of variables changed above the common base layer.
+
+        """
+        layers = []
+
+        layer = self
+
+        while layer is not common_base:
+            layers.append(layer)
+            layer = layer.base
+
+        result = {}
+
+        for layer in reversed(layers):
+            result.update(layer.changes)
+
+        return result
+
+
+def _getCommonBase(variable_actives):
+    """ The top most layer shared by all of the given mappings, if any.
+
+    """
+    common_layers = None
+
+    for actives in variable_actives:
+        layers = set(actives.getLayers())
+
+        if common_layers is None:
+            common_layers = layers
+        else:
+            common_layers &= layers
+
+    if not common_layers:
+        return None
+
+    for layer in variable_actives[0].getLayers():
+        if layer in common_layers:
+            return layer
+
+    assert False
+
+
 class CollectionTracingMixin:
     def __init__(self):
         # For functions, when we are in here, the currently active one,
-        self.variable_actives = {}
+        self.variable_actives = VariableActives()
 
     def getVariableCurrentTrace(self, variable):
         return self.getVariableTrace(
@@ -65,16 +191,18 @@ class CollectionTracingMixin:
         self.variable_actives[variable] = version
 
     def getCurrentVariableVersion(self, variable):
-        try:
-            return self.variable_actives[variable]
-        except KeyError:
+        version = self.variable_actives.get(variable)
+
+        if version is None:
             # Initialize variables on the fly.
             if not self.hasVariableTrace(variable, 0):
                 self.initVariable(variable)
 
             self.markCurrentVariableTrace(variable, 0)
 
-            return self.variable_actives[variable]
+            version = 0
+
+        return version
 
     def getActiveVariables(self):
         return self.variable_actives.keys()
@@ -135,7 +263,8 @@ class CollectionStartpointMixin:
         self.variable_versions = {}
 
         # The full trace of a variable with a version for the function or module
-        # this is.
+        # this is. Per variable, a dictionary of its traces by version, so the
+        # traces of one variable can be found quickly.
         self.variable_traces = {}
 
         self.break_collections = None
@@ -204,30 +333,36 @@ class CollectionStartpointMixin:
         return self.exception_collections
 
     def hasVariableTrace(self, variable, version):
-        return (variable, version) in self.variable_traces
+        version_traces = self.variable_traces.get(variable)
+
+        return version_traces is not None and version in version_traces
 
     def getVariableTrace(self, variable, version):
-        return self.variable_traces[(variable, version)]
+        return self.variable_traces[variable][version]
 
     def getVariableTraces(self, variable):
-        result = []
-
-        for key, variable_trace in iterItems(self.variable_traces):
-            candidate = key[0]
+        version_traces = self.variable_traces.get(variable)
 
-            if variable is candidate:
-                result.append(variable_trace)
-
-        return result
+        if version_traces is None:
+            return []
+        else:
+            return list(version_traces.values())
 
     def getVariableTracesAll(self):
-        return self.variable_traces
+        return [
+            variable_trace
+            for version_traces in self.variable_traces.values()
+            for variable_trace in version_traces.values()
+        ]
 
     def addVariableTrace(self, variable, version, trace):
-        key = variable, version
+        version_traces = self.variable_traces.get(variable)
+
+        if version_traces is None:
+            version_traces = self.variable_traces[variable] = {}
 
-        assert key not in self.variable_traces, (key, self)
-        self.variable_traces[key] = trace
+        assert version not in version_traces, (variable, version, self)
+        version_traces[version] = trace
 
     def addVariableMergeMultipleTrace(self, variable, traces):
         version = variable.allocateTargetNumber()
@@ -244,15 +379,14 @@ class CollectionStartpointMixin:
 
     def dumpTraces(self):
         debug("Constraint collection state: %s", self)
-        for _variable_desc, variable_trace in sorted(iterItems(self.variable_traces)):
-
+        for variable_trace in self.getVariableTracesAll():
             # debug( "%r: %r", variable_trace )
             variable_trace.dump()
 
     def dumpActiveTraces(self):
         Tracing.printSeparator()
         Tracing.printLine("Active are:")
-        for variable, _version in sorted(self.variable_actives.iteritems()):
+        for variable in self.variable_actives.keys():
             self.getVariableCurrentTrace(variable).dump()
 
         Tracing.printSeparator()
@@ -612,21 +746,40 @@ class TraceCollectionBase(CollectionTracingMixin):
             self.replaceBranch(collections[0])
             return
 
+        variable_actives = [
+            collection.variable_actives
+            for collection in
+            collections
+        ]
+
+        # Only variables changed in some branch since the state they have in
+        # common, can have different versions.
+        common_base = _getCommonBase(variable_actives)
+
         variable_versions = {}
+        variable_changes = {}
 
-        for collection in collections:
-            for variable, version in iterItems(collection.variable_actives):
+        for actives in variable_actives:
+            for variable, version in iterItems(actives.getChanges(common_base)):
                 if variable not in variable_versions:
                     variable_versions[variable] = set([version])
+                    variable_changes[variable] = 1
                 else:
                     variable_versions[variable].add(version)
+                    variable_changes[variable] += 1
+
+        # Branches that did not change it, have the common version, which if
+        # not active, means not yet initialized.
+        for variable, versions in iterItems(variable_versions):
+            if variable_changes[variable] < len(variable_actives):
+                version = None
+
+                if common_base is not None:
+                    version = common_base.get(variable)
 
-        for collection in collections:
-            for variable, versions in iterItems(variable_versions):
-                if variable not in collection.variable_actives:
-                    versions.add(0)
+                versions.add(0 if version is None else version)
 
-        self.variable_actives = {}
+        self.variable_actives = VariableActives(common_base)
 
         for variable, versions in iterItems(variable_versions):
             if len(versions) == 1:
@@ -644,7 +797,19 @@ class TraceCollectionBase(CollectionTracingMixin):
             self.markCurrentVariableTrace(variable, version)
 
     def replaceBranch(self, collection_replace):
-        self.variable_actives.update(collection_replace.variable_actives)
+        variable_actives = self.variable_actives
+        replace_actives = collection_replace.variable_actives
+
+        # The variables only we have, remain active.
+        changes = variable_actives.getChanges(
+            _getCommonBase((variable_actives, replace_actives))
+        )
+
+        for variable, version in iterItems(changes):
+            if replace_actives.get(variable) is None:
+                replace_actives[variable] = version
+
+        self.variable_actives = replace_actives
         collection_replace.variable_actives = None
 
     def onLoopBreak(self, collection = None):
@@ -729,7 +894,7 @@ class TraceCollectionBranch(TraceCollectionBase):
             parent = parent
         )
 
-        self.variable_actives = dict(parent.variable_actives)
+        self.variable_actives = parent.variable_actives.fork()
 
     def computeBranch(self, branch):
         if branch.isStatementsSequence():
@@ -760,7 +925,7 @@ class TraceCollectionBranch(TraceCollectionBase):
     def dumpActiveTraces(self):
         Tracing.printSeparator()
         Tracing.printLine("Active are:")
-        for variable, _version in sorted(self.variable_actives.iteritems()):
+        for variable in self.variable_actives.keys():
             self.getVariableCurrentTrace(variable).dump()
 
         Tracing.printSeparator()
@@ -35,9 +35,22 @@ from logging import debug
 from nuitka.utils import InstanceCounters
 
 
-class VariableTraceBase:
+class VariableTraceBase(object):
     # We are going to have many instance attributes, pylint: disable=R0902
 
+    # There are many traces, so avoid having a dictionary for each.
+    __slots__ = (
+        "owner",
+        "variable",
+        "version",
+        "usage_count",
+        "has_potential_usages",
+        "has_releases",
+        "has_name_usages",
+        "is_escaped",
+        "previous"
+    )
+
     @InstanceCounters.counted_init
     def __init__(self, owner, variable, version, previous):
         self.owner = owner
@@ -155,6 +168,8 @@ class VariableTraceBase:
 
 
 class VariableTraceUninit(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -193,6 +208,8 @@ class VariableTraceUninit(VariableTraceBase):
 
 
 class VariableTraceInit(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version):
         VariableTraceBase.__init__(
             self,
@@ -231,6 +248,8 @@ class VariableTraceInit(VariableTraceBase):
 
 
 class VariableTraceUnknown(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -290,6 +309,8 @@ class VariableTraceUnknown(VariableTraceBase):
 
 
 class VariableTraceAssign(VariableTraceBase):
+    __slots__ = ("assign_node", "replace_it")
+
     def __init__(self, owner, assign_node, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -352,6 +373,9 @@ class VariableTraceMerge(VariableTraceBase):
         SSA theory. Also used for merging multiple "return", "break" or
         "continue" exits.
     """
+
+    __slots__ = ()
+
     def __init__(self, variable, version, traces):
         VariableTraceBase.__init__(
             self,
@@ -451,6 +475,9 @@ class VariableTraceLoopMerge(VariableTraceBase):
         all of the variable versions at loop continue times.
         .
     """
+
+    __slots__ = ("loop_finished",)
+
     def __init__(self, variable, version, previous):
         VariableTraceBase.__init__(
             self,
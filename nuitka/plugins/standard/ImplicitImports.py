@@ -22,8 +22,7 @@ be told that. This encodes the knowledge we have for various modules. Feel free
 to add to this and submit patches to make it more complete.
 """
 
-import shutil
-
+from nuitka.freezer.DistFolder import copyDistFile
 from nuitka.plugins.PluginBase import NuitkaPluginBase
 from nuitka.PythonVersions import python_version
 from nuitka.utils.SharedLibraries import locateDLL
@@ -170,7 +169,11 @@ class NuitkaPluginPopularImplicitImports(NuitkaPluginBase):
             uuid_dll_path = locateDLL("uuid")
             dist_dll_path = joinpath(dist_dir, basename(uuid_dll_path))
 
-            shutil.copy(uuid_dll_path, dist_dir)
+            copyDistFile(
+                source_path = uuid_dll_path,
+                target_path = dist_dll_path,
+                is_binary   = True
+            )
 
             return (
                 (dist_dll_path, None),
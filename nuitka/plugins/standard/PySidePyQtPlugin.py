@@ -21,12 +21,13 @@ To run properly, these need the Qt plug-ins copied along, which have their
 own dependencies.
 """
 
-import shutil
+import os
 import subprocess
 import sys
 from logging import info
 
 from nuitka import Options
+from nuitka.freezer.DistFolder import copyDistFiles
 from nuitka.plugins.PluginBase import NuitkaPluginBase
 from nuitka.PythonVersions import python_version
 from nuitka.utils import Utils
@@ -94,17 +95,27 @@ if os.path.exists(guess_path):
                 "qt-plugins"
             )
 
-            shutil.copytree(
-                plugin_dir,
-                target_plugin_dir
-            )
+            copies = [
+                (
+                    filename,
+                    Utils.joinpath(
+                        target_plugin_dir,
+                        os.path.relpath(filename, plugin_dir)
+                    ),
+                    True
+                )
+                for filename in
+                sorted(Utils.getFileList(plugin_dir))
+            ]
+
+            copyDistFiles(copies)
 
             info("Copying all Qt plug-ins to '%s'." % target_plugin_dir)
 
             return [
-                (filename, full_name)
-                for filename in
-                Utils.getFileList(target_plugin_dir)
+                (target_filename, full_name)
+                for _filename, target_filename, _is_binary in
+                copies
             ]
 
         return ()
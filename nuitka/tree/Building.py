@@ -106,8 +106,9 @@ from nuitka.tree.ReformulationForLoopStatements import (
 )
 from nuitka.tree.ReformulationWhileLoopStatements import buildWhileLoopNode
 from nuitka.utils import MemoryUsage, Utils
+from nuitka.utils.Timing import withTimedPhase
 
-from . import SyntaxErrors
+from . import ModuleTreeCache, SyntaxErrors
 from .Helpers import (
     buildNode,
     buildNodeList,
@@ -1107,6 +1108,15 @@ class CodeTooComplexCode(Exception):
 
 
 def createModuleTree(module, source_ref, source_code, is_main):
+    with withTimedPhase("tree building", module.getFullName()):
+        _createModuleTree(module, source_ref, source_code, is_main)
+
+
+def _createModuleTree(module, source_ref, source_code, is_main):
+    if Options.shallCacheModuleTrees() and \
+       ModuleTreeCache.restoreModuleTree(module, source_code, is_main):
+        return
+
     if Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
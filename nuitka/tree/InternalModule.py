@@ -30,6 +30,9 @@ internal_module = None
 
 internal_source_ref = fromFilename("internal").atInternal()
 
+# Functions decorated with "once_decorator", by their qualified names.
+once_functions = {}
+
 # Cache result.
 def once_decorator(func):
     func.cached_value = None
@@ -41,9 +44,36 @@ def once_decorator(func):
 
         return func.cached_value
 
+    once_functions[func.__module__ + '.' + func.__name__] = func, replacement
+
     return replacement
 
 
+def getOnceFunctionName(value):
+    """ Name of the "once_decorator" function that created a value, if any.
+
+        This allows to refer to internal helper function bodies, e.g. from
+        cached module trees, without owning them.
+    """
+    for name, (func, _replacement) in once_functions.items():
+        if func.cached_value is value:
+            return name
+
+    return None
+
+
+def getOnceFunctionValue(name):
+    """ Value of a "once_decorator" function given its qualified name.
+
+    """
+    module_name = name.rsplit('.', 1)[0]
+
+    # Importing the module registers its functions.
+    __import__(module_name)
+
+    return once_functions[name][1]()
+
+
 def getInternalModule():
     # Using global here, as this is really a about the internal module as a
     # singleton, pylint: disable=W0603
@@ -0,0 +1,481 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Cache of optimized module trees.
+
+Building and optimizing the node tree of a module is expensive, and for an
+unchanged module, the result is going to be the same as the last time. With
+"--module-cache", the trees of compiled modules are saved to the cache
+directory after optimization, and on the next compilation, they are restored
+instead of being built from source again.
+
+The key of a cached tree is made from the source code, module name, filename,
+compilation mode, the Nuitka and Python versions, and the options that can
+affect the tree. Any change of these, leads to a different key, and old cache
+entries are then not used anymore.
+
+Restored trees still go through optimization, but being in final form already,
+there is little left to do for them. Import resolution is not part of the
+cached state, it is redone, so changes in which modules are found or included
+are noticed.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from io import BytesIO
+from logging import debug, info, warning
+
+from nuitka import Options
+from nuitka.nodes.FunctionNodes import ExpressionFunctionBodyBase
+from nuitka.nodes.ModuleNodes import PythonModuleMixin
+from nuitka.nodes.NodeBases import NodeBase
+from nuitka.PythonVersions import python_version
+from nuitka.utils import Utils
+from nuitka.utils.AppDirs import getCacheSubDir, trimCacheDir
+
+from .InternalModule import getOnceFunctionName, getOnceFunctionValue
+
+# Work around for CPython 3.x removal of "cpickle".
+try:
+    import cPickle as cpickle
+except ImportError:
+    import pickle as cpickle
+
+if python_version >= 300:
+    pickle_protocol = cpickle.HIGHEST_PROTOCOL
+else:
+    pickle_protocol = 2
+
+
+_cache_key_base = None
+
+def _getCacheKeyBase():
+    """ The part of cache keys that is the same for all modules.
+
+        This covers the Nuitka version and its own source files, the Python
+        version, and the options.
+    """
+
+    # Using global here, as this is computed once only, pylint: disable=W0603
+    global _cache_key_base
+
+    if _cache_key_base is None:
+        parts = [
+            Options.getVersion(),
+            sys.version,
+            repr(sys.flags)
+        ]
+
+        # Options not affecting trees are marked as such in their definition.
+        tree_options = Options.getTreeAffectingOptions()
+
+        for option_name in sorted(tree_options):
+            parts.append("%s=%r" % (option_name, tree_options[option_name]))
+
+        # During development, the version doesn't change, but the code does,
+        # so consider the state of Nuitka source files too.
+        nuitka_dir = Utils.dirname(Utils.dirname(Utils.abspath(__file__)))
+
+        for filename in sorted(Utils.getFileList(nuitka_dir)):
+            if filename.endswith(".py") and "inline_copy" not in filename:
+                stat_result = os.stat(filename)
+
+                parts.append(
+                    "%s:%d:%d" % (
+                        filename[len(nuitka_dir):],
+                        stat_result.st_size,
+                        stat_result.st_mtime
+                    )
+                )
+
+        _cache_key_base = '\n'.join(parts)
+
+    return _cache_key_base
+
+
+def _getModuleCacheKey(module, source_code, is_main):
+    hash_value = hashlib.md5()
+
+    key_parts = (
+        _getCacheKeyBase(),
+        module.__class__.__name__,
+        module.getFullName(),
+        module.getSourceReference().getFilename(),
+        module.mode,
+        str(is_main)
+    )
+
+    for key_part in key_parts:
+        hash_value.update(key_part.encode("utf-8"))
+        hash_value.update(b'\0')
+
+    if type(source_code) is not bytes:
+        source_code = source_code.encode("utf-8", "backslashreplace")
+
+    hash_value.update(source_code)
+
+    return hash_value.hexdigest()
+
+
+def _getCacheFilename(cache_key):
+    return Utils.joinpath(
+        getCacheSubDir("module-trees"),
+        cache_key + ".pickle"
+    )
+
+
+class UncachableModuleTree(Exception):
+    """ The module tree references things that cannot be cached with it.
+
+    """
+    pass
+
+
+def _getModuleState(module):
+    result = module.__getstate__()
+
+    # The containing package is looked up again, much like imports are.
+    result["package"] = None
+
+    return result
+
+
+def writeModuleTree(module, output_file, resolved_imports = False):
+    """ Write the tree of a module to a binary stream.
+
+        The stream is a series of pickled records, one per node, starting
+        with the module, in which other nodes are only referenced by their
+        index. Pickling therefore doesn't recurse along the tree, and the
+        records are written as they are made, not collected in memory. The
+        pickler memo is shared by all records, so variables, source
+        references, and names are written only once.
+
+        With "resolved_imports", the imports keep how they were resolved,
+        which is only valid for the same compilation.
+
+        Raises "UncachableModuleTree" if the tree references other modules,
+        and is therefore not self contained.
+    """
+    own_functions = set(module.getFunctions())
+
+    node_ids = {
+        module : 0
+    }
+    nodes = [module]
+
+    def persistent_id(value):
+        if not isinstance(value, NodeBase):
+            return None
+
+        node_id = node_ids.get(value)
+
+        if node_id is not None:
+            return node_id
+
+        # Anything from other modules, we cannot have, except the helper
+        # functions of the internal module, that are created on demand.
+        if isinstance(value, ExpressionFunctionBodyBase) and \
+           value not in own_functions:
+            helper_name = getOnceFunctionName(value)
+
+            if helper_name is None:
+                raise UncachableModuleTree(value)
+
+            node_ids[value] = "helper:" + helper_name
+        elif isinstance(value, PythonModuleMixin):
+            raise UncachableModuleTree(value)
+        else:
+            node_ids[value] = len(nodes)
+            nodes.append(value)
+
+            # The first reference also carries the class, so the reader can
+            # create the node right away.
+            return len(nodes) - 1, value.__class__
+
+        return node_ids[value]
+
+    pickler = cpickle.Pickler(output_file, pickle_protocol)
+    pickler.persistent_id = persistent_id
+
+    pickler.dump(_getModuleState(module))
+
+    # Writing a record adds the nodes it references first to the list.
+    count = 1
+    while count < len(nodes):
+        node = nodes[count]
+
+        if resolved_imports and node.isExpressionImportModule():
+            pickler.dump(node.getResolvedState())
+        else:
+            pickler.dump(node.__getstate__())
+
+        count += 1
+
+    pickler.dump(None)
+
+
+def readModuleTree(module, input_file):
+    """ Replace the tree of a module with one from "writeModuleTree".
+
+        The module is only changed once the whole stream was read, so for
+        unusable streams, an exception is raised and the module is kept.
+    """
+    nodes = [module]
+
+    def persistent_load(persistent_id):
+        if type(persistent_id) is tuple:
+            node_id, node_class = persistent_id
+            assert node_id == len(nodes), persistent_id
+
+            nodes.append(node_class.__new__(node_class))
+
+            return nodes[-1]
+        elif type(persistent_id) is int:
+            return nodes[persistent_id]
+        elif persistent_id.startswith("helper:"):
+            return getOnceFunctionValue(persistent_id[7:])
+        else:
+            raise cpickle.UnpicklingError(persistent_id)
+
+    unpickler = cpickle.Unpickler(input_file)
+    unpickler.persistent_load = persistent_load
+
+    module_state = unpickler.load()
+
+    count = 1
+    while True:
+        node_state = unpickler.load()
+
+        if node_state is None:
+            break
+
+        nodes[count].__setstate__(node_state)
+        count += 1
+
+    if count != len(nodes):
+        raise cpickle.UnpicklingError("Truncated tree of %d nodes." % len(nodes))
+
+    # The package was not part of the stream, keep the one we have.
+    module_state["package"] = module.package
+
+    module.__setstate__(module_state)
+
+
+# Keys of modules that got built from source, and should be stored.
+_module_cache_keys = {}
+
+_cache_hits = 0
+
+
+def restoreModuleTree(module, source_code, is_main):
+    """ Restore the tree of a module from the cache, if possible.
+
+        Returns True if it was restored, otherwise it remembers the module
+        for storing its tree after optimization.
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global _cache_hits
+
+    cache_key = _getModuleCacheKey(module, source_code, is_main)
+    cache_filename = _getCacheFilename(cache_key)
+
+    if Utils.isFile(cache_filename):
+        try:
+            with open(cache_filename, "rb") as cache_file:
+                readModuleTree(module, cache_file)
+        except Exception as e: # Catching anything unpickling throws, pylint: disable=W0703
+            debug(
+                "Ignoring unusable cached tree for module '%s': %s" % (
+                    module.getFullName(),
+                    e
+                )
+            )
+        else:
+            _cache_hits += 1
+
+            # Recently used trees are the last to be removed from the cache.
+            try:
+                os.utime(cache_filename, None)
+            except OSError:
+                pass
+
+            debug(
+                "Restored tree of module '%s' from cache." % (
+                    module.getFullName()
+                )
+            )
+
+            return True
+
+    _module_cache_keys[module] = cache_key
+
+    return False
+
+
+def _storeModuleTree(module):
+    cache_filename = _getCacheFilename(_module_cache_keys[module])
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "wb") as cache_file:
+            writeModuleTree(module, cache_file)
+    except Exception as e: # Catching anything pickling throws, pylint: disable=W0703
+        debug(
+            "Not caching tree of module '%s': %s" % (
+                module.getFullName(),
+                e
+            )
+        )
+
+        Utils.deleteFile(temp_filename, must_exist = False)
+
+        return False
+
+    # Another compilation might have stored it already, in which case
+    # there is no need to replace it.
+    try:
+        os.rename(temp_filename, cache_filename)
+    except OSError:
+        Utils.deleteFile(temp_filename, must_exist = False)
+
+        return False
+
+    return True
+
+
+# Node records don't recurse along the tree, but the variable traces and
+# constants in them still can be nested deeply, so pickling is done in a
+# thread that has the stack for it, if the platform allows to get one.
+_pickle_stack_size = 512 * 1024 * 1024
+_pickle_recursion_limit = 100000
+
+def _startDeepStackThread(runner):
+    try:
+        old_stack_size = threading.stack_size(_pickle_stack_size)
+    except (ValueError, threading.ThreadError) as e:
+        debug("Cannot get deep stack for trees, using current one: %s" % e)
+
+        return None
+
+    try:
+        thread = threading.Thread(target = runner)
+        thread.start()
+    except (RuntimeError, threading.ThreadError) as e:
+        debug("Cannot start thread for trees, using current stack: %s" % e)
+
+        return None
+    finally:
+        threading.stack_size(old_stack_size)
+
+    return thread
+
+
+def runWithDeepStack(func, *args):
+    """ Run a function in a thread with a stack for deep trees.
+
+        Returns the result of the function, or raises its exception. If no
+        such thread can be had, the function runs on the current stack, with
+        the recursion limit unchanged.
+    """
+    result = []
+    exceptions = []
+
+    def runner():
+        try:
+            result.append(func(*args))
+        except BaseException as e: # Passed on below, pylint: disable=W0703
+            exceptions.append(e)
+
+    old_recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(_pickle_recursion_limit)
+
+    try:
+        thread = _startDeepStackThread(runner)
+
+        if thread is not None:
+            thread.join()
+    finally:
+        sys.setrecursionlimit(old_recursion_limit)
+
+    if thread is None:
+        return func(*args)
+
+    if exceptions:
+        raise exceptions[0]
+
+    return result[0]
+
+
+def dumpModuleTree(module, resolved_imports = False):
+    """ Serialize the tree of a module to a string, see "writeModuleTree".
+
+    """
+    output = BytesIO()
+
+    writeModuleTree(module, output, resolved_imports)
+
+    return output.getvalue()
+
+
+def loadModuleTree(module, data):
+    """ Replace the tree of a module with one from "dumpModuleTree".
+
+    """
+    readModuleTree(module, BytesIO(data))
+
+
+def storeModuleTrees(modules):
+    """ Store the trees of the given modules, if they were built from source.
+
+    """
+
+    modules = [
+        module
+        for module in modules
+        if module.isCompiledPythonModule()
+        if module in _module_cache_keys
+    ]
+
+    stored = []
+
+    def storeTrees():
+        for module in modules:
+            if _storeModuleTree(module):
+                stored.append(module)
+
+    # The cache is only an optimization, not storing trees is no error.
+    try:
+        runWithDeepStack(storeTrees)
+    except Exception as e: # Catching anything, pylint: disable=W0703
+        warning("Not storing module trees in cache: %s" % e)
+
+    trimCacheDir(
+        cache_dir  = getCacheSubDir("module-trees"),
+        size_limit = Options.getModuleCacheSizeLimit()
+    )
+
+    if Options.isShowProgress():
+        info(
+            "Module tree cache: %d restored, %d built and stored." % (
+                _cache_hits,
+                len(stored)
+            )
+        )
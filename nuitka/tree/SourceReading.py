@@ -27,6 +27,7 @@ from nuitka import Options, PythonVersions, SourceCodeReferences
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.tree import SyntaxErrors
+from nuitka.utils.Timing import withTimedPhase
 
 
 def _readSourceCodeFromFilename3(source_filename):
@@ -124,10 +125,11 @@ see http://python.org/dev/peps/pep-0263/ for details""" % (
     return source_code
 
 def readSourceCodeFromFilename(module_name, source_filename):
-    if python_version < 300:
-        source_code = _readSourceCodeFromFilename2(source_filename)
-    else:
-        source_code = _readSourceCodeFromFilename3(source_filename)
+    with withTimedPhase("source reading", module_name):
+        if python_version < 300:
+            source_code = _readSourceCodeFromFilename2(source_filename)
+        else:
+            source_code = _readSourceCodeFromFilename3(source_filename)
 
     # Allow plug-ins to mess with source code.
     source_code = Plugins.onModuleSourceCode(module_name, source_code)
@@ -0,0 +1,100 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Application directories of Nuitka.
+
+Where Nuitka keeps data that survives a single compilation, e.g. caches of
+previous results. The location can be overridden with "NUITKA_CACHE_DIR"
+environment variable.
+"""
+
+import os
+
+from .Utils import getFileList, getOS, joinpath, makePath
+
+
+def getCacheDir():
+    """ Return the cache directory of Nuitka, creating it if necessary.
+
+    """
+    cache_dir = os.environ.get("NUITKA_CACHE_DIR")
+
+    if not cache_dir:
+        if getOS() == "Windows":
+            base_dir = os.environ.get(
+                "LOCALAPPDATA",
+                os.environ.get("APPDATA", os.path.expanduser('~'))
+            )
+
+            cache_dir = joinpath(base_dir, "Nuitka", "Cache")
+        else:
+            base_dir = os.environ.get(
+                "XDG_CACHE_HOME",
+                joinpath(os.path.expanduser('~'), ".cache")
+            )
+
+            cache_dir = joinpath(base_dir, "Nuitka")
+
+    makePath(cache_dir)
+
+    return cache_dir
+
+
+def getCacheSubDir(name):
+    """ Return a named part of the cache directory, creating it if necessary.
+
+    """
+    result = joinpath(getCacheDir(), name)
+
+    makePath(result)
+
+    return result
+
+
+def trimCacheDir(cache_dir, size_limit):
+    """ Remove least recently used files of a cache beyond the size limit.
+
+        Users of the cache update the modification time of files they use,
+        so these are removed last.
+    """
+    cache_files = []
+    total_size = 0
+
+    for filename in getFileList(cache_dir):
+        try:
+            stat_result = os.stat(filename)
+        except OSError:
+            continue
+
+        cache_files.append(
+            (stat_result.st_mtime, stat_result.st_size, filename)
+        )
+        total_size += stat_result.st_size
+
+    cache_files.sort()
+
+    for _mtime, size, filename in cache_files:
+        if total_size <= size_limit:
+            break
+
+        try:
+            os.unlink(filename)
+        except OSError:
+            # Maybe another compilation removed it already.
+            pass
+
+        total_size -= size
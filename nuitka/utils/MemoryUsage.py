@@ -81,6 +81,28 @@ def getOwnProcessMemoryUsage():
         return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * factor
 
 
+def getChildProcessesMemoryUsage():
+    """ Peak memory usage of the largest finished child process in bytes.
+
+        Only child processes that were waited for count. On Windows, this is
+        not available, and None is returned.
+    """
+
+    if getOS() == "Windows":
+        return None
+    else:
+        # Posix only code, pylint: disable=F0401,I0021
+        import resource  # @UnresolvedImport
+
+        # Same scaling as for our own process.
+        if getOS() == "Darwin":
+            factor = 1
+        else:
+            factor = 1024
+
+        return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * factor
+
+
 def getHumanReadableProcessMemoryUsage(value = None):
     if value is None:
         value = getOwnProcessMemoryUsage()
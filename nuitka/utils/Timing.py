@@ -0,0 +1,175 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Timing of compilation phases, for reports about the cost of compilation.
+
+With "--report-timings", wall time, CPU time and memory usage of the phases of
+a compilation, and of the modules in them, are recorded and written as a JSON
+file at the end of the compilation. Counters of events, e.g. cache hits, are
+part of the report too.
+
+The peak memory usage is only known for the whole process lifetime so far, so
+it is reported as that, and as the increase of it during a phase, which is
+only not zero for phases that set a new peak. For phases that run child
+processes, e.g. the C compiler, the same is reported for these.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+
+from nuitka import Options
+from nuitka.containers.odict import OrderedDict
+
+from .MemoryUsage import MemoryWatch, getChildProcessesMemoryUsage
+
+
+def getCpuTime():
+    """ CPU time used by the process and its finished child processes.
+
+        The child processes are included, so the C compiler run by Scons
+        is accounted for too.
+    """
+    times = os.times()
+
+    return times[0] + times[1] + times[2] + times[3]
+
+
+class TimingWatch(MemoryWatch):
+    def __init__(self, children = False):
+        MemoryWatch.__init__(self)
+
+        self.start_wall_time = time.time()
+        self.start_cpu_time = getCpuTime()
+
+        self.wall_time = None
+        self.cpu_time = None
+
+        if children:
+            self.children_start = getChildProcessesMemoryUsage()
+        else:
+            self.children_start = None
+
+        self.children_stop = None
+
+    def finish(self):
+        MemoryWatch.finish(self)
+
+        self.wall_time = time.time() - self.start_wall_time
+        self.cpu_time = getCpuTime() - self.start_cpu_time
+
+        if self.children_start is not None:
+            self.children_stop = getChildProcessesMemoryUsage()
+
+
+# Timings by phase name, and by module name and phase name, in order of
+# first appearance.
+phase_timings = OrderedDict()
+module_timings = OrderedDict()
+
+# Counters by name, in order of first appearance.
+counters = OrderedDict()
+
+
+def _addTiming(timings, name, watch):
+    if name not in timings:
+        timings[name] = {
+            "count"             : 0,
+            "wall_time"         : 0.0,
+            "cpu_time"          : 0.0,
+            "peak_rss_so_far"   : 0,
+            "peak_rss_increase" : 0,
+        }
+
+    timing = timings[name]
+
+    timing["count"] += 1
+    timing["wall_time"] += watch.wall_time
+    timing["cpu_time"] += watch.cpu_time
+    timing["peak_rss_so_far"] = max(timing["peak_rss_so_far"], watch.stop)
+    timing["peak_rss_increase"] += watch.stop - watch.start
+
+    if watch.children_stop is not None:
+        timing["children_peak_rss_so_far"] = max(
+            timing.get("children_peak_rss_so_far", 0),
+            watch.children_stop
+        )
+        timing["children_peak_rss_increase"] = \
+          timing.get("children_peak_rss_increase", 0) + \
+          watch.children_stop - watch.children_start
+
+
+@contextlib.contextmanager
+def withTimedPhase(phase_name, module_name = None, children = False):
+    """ Record the cost of a compilation phase, optionally for one module.
+
+        Repeated phases of the same name are added up. Phases can be nested,
+        e.g. building trees of modules recursed to happens while optimizing.
+        Phases that run child processes, should indicate it with "children",
+        so their memory usage is recorded too.
+    """
+    if Options.getTimingsReportFilename() is None:
+        yield
+        return
+
+    watch = TimingWatch(children)
+
+    try:
+        yield
+    finally:
+        watch.finish()
+
+        if module_name is None:
+            _addTiming(phase_timings, phase_name, watch)
+        else:
+            if module_name not in module_timings:
+                module_timings[module_name] = OrderedDict()
+
+            _addTiming(module_timings[module_name], phase_name, watch)
+
+            # The module timings add up to the phase too.
+            _addTiming(phase_timings, phase_name, watch)
+
+
+def addCounter(counter_name, value = 1):
+    """ Add to a counter for the report, e.g. for hits of a cache.
+
+    """
+    counters[counter_name] = counters.get(counter_name, 0) + value
+
+
+def writeTimingsReport():
+    """ Write the JSON report of the timings if requested.
+
+    """
+    report_filename = Options.getTimingsReportFilename()
+
+    if report_filename is None:
+        return
+
+    report = OrderedDict()
+
+    report["nuitka_version"] = Options.getVersion()
+    report["python_version"] = sys.version.split()[0]
+    report["phases"] = phase_timings
+    report["modules"] = module_timings
+    report["counters"] = counters
+
+    with open(report_filename, 'w') as report_file:
+        json.dump(report, report_file, indent = 2)
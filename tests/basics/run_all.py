@@ -17,7 +17,7 @@
 #     limitations under the License.
 #
 
-import os, sys
+import os, sys, shutil, tempfile
 
 # Find common code relative in file system. Not using packages for test stuff.
 sys.path.insert(
@@ -36,6 +36,7 @@ from test_common import (
     compareWithCPython,
     hasDebugPython,
     withPythonPathChange,
+    withExtendedExtraOptions,
     createSearchMode
 )
 
@@ -43,6 +44,53 @@ python_version = setup(needs_io_encoding = True)
 
 search_mode = createSearchMode()
 
+def compareWithExtraOptions(filename, extra_flags, needs_2to3, *options):
+    """ Compare again with extra Nuitka options, not leaving output behind.
+
+    """
+    try:
+        with withExtendedExtraOptions(*options):
+            compareWithCPython(
+                dirname     = None,
+                filename    = filename,
+                extra_flags = extra_flags,
+                search_mode = search_mode,
+                needs_2to3  = needs_2to3
+            )
+    finally:
+        # Failed comparisons keep their output, with the same name as the
+        # normal compilation.
+        if os.path.exists(filename[:-3] + ".exe"):
+            os.unlink(filename[:-3] + ".exe")
+
+        shutil.rmtree(filename[:-3] + ".build", ignore_errors = True)
+
+def compareWithModuleCache(filename, extra_flags, needs_2to3):
+    """ Compare twice with a fresh module cache, the second time restoring.
+
+    """
+    cache_dir = tempfile.mkdtemp(prefix = "nuitka-cache-")
+    old_cache_dir = os.environ.get("NUITKA_CACHE_DIR", None)
+
+    os.environ["NUITKA_CACHE_DIR"] = cache_dir
+
+    try:
+        # First storing the trees, then compiling from the restored ones.
+        for _count in range(2):
+            compareWithExtraOptions(
+                filename,
+                extra_flags,
+                needs_2to3,
+                "--module-cache"
+            )
+    finally:
+        if old_cache_dir is None:
+            del os.environ["NUITKA_CACHE_DIR"]
+        else:
+            os.environ["NUITKA_CACHE_DIR"] = old_cache_dir
+
+        shutil.rmtree(cache_dir)
+
 if python_version >= "3.4":
     # These tests don't work with 3.4 yet, and the list is considered the major
     # TODO for 3.4 support.
@@ -137,6 +185,34 @@ for filename in sorted(os.listdir('.')):
                 search_mode = search_mode,
                 needs_2to3  = needs_2to3
             )
+
+            # Splitting the module into parts, with its code prepared in
+            # worker processes, the parts must declare all they use.
+            if filename == "BuiltinsTest.py":
+                compareWithExtraOptions(
+                    filename,
+                    extra_flags,
+                    needs_2to3,
+                    "--split-modules",
+                    "--split-modules-size=1",
+                    "--code-generation-jobs=4"
+                )
+
+            # Restored module trees must give the same results as the ones
+            # built from source.
+            if filename in ("Classes.py", "Functions.py", "GeneratorExpressions.py"):
+                compareWithModuleCache(filename, extra_flags, needs_2to3)
+
+            # Constants from a compressed blob in chunks of a small size, so
+            # that there are many of them, and large values span the size.
+            if filename in ("BigConstants.py", "Constants.py"):
+                compareWithExtraOptions(
+                    filename,
+                    extra_flags,
+                    needs_2to3,
+                    "--compress-constants",
+                    "--compress-constants-chunk-size=100"
+                )
     else:
         my_print("Skipping", filename)
 
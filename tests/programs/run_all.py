@@ -17,7 +17,7 @@
 #     limitations under the License.
 #
 
-import os, sys
+import os, sys, shutil
 
 # Find common code relative in file system. Not using packages for test stuff.
 sys.path.insert(
@@ -34,7 +34,8 @@ from test_common import (
     setup,
     createSearchMode,
     compareWithCPython,
-    withPythonPathChange
+    withPythonPathChange,
+    withExtendedExtraOptions
 )
 
 python_version = setup(needs_io_encoding = True)
@@ -149,6 +150,29 @@ Error, no file ends with 'Main.py' or 'Main' in %s, incomplete test case.""" % (
                 search_mode = search_mode,
                 needs_2to3  = False
             )
+
+            # Compiling several modules together in small units, where
+            # static names missing to be renamed give duplicate symbols.
+            if filename in ("deep", "import_variants"):
+                try:
+                    with withExtendedExtraOptions(
+                            "--unity-build",
+                            "--unity-build-size=40"):
+                        compareWithCPython(
+                            dirname     = filename,
+                            filename    = filename_main,
+                            extra_flags = extra_flags,
+                            search_mode = search_mode,
+                            needs_2to3  = False
+                        )
+                finally:
+                    # Failed comparisons keep their output.
+                    output_name = os.path.splitext(filename_main)[0]
+
+                    if os.path.exists(output_name + ".exe"):
+                        os.unlink(output_name + ".exe")
+
+                    shutil.rmtree(output_name + ".build", ignore_errors = True)
     else:
         my_print("Skipping", filename)
 
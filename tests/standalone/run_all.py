@@ -40,7 +40,8 @@ from test_common import (
     decideFilenameVersionSkip,
     getRuntimeTraceOfLoadedFiles,
     createSearchMode,
-    reportSkip
+    reportSkip,
+    withExtendedExtraOptions
 )
 
 python_version = setup(needs_io_encoding = True)
@@ -227,6 +228,20 @@ for filename in sorted(os.listdir('.')):
         needs_2to3  = False
     )
 
+    # Compile it twice more, keeping the dist folder, which must not lose
+    # files put there by Scons, e.g. the external constants.
+    if filename == "ShlibUsing.py":
+        with withExtendedExtraOptions("--incremental-dist",
+                                      "--external-constants"):
+            for _count in range(2):
+                compareWithCPython(
+                    dirname     = None,
+                    filename    = filename,
+                    extra_flags = extra_flags,
+                    search_mode = search_mode,
+                    needs_2to3  = False
+                )
+
     # Second use "strace" on the result.
     loaded_filenames = getRuntimeTraceOfLoadedFiles(
         path = os.path.join(